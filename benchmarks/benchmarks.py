@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 import pandas as pd
 
@@ -96,6 +98,9 @@ class PandasBackend:
         data = pd.DataFrame({
             'key': np.random.choice(16000, size=n),
             'low_card_key': np.random.choice(30, size=n),
+            'low_card_strings': np.random.choice(
+                ['dimension_{:d}'.format(i) for i in range(30)], size=n
+            ),
             'value': np.random.rand(n),
             'timestamps': pd.date_range(
                 start='now', periods=n, freq='s'
@@ -105,14 +110,30 @@ class PandasBackend:
             ).values.astype(str),
         })
 
-        t = ibis.pandas.connect({'df': data}).table('df')
+        dimension = pd.DataFrame({
+            'key': np.arange(0, 16000, 50),
+            'label': np.random.rand(320),
+        })
+
+        client = ibis.pandas.connect({'df': data, 'dimension': dimension})
+        t = client.table('df')
+        d = client.table('dimension')
 
         self.high_card_group_by = t.groupby(t.key).aggregate(
             avg_value=t.value.mean()
         )
 
+        self.high_card_group_by_masked_metrics = t.groupby(t.key).aggregate(
+            avg_value=t.value.mean(where=t.low_card_key < 10),
+            sum_value=t.value.sum(where=t.low_card_key < 20),
+            max_value=t.value.max(),
+        )
+
         self.cast_to_dates = t.timestamps.cast(dt.date)
         self.cast_to_dates_from_strings = t.timestamp_strings.cast(dt.date)
+        self.cast_to_timestamps_from_strings = t.timestamp_strings.cast(
+            dt.timestamp
+        )
 
         self.multikey_group_by_with_mutate = t.mutate(
             dates=t.timestamps.cast('date')
@@ -120,10 +141,63 @@ class PandasBackend:
             avg_value=lambda t: t.value.mean()
         )
 
+        self.low_card_string_group_by = t.groupby(
+            t.low_card_strings.upper().name('upper')
+        ).aggregate(avg_value=t.value.mean())
+
+        self.timestamp_add_months = t.timestamps + t.low_card_key.to_interval(
+            unit='M'
+        )
+        self.timestamp_add_days = t.timestamps + t.low_card_key.to_interval(
+            unit='D'
+        )
+
+        self.fact_dimension_join = t.join(d, t.key == d.key)[
+            t.value, d.label
+        ]
+
+        self.selective_filter_with_mutate = t[t.low_card_key == 1].mutate(
+            log_value=t.value.log(), upper=t.low_card_strings.upper()
+        )
+
+        self.wide_projection = t[
+            t.key,
+            t.value,
+            t.timestamps,
+            t.low_card_strings,
+            (t.value * 2).name('double_value'),
+            ibis.literal(1).name('one'),
+        ]
+
+        chained_mutate = t.mutate(double_value=t.value * 2)
+        chained_mutate = chained_mutate.mutate(
+            quadruple_value=chained_mutate.double_value * 2
+        )
+        self.chained_mutate = chained_mutate.mutate(
+            octuple_value=chained_mutate.quadruple_value * 2
+        )
+
+        self.union_partitions = functools.reduce(
+            lambda left, right: left.union(right),
+            [t[t.low_card_key == i] for i in range(30)]
+        )
+
+        self.distinct = t[['low_card_key', 'low_card_strings']].distinct()
+
+        case = ibis.case()
+        for i in range(30):
+            case = case.when(
+                t.low_card_key == i,
+                t.low_card_strings.upper() + '_{:d}'.format(i)
+            )
+        self.bucketing_case = t.mutate(bucket=case.end())
+
         self.simple_sort = t.sort_by([t.key])
 
         self.simple_sort_projection = t[['key', 'value']].sort_by(['key'])
 
+        self.top_k = t.sort_by([ibis.desc(t.value)]).limit(100)
+
         self.multikey_sort = t.sort_by(['low_card_key', 'key'])
 
         self.multikey_sort_projection = t[[
@@ -133,18 +207,64 @@ class PandasBackend:
     def time_high_cardinality_group_by(self):
         self.high_card_group_by.execute()
 
+    def time_fact_dimension_join(self):
+        self.fact_dimension_join.execute()
+
+    def time_selective_filter_with_mutate(self):
+        self.selective_filter_with_mutate.execute()
+
+    def time_high_cardinality_group_by_masked_metrics(self):
+        self.high_card_group_by_masked_metrics.execute()
+
     def time_cast_to_date(self):
         self.cast_to_dates.execute()
 
     def time_cast_to_date_from_string(self):
         self.cast_to_dates_from_strings.execute()
 
+    def time_cast_to_timestamp_from_string(self):
+        self.cast_to_timestamps_from_strings.execute()
+
     def time_multikey_group_by_with_mutate(self):
         self.multikey_group_by_with_mutate.execute()
 
+    def time_low_card_string_group_by(self):
+        self.low_card_string_group_by.execute()
+
+    def time_low_card_string_group_by_categorical(self):
+        with ibis.config.option_context('pandas.categorical_threshold', 0.01):
+            self.low_card_string_group_by.execute()
+
+    def time_timestamp_add_months(self):
+        self.timestamp_add_months.execute()
+
+    def time_timestamp_add_days(self):
+        self.timestamp_add_days.execute()
+
+    def peakmem_wide_projection(self):
+        self.wide_projection.execute()
+
+    def peakmem_selective_filter_with_mutate(self):
+        self.selective_filter_with_mutate.execute()
+
+    def time_chained_mutate(self):
+        self.chained_mutate.execute()
+
+    def time_union_partitions(self):
+        self.union_partitions.execute()
+
+    def time_distinct(self):
+        self.distinct.execute()
+
+    def time_bucketing_case(self):
+        self.bucketing_case.execute()
+
     def time_simple_sort(self):
         self.simple_sort.execute()
 
+    def time_top_k(self):
+        self.top_k.execute()
+
     def time_multikey_sort(self):
         self.multikey_sort.execute()
 
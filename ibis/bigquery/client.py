@@ -1,11 +1,13 @@
 import datetime
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import regex as re
 
 import six
 
+import numpy as np
 import pandas as pd
 
 from google.api_core.exceptions import NotFound
@@ -24,6 +26,7 @@ import ibis.expr.lineage as lin
 from ibis.compat import parse_version
 from ibis.client import Database, Query, SQLClient
 from ibis.bigquery import compiler as comp
+from ibis.util import log, numpy_dtype, values_to_array
 
 NATIVE_PARTITION_COL = '_PARTITIONTIME'
 
@@ -100,6 +103,69 @@ class BigQueryCursor(object):
         result = self.query.result()
         return [row.values() for row in result]
 
+    def to_dataframe(self, client, page_size=None, n_threads=None):
+        """Download the result of the query.
+
+        The rows of the destination table of the query are read in ranges of
+        `page_size` rows by a pool of `n_threads` threads, and the values of
+        every range are converted to arrays with the pandas dtype of the ibis
+        type of their column. The arrays are concatenated once, at the end.
+
+        Parameters
+        ----------
+        client : google.cloud.bigquery.Client
+        page_size : Optional[int]
+            Defaults to ``ibis.options.bigquery.page_size``
+        n_threads : Optional[int]
+            Defaults to ``ibis.options.bigquery.download_threads``
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        if page_size is None:
+            page_size = ibis.options.bigquery.page_size
+        if n_threads is None:
+            n_threads = ibis.options.bigquery.download_threads
+
+        destination = self.query.destination
+        if destination is None:
+            # no result table to read concurrently, e.g. a script
+            result = self.query.result()
+            fields = list(result.schema)
+            ranges = [result]
+        else:
+            table = client.get_table(destination)
+            fields = list(table.schema)
+            ranges = [
+                (table, start, page_size)
+                for start in range(0, table.num_rows or 0, page_size)
+            ]
+
+        dtypes = [numpy_dtype(dt.dtype(field)) for field in fields]
+
+        def read(rows):
+            if isinstance(rows, tuple):
+                table, start, size = rows
+                rows = client.list_rows(
+                    table, start_index=start, max_results=size
+                )
+            return _rows_to_arrays(rows, dtypes)
+
+        if len(ranges) > 1 and n_threads > 1:
+            with ThreadPoolExecutor(min(n_threads, len(ranges))) as executor:
+                pages = list(executor.map(read, ranges))
+        else:
+            pages = list(map(read, ranges))
+
+        names = [field.name for field in fields]
+        columns = list(zip(*pages)) or [()] * len(names)
+        arrays = [
+            np.concatenate(pieces) if pieces else np.array([], dtype=dtype)
+            for pieces, dtype in zip(columns, dtypes)
+        ]
+        return pd.DataFrame(OrderedDict(zip(names, arrays)), columns=names)
+
     @property
     def columns(self):
         result = self.query.result()
@@ -113,6 +179,27 @@ class BigQueryCursor(object):
         pass
 
 
+def _rows_to_arrays(rows, dtypes):
+    """Convert an iterable of :class:`google.cloud.bigquery.table.Row` to
+    one array per column.
+
+    Integer columns holding nulls become float64 columns and boolean columns
+    holding nulls become object columns.
+    """
+    columns = list(zip(*[row.values() for row in rows])) or [()] * len(dtypes)
+    return [
+        _column_to_array(values, dtype)
+        for values, dtype in zip(columns, dtypes)
+    ]
+
+
+def _column_to_array(values, dtype):
+    if dtype.kind == 'M':
+        # TIMESTAMP values are timezone aware datetimes, in UTC
+        return pd.to_datetime(list(values), utc=True).values
+    return values_to_array(values, dtype)
+
+
 def _find_scalar_parameter(expr):
     """:func:`~ibis.expr.lineage.traverse` function to find all
     :class:`~ibis.expr.types.ScalarParameter` instances and yield the operation
@@ -135,11 +222,22 @@ def _find_scalar_parameter(expr):
     return lin.proceed, result
 
 
+class MaximumBytesBilledExceeded(com.IbisError):
+    pass
+
+
 class BigQueryQuery(Query):
 
-    def __init__(self, client, ddl, query_parameters=None):
+    def __init__(self, client, ddl, query_parameters=None,
+                 estimated_bytes=None):
         super(BigQueryQuery, self).__init__(client, ddl)
 
+        # The number of bytes the query processes according to a dry run, and
+        # the bytes it processed and was billed for once executed
+        self.estimated_bytes = estimated_bytes
+        self.bytes_processed = None
+        self.bytes_billed = None
+
         # self.expr comes from the parent class
         query_parameter_names = dict(
             lin.traverse(_find_scalar_parameter, self.expr))
@@ -150,9 +248,21 @@ class BigQueryQuery(Query):
         ]
 
     def _fetch(self, cursor):
-        df = cursor.query.to_dataframe()
+        df = cursor.to_dataframe(self.client.client)
         return self.schema().apply_to(df)
 
+    def estimate(self):
+        """Estimate the number of bytes the query processes with a dry run.
+
+        Returns
+        -------
+        int
+        """
+        self.estimated_bytes = self.client._dry_run(
+            self.compiled_sql, query_parameters=self.query_parameters
+        )
+        return self.estimated_bytes
+
     def execute(self):
         # synchronous by default
         with self.client._execute(
@@ -160,6 +270,8 @@ class BigQueryQuery(Query):
             results=True,
             query_parameters=self.query_parameters
         ) as cur:
+            self.bytes_processed = cur.query.total_bytes_processed
+            self.bytes_billed = cur.query.total_bytes_billed
             result = self._fetch(cur)
 
         return self._wrap_result(result)
@@ -243,6 +355,59 @@ class BigQueryTable(ops.DatabaseTable):
     pass
 
 
+def _find_bigquery_table(expr):
+    op = expr.op()
+    if isinstance(op, BigQueryTable):
+        return lin.halt, op
+    return lin.proceed, None
+
+
+def _substitute(expr, substitutions, memo=None):
+    """Replace the nodes of `expr` that are keys of `substitutions` with their
+    values. Unlike :func:`ibis.expr.analysis.sub_for`, this descends into
+    projections and into the lists of expressions nodes take.
+
+    Parameters
+    ----------
+    expr : ibis.expr.types.Expr
+    substitutions : Mapping[ibis.expr.operations.Node, ibis.expr.types.Expr]
+
+    Returns
+    -------
+    ibis.expr.types.Expr
+    """
+    if memo is None:
+        memo = {}
+
+    def substitute(arg):
+        if isinstance(arg, (list, tuple)):
+            return type(arg)(map(substitute, arg))
+        if not isinstance(arg, ir.Expr):
+            return arg
+        try:
+            return memo[id(arg)][1]
+        except KeyError:
+            pass
+
+        node = arg.op()
+        if node in substitutions:
+            result = substitutions[node]
+        else:
+            new_args = list(map(substitute, node.args))
+            if all(new is old for new, old in zip(new_args, node.args)):
+                result = arg
+            else:
+                result = type(node)(*new_args).to_expr()
+                name = getattr(arg, '_name', None)
+                if name is not None:
+                    result = result.name(name)
+        # arg is kept alive so that its id is not reused
+        memo[id(arg)] = arg, result
+        return result
+
+    return substitute(expr)
+
+
 def rename_partitioned_column(table_expr, bq_table):
     partition_info = bq_table._properties.get('timePartitioning', None)
 
@@ -320,6 +485,10 @@ class BigQueryClient(SQLClient):
     table_class = BigQueryTable
     dialect = comp.BigQueryDialect
 
+    # The BigQueryQuery most recently executed, to monitor the bytes it
+    # processed
+    last_query = None
+
     def __init__(self, project_id, dataset_id):
         """
         Parameters
@@ -361,13 +530,143 @@ class BigQueryClient(SQLClient):
         result = comp.build_ast(expr, context)
         return result
 
-    def _execute_query(self, dml, async=False):
+    def execute(self, expr, params=None, limit='default', **kwargs):
+        """Compile and execute an Ibis expression.
+
+        If ``ibis.options.bigquery.max_bytes_billed`` is set, the number of
+        bytes the query processes is first estimated with a dry run. Queries
+        over that budget read only the most recent
+        ``ibis.options.bigquery.partition_filter_days`` partitions of their
+        partitioned tables, if set, or are refused.
+
+        Parameters
+        ----------
+        expr : ibis.expr.types.Expr
+        params : Mapping[ibis.expr.types.ScalarParameter, object]
+        limit : Union[int, str, None]
+
+        Returns
+        -------
+        output : input type dependent
+            Table expressions: pandas.DataFrame
+            Array expressions: pandas.Series
+            Scalar expressions: Python scalar value
+
+        Raises
+        ------
+        MaximumBytesBilledExceeded
+        """
+        query_ast = self._build_ast_ensure_limit(expr, limit, params=params)
+        max_bytes_billed = ibis.options.bigquery.max_bytes_billed
+        if max_bytes_billed is None:
+            return self._execute_query(query_ast, **kwargs)
+
+        estimated_bytes = self._estimate_query(query_ast)
+        if estimated_bytes > max_bytes_billed:
+            filtered = self._filter_partitions(expr)
+            if filtered is not None:
+                query_ast = self._build_ast_ensure_limit(
+                    filtered, limit, params=params
+                )
+                estimated_bytes = self._estimate_query(query_ast)
+
+        if estimated_bytes > max_bytes_billed:
+            raise MaximumBytesBilledExceeded(
+                'Query would process {:d} bytes, more than the '
+                'bigquery.max_bytes_billed budget of {:d} bytes'.format(
+                    estimated_bytes, max_bytes_billed
+                )
+            )
+        return self._execute_query(
+            query_ast, estimated_bytes=estimated_bytes, **kwargs
+        )
+
+    def execute_async(self, expr, params=None, limit='default', **kwargs):
+        # the dry runs enforcing the bytes budget wait on BigQuery too, so
+        # the whole of execute runs in the background
+        return self._submit(
+            self.execute, expr, params=params, limit=limit, **kwargs
+        )
+
+    def estimate(self, expr, params=None, limit='default'):
+        """Estimate the number of bytes processed by executing `expr`, with a
+        dry run of its query.
+
+        Parameters
+        ----------
+        expr : ibis.expr.types.Expr
+        params : Mapping[ibis.expr.types.ScalarParameter, object]
+        limit : Union[int, str, None]
+
+        Returns
+        -------
+        int
+        """
+        query_ast = self._build_ast_ensure_limit(expr, limit, params=params)
+        return self._estimate_query(query_ast)
+
+    def _estimate_query(self, dml):
+        query = self.sync_query(
+            self, dml, query_parameters=dml.context.params
+        )
+        return query.estimate()
+
+    def _filter_partitions(self, expr):
+        """Restrict the partitioned tables `expr` reads to their most recent
+        ``ibis.options.bigquery.partition_filter_days`` partitions.
+
+        Returns
+        -------
+        Optional[ibis.expr.types.Expr]
+            None if the option is not set or `expr` reads no partitioned table
+        """
+        days = ibis.options.bigquery.partition_filter_days
+        if days is None:
+            return None
+
+        today = pd.Timestamp.utcnow().tz_localize(None).normalize()
+        cutoff = today - pd.Timedelta(days=days - 1)
+
+        substitutions = {}
+        for op in lin.traverse(_find_bigquery_table, expr):
+            project, dataset, name = op.name.split('.')
+            table_ref = self.client.dataset(dataset, project=project).table(
+                name
+            )
+            bq_table = self.client.get_table(table_ref)
+            partition_info = bq_table._properties.get('timePartitioning')
+            if partition_info is None:
+                continue
+
+            # The partition column is the column exposed under the name
+            # ibis.options.bigquery.partition_col by BigQueryClient.table
+            table = op.to_expr()
+            column = table[
+                partition_info.get('field', NATIVE_PARTITION_COL)
+            ]
+            if isinstance(column.type(), dt.Date):
+                predicate = column >= cutoff.date()
+            else:
+                predicate = column >= cutoff.to_pydatetime()
+            substitutions[op] = table[predicate]
+
+        if not substitutions:
+            return None
+        return _substitute(expr, substitutions)
+
+    def _execute_query(self, dml, async=False, estimated_bytes=None):
         if async:
             raise NotImplementedError(
                 'Asynchronous queries not implemented in the BigQuery backend'
             )
         klass = self.async_query if async else self.sync_query
-        inst = klass(self, dml, query_parameters=dml.context.params)
+        inst = klass(
+            self,
+            dml,
+            query_parameters=dml.context.params,
+            estimated_bytes=estimated_bytes,
+        )
+        self.last_query = inst
         df = inst.execute()
         return df
 
@@ -379,16 +678,35 @@ class BigQueryClient(SQLClient):
         dataset, table = qualified_name.rsplit('.', 1)
         return self.get_schema(table, database=dataset)
 
-    def _execute(self, stmt, results=True, query_parameters=None):
+    def _job_config(self, query_parameters=None):
         job_config = bq.job.QueryJobConfig()
         job_config.query_parameters = query_parameters or []
         job_config.use_legacy_sql = False  # False by default in >=0.28
+        return job_config
+
+    def _execute(self, stmt, results=True, query_parameters=None):
+        job_config = self._job_config(query_parameters)
+        max_bytes_billed = ibis.options.bigquery.max_bytes_billed
+        if max_bytes_billed is not None:
+            job_config.maximum_bytes_billed = max_bytes_billed
         query = self.client.query(
             stmt, job_config=job_config, project=self.billing_project
         )
         query.result()  # blocks until finished
         return BigQueryCursor(query)
 
+    def _dry_run(self, stmt, query_parameters=None):
+        job_config = self._job_config(query_parameters)
+        job_config.dry_run = True
+        job_config.use_query_cache = False
+        query = self.client.query(
+            stmt, job_config=job_config, project=self.billing_project
+        )
+        log('Dry run of query estimated to process {:d} bytes'.format(
+            query.total_bytes_processed
+        ))
+        return query.total_bytes_processed
+
     def database(self, name=None):
         return self.database_class(name or self.dataset, self)
 
@@ -0,0 +1,153 @@
+import datetime
+import threading
+
+import pytest
+
+import numpy as np
+import pandas as pd
+import pandas.util.testing as tm
+
+import ibis
+
+bq = pytest.importorskip('google.cloud.bigquery')
+
+from ibis.bigquery.client import (  # noqa: E402
+    BigQueryClient, BigQueryCursor, BigQueryTable
+)
+
+
+UTC = bq._helpers.UTC
+
+fields = [
+    bq.SchemaField('id', 'INTEGER'),
+    bq.SchemaField('maybe', 'INTEGER'),
+    bq.SchemaField('name', 'STRING'),
+    bq.SchemaField('day', 'DATE'),
+    bq.SchemaField('at', 'TIMESTAMP'),
+]
+rows = [
+    (
+        i,
+        i if i % 2 else None,
+        'row {:d}'.format(i),
+        datetime.date(2018, 1, i + 1),
+        datetime.datetime(2018, 1, 1, i, tzinfo=UTC),
+    )
+    for i in range(5)
+]
+
+
+class FakeTable(object):
+
+    def __init__(self, schema, rows):
+        self.schema = schema
+        self.num_rows = len(rows)
+        self.rows = rows
+
+
+class FakeQueryJob(object):
+
+    total_bytes_processed = total_bytes_billed = 0
+
+    def __init__(self, destination):
+        self.destination = destination
+
+    def result(self):
+        return self
+
+
+class FakeBigQueryClient(object):
+
+    """Serves the rows of a single destination table"""
+
+    def __init__(self, table):
+        self.table = table
+        self.reads = []
+        self.threads = set()
+        self.queries = []
+
+    def query(self, stmt, job_config=None, project=None):
+        self.queries.append(stmt)
+        return FakeQueryJob('destination')
+
+    def get_table(self, reference):
+        assert reference == 'destination'
+        return self.table
+
+    def list_rows(self, table, start_index=0, max_results=None):
+        self.reads.append((start_index, max_results))
+        self.threads.add(threading.current_thread().ident)
+        field_to_index = {
+            field.name: i for i, field in enumerate(table.schema)
+        }
+        stop = start_index + max_results
+        return [
+            bq.Row(values, field_to_index)
+            for values in table.rows[start_index:stop]
+        ]
+
+
+@pytest.fixture
+def client():
+    return FakeBigQueryClient(FakeTable(fields, rows))
+
+
+@pytest.fixture
+def expected():
+    return pd.DataFrame({
+        'id': np.arange(5),
+        'maybe': [np.nan, 1.0, np.nan, 3.0, np.nan],
+        'name': ['row {:d}'.format(i) for i in range(5)],
+        'day': pd.date_range('2018-01-01', periods=5, freq='D'),
+        'at': pd.date_range('2018-01-01', periods=5, freq='H'),
+    }, columns=[field.name for field in fields])
+
+
+def test_download_pages_concurrently(client, expected):
+    cursor = BigQueryCursor(client.query('SELECT 1'))
+    result = cursor.to_dataframe(client, page_size=2, n_threads=3)
+
+    tm.assert_frame_equal(result, expected)
+    assert sorted(client.reads) == [(0, 2), (2, 2), (4, 2)]
+    assert threading.current_thread().ident not in client.threads
+
+
+def test_download_single_page(client, expected):
+    cursor = BigQueryCursor(client.query('SELECT 1'))
+    result = cursor.to_dataframe(client, page_size=10)
+
+    tm.assert_frame_equal(result, expected)
+    assert client.reads == [(0, 10)]
+
+
+def test_download_empty_result(expected):
+    client = FakeBigQueryClient(FakeTable(fields, []))
+    cursor = BigQueryCursor(client.query('SELECT 1'))
+    result = cursor.to_dataframe(client)
+
+    assert list(result.columns) == list(expected.columns)
+    assert result.id.dtype == np.int64
+    assert result['at'].dtype == np.dtype('datetime64[ns]')
+    assert not len(result)
+
+
+def test_execute_downloads_pages(client, expected):
+    con = BigQueryClient.__new__(BigQueryClient)
+    con.client = client
+    con.billing_project = con.data_project = 'project'
+    con.dataset = 'dataset'
+
+    schema = ibis.schema([
+        ('id', 'int64'),
+        ('maybe', 'int64'),
+        ('name', 'string'),
+        ('day', 'date'),
+        ('at', 'timestamp'),
+    ])
+    t = BigQueryTable('project.dataset.t', schema, con).to_expr()
+
+    with ibis.config.option_context('bigquery.page_size', 2):
+        result = t.execute()
+
+    tm.assert_frame_equal(result, expected)
+    assert len(client.reads) == 3
@@ -0,0 +1,138 @@
+import pytest
+
+import pandas as pd
+import pandas.util.testing as tm
+
+import ibis
+
+bq = pytest.importorskip('google.cloud.bigquery')
+
+from ibis.bigquery.client import (  # noqa: E402
+    BigQueryClient, BigQueryTable, MaximumBytesBilledExceeded
+)
+
+
+class FakeTable(object):
+
+    def __init__(self, partitioned):
+        self._properties = {}
+        if partitioned:
+            self._properties['timePartitioning'] = {'type': 'DAY'}
+        self.schema = [bq.SchemaField('value', 'INTEGER')]
+        self.num_rows = 1
+
+
+class FakeQueryJob(object):
+
+    def __init__(self, total_bytes_processed, destination=None):
+        self.total_bytes_processed = total_bytes_processed
+        self.total_bytes_billed = total_bytes_processed
+        self.destination = destination
+
+    def result(self):
+        return self
+
+
+class FakeBigQueryClient(object):
+
+    """Estimates that queries filtering the _PARTITIONTIME column of a table
+    process 10 bytes, and that other queries process 1000 bytes"""
+
+    def __init__(self, partitioned=True):
+        self.table = FakeTable(partitioned)
+        self.dry_runs = []
+        self.jobs = []
+
+    def query(self, stmt, job_config=None, project=None):
+        total_bytes_processed = 10 if '`_PARTITIONTIME` >=' in stmt else 1000
+        if job_config.dry_run:
+            self.dry_runs.append(stmt)
+            return FakeQueryJob(total_bytes_processed)
+        self.jobs.append((stmt, job_config))
+        return FakeQueryJob(total_bytes_processed, destination='destination')
+
+    def dataset(self, dataset, project=None):
+        return bq.DatasetReference(project, dataset)
+
+    def get_table(self, reference):
+        return self.table
+
+    def list_rows(self, table, start_index=0, max_results=None):
+        return [bq.Row((1,), {'value': 0})]
+
+
+def make_client(partitioned=True):
+    con = BigQueryClient.__new__(BigQueryClient)
+    con.client = FakeBigQueryClient(partitioned=partitioned)
+    con.billing_project = con.data_project = 'project'
+    con.dataset = 'dataset'
+    return con
+
+
+def make_table(con):
+    schema = ibis.schema([('value', 'int64'), ('_PARTITIONTIME', 'timestamp')])
+    return BigQueryTable('project.dataset.t', schema, con).to_expr()
+
+
+def test_estimate():
+    con = make_client()
+    t = make_table(con)
+    assert con.estimate(t.value.sum()) == 1000
+    assert len(con.client.dry_runs) == 1
+    assert not con.client.jobs
+
+
+def test_no_budget_no_dry_run():
+    con = make_client()
+    make_table(con)[['value']].execute()
+    assert not con.client.dry_runs
+
+    [(_, job_config)] = con.client.jobs
+    assert job_config.maximum_bytes_billed is None
+    assert con.last_query.estimated_bytes is None
+    assert con.last_query.bytes_processed == 1000
+
+
+def test_within_budget():
+    con = make_client()
+    t = make_table(con)[['value']]
+    with ibis.config.option_context('bigquery.max_bytes_billed', 1000):
+        result = t.execute()
+
+    tm.assert_frame_equal(result, pd.DataFrame({'value': [1]}))
+    [(_, job_config)] = con.client.jobs
+    assert job_config.maximum_bytes_billed == 1000
+    assert con.last_query.estimated_bytes == 1000
+
+
+def test_over_budget_refused():
+    con = make_client()
+    t = make_table(con)[['value']]
+    with ibis.config.option_context('bigquery.max_bytes_billed', 100):
+        with pytest.raises(MaximumBytesBilledExceeded):
+            t.execute()
+    assert not con.client.jobs
+
+
+def test_over_budget_partition_filter():
+    con = make_client()
+    t = make_table(con)[['value']]
+    with ibis.config.option_context('bigquery.max_bytes_billed', 100), \
+            ibis.config.option_context('bigquery.partition_filter_days', 7):
+        t.execute()
+
+    [_, filtered] = con.client.dry_runs
+    [(stmt, _)] = con.client.jobs
+    assert stmt == filtered
+    assert 'WHERE `_PARTITIONTIME` >=' in stmt
+    assert con.last_query.estimated_bytes == 10
+
+
+def test_over_budget_unpartitioned_refused():
+    con = make_client(partitioned=False)
+    t = make_table(con)[['value']]
+    with ibis.config.option_context('bigquery.max_bytes_billed', 100), \
+            ibis.config.option_context('bigquery.partition_filter_days', 7):
+        with pytest.raises(MaximumBytesBilledExceeded):
+            t.execute()
+    assert len(con.client.dry_runs) == 1
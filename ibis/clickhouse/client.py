@@ -1,4 +1,8 @@
 import re
+import itertools
+
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 
@@ -9,10 +13,10 @@ import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 
 from ibis.config import options
-from ibis.compat import zip as czip, parse_version
+from ibis.compat import zip as czip, parse_version, signature
 from ibis.client import Query, Database, DatabaseEntity, SQLClient
 from ibis.clickhouse.compiler import ClickhouseDialect, build_ast
-from ibis.util import log
+from ibis.util import log, numpy_dtype, values_to_array
 from ibis.sql.compiler import DDL
 
 from clickhouse_driver.client import Client as _DriverClient
@@ -21,6 +25,11 @@ from clickhouse_driver.client import Client as _DriverClient
 fully_qualified_re = re.compile(r"(.*)\.(?:`(.*)`|(.*))")
 
 
+# The number of rows of the DataFrames yielded by execute_iter, the default
+# maximum number of rows of the blocks ClickHouse sends
+DEFAULT_CHUNKSIZE = 65536
+
+
 _clickhouse_dtypes = {
     'Null': dt.Null,
     'UInt8': dt.UInt8,
@@ -102,27 +111,104 @@ class ClickhouseQuery(Query):
             chtypes = map(ClickhouseDataType.from_ibis, schema.types)
             structure = list(zip(schema.names, map(str, chtypes)))
 
+            columns = [values.tolist() for values in _to_columns(df, schema)]
             tables.append(dict(name=name,
-                               data=df.to_dict('records'),
+                               data=list(czip(*columns)),
                                structure=structure))
         return tables
 
     def execute(self):
-        cursor = self.client._execute(
+        data, colnames, coltypes = self.client._execute(
             self.compiled_sql,
             external_tables=self._external_tables()
         )
-        result = self._fetch(cursor)
+        result = self._fetch([(colnames, coltypes, data)])
         return self._wrap_result(result)
 
-    def _fetch(self, cursor):
-        data, colnames, _ = cursor
-        if not len(data):
-            # handle empty resultset
-            return pd.DataFrame([], columns=colnames)
+    def iter_frames(self, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Execute the query and yield the result one DataFrame per chunk of
+        at most `chunksize` rows, as the rows are received from the server
+
+        Parameters
+        ----------
+        chunksize : int
+
+        Yields
+        ------
+        frame : pandas.DataFrame
+        """
+        chunks = self.client._execute_chunks(
+            self.compiled_sql,
+            external_tables=self._external_tables(),
+            chunksize=chunksize
+        )
+        columns = None
+        for colnames, coltypes, data in chunks:
+            if columns is None:
+                columns = _ResultColumns(colnames, coltypes, self._schema())
+            if data:
+                yield columns.to_frame(columns.to_arrays(data))
+
+    def _fetch(self, chunks):
+        columns = pieces = None
+        for colnames, coltypes, data in chunks:
+            if columns is None:
+                columns = _ResultColumns(colnames, coltypes, self._schema())
+                pieces = [[] for _ in colnames]
+            if data:
+                for piece, array in zip(pieces, columns.to_arrays(data)):
+                    piece.append(array)
+
+        if columns is None:
+            return pd.DataFrame()
+        return columns.to_frame([
+            np.concatenate(piece) if piece else np.array([], dtype=dtype)
+            for piece, dtype in zip(pieces, columns.dtypes)
+        ])
+
+    def _schema(self):
+        try:
+            return self.schema()
+        except ValueError:
+            # raw SQL statements, the types of the result are used instead
+            return None
+
+
+class _ResultColumns(object):
+
+    """
+    Converts the columns of the chunks of a result, as decoded by
+    clickhouse-driver, to NumPy arrays with the pandas dtype of their ibis
+    type
+    """
+
+    def __init__(self, colnames, coltypes, schema=None):
+        self.colnames = colnames
+        self.coltypes = coltypes
+        self.types = [
+            schema[name] if schema is not None and name in schema
+            else coltype.to_ibis()
+            for name, coltype in zip(colnames, coltypes)
+        ]
+        self.dtypes = list(map(numpy_dtype, self.types))
+
+    def to_arrays(self, data):
+        return [
+            values_to_array(values, dtype, nullable=coltype.nullable)
+            for values, coltype, dtype in zip(data, self.coltypes, self.dtypes)
+        ]
+
+    def to_frame(self, arrays):
+        df = pd.DataFrame(
+            OrderedDict(zip(self.colnames, arrays)), columns=self.colnames
+        )
 
-        df = pd.DataFrame.from_items(zip(colnames, data))
-        return self.schema().apply_to(df)
+        # only columns whose pandas dtype is not a NumPy dtype, such as
+        # timestamps with a time zone, or nullable integer columns holding
+        # nulls are actually converted here
+        schema = sch.schema(list(zip(self.colnames, self.types)))
+        return schema.apply_to(df)
 
 
 class ClickhouseTable(ir.TableExpr, DatabaseEntity):
@@ -174,7 +260,20 @@ class ClickhouseTable(ir.TableExpr, DatabaseEntity):
     def _execute(self, stmt):
         return self._client._execute(stmt)
 
-    def insert(self, obj, **kwargs):
+    def insert(self, obj, block_size=None, **kwargs):
+        """
+        Insert the rows of a DataFrame into the table
+
+        Parameters
+        ----------
+        obj : pandas.DataFrame
+          Its columns must be a subset of the columns of the table
+        block_size : int, default None
+          The number of rows sent to Clickhouse at a time, defaults to
+          options.clickhouse.insert_block_size
+        kwargs : dict
+          Passed to clickhouse_driver.Client.process_insert_query
+        """
         from .identifiers import quote_identifier
         schema = self.schema()
 
@@ -185,15 +284,35 @@ class ClickhouseTable(ir.TableExpr, DatabaseEntity):
         query = 'INSERT INTO {table} ({columns}) VALUES'.format(
             table=self._qualified_name, columns=columns)
 
-        # convert data columns with datetime64 pandas dtype to native date
-        # because clickhouse-driver 0.0.10 does arithmetic operations on it
-        obj = obj.copy()
-        for col in obj.select_dtypes(include=[np.datetime64]):
-            if isinstance(schema[col], dt.Date):
-                obj[col] = obj[col].dt.date
+        if block_size is None:
+            block_size = options.clickhouse.insert_block_size
+
+        arrays = _to_columns(obj, schema)
+        blocks = (
+            [values[start:start + block_size].tolist() for values in arrays]
+            for start in range(0, len(obj), block_size)
+        )
+        return self._client._insert_blocks(query, blocks, **kwargs)
+
 
-        data = obj.to_dict('records')
-        return self._client.con.process_insert_query(query, data, **kwargs)
+def _to_columns(df, schema):
+    """
+    Return the columns of `df` as NumPy arrays whose tolist() method returns
+    the Python values clickhouse-driver expects for the types of `schema`,
+    without copying the columns that need no conversion
+    """
+    return [_to_column(df[name], schema[name]) for name in df.columns]
+
+
+def _to_column(column, dtype):
+    values = np.asarray(column.values)
+    if values.dtype.kind == 'M':
+        # datetime64[D] and datetime64[us] arrays hold datetime.date and
+        # datetime.datetime objects respectively
+        if isinstance(dtype, dt.Date):
+            return values.astype('datetime64[D]')
+        return values.astype('datetime64[us]')
+    return values
 
 
 class ClickhouseDatabaseTable(ops.DatabaseTable):
@@ -232,7 +351,7 @@ class ClickhouseClient(SQLClient):
             query = query.compile()
         self.log(query)
 
-        response = self.con.process_ordinary_query(
+        response = self.con.execute(
             query, columnar=True, with_column_types=True,
             external_tables=external_tables
         )
@@ -245,6 +364,78 @@ class ClickhouseClient(SQLClient):
 
         return data, colnames, coltypes
 
+    def _execute_chunks(self, query, external_tables=(),
+                        chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Execute `query` and yield the column names, the column types and the
+        columns of every chunk of at most `chunksize` rows of its result as
+        the rows are received, starting with a chunk without rows
+        """
+        if isinstance(query, DDL):
+            query = query.compile()
+        self.log(query)
+
+        rows = self.con.execute_iter(
+            query, with_column_types=True, external_tables=external_tables
+        )
+        finished = False
+        try:
+            # the column names and types come first
+            colnames, typenames = czip(*next(rows))
+            coltypes = list(map(ClickhouseDataType.parse, typenames))
+            yield colnames, coltypes, []
+
+            while True:
+                chunk = list(itertools.islice(rows, chunksize))
+                if not chunk:
+                    break
+                yield colnames, coltypes, list(czip(*chunk))
+            finished = True
+        finally:
+            if not finished:
+                # the rest of the result is never read, so the connection
+                # can't be reused for another query
+                self.con.disconnect()
+
+    def _insert_blocks(self, query, blocks, **kwargs):
+        """
+        Execute the INSERT statement `query` once per block, a list of
+        columns of values
+        """
+        self.log(query)
+        insert = self.con.process_insert_query
+        if 'columnar' in signature(insert).parameters:
+            for columns in blocks:
+                insert(query, columns, columnar=True, **kwargs)
+        else:
+            for columns in blocks:
+                insert(query, list(czip(*columns)), **kwargs)
+
+    def execute_iter(self, expr, params=None, limit='default',
+                     chunksize=DEFAULT_CHUNKSIZE, **kwargs):
+        """
+        Compile and execute a table expression, yielding its result as a
+        sequence of DataFrames of at most `chunksize` rows, as the rows are
+        received from the server, without holding the full result in memory
+
+        Parameters
+        ----------
+        expr : TableExpr
+        params : dict, default None
+        limit : int, default 'default'
+          Retrieve at most this number of rows, overrides any limit already
+          set on the expression
+        chunksize : int, default 65536
+          The number of rows of every DataFrame but the last
+
+        Yields
+        ------
+        frame : pandas.DataFrame
+        """
+        query_ast = self._build_ast_ensure_limit(expr, limit, params=params)
+        query = self.sync_query(self, query_ast, **kwargs)
+        return query.iter_frames(chunksize=chunksize)
+
     def _fully_qualified_name(self, name, database):
         if bool(fully_qualified_re.search(name)):
             return name
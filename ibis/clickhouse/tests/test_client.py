@@ -67,6 +67,21 @@ def test_limit_equals_none_no_limit(alltypes):
         assert len(result) > 10
 
 
+def test_execute_iter(con, alltypes):
+    expr = alltypes.sort_by('id').limit(2500)
+    frames = list(con.execute_iter(expr, chunksize=1000))
+    assert [len(frame) for frame in frames] == [1000, 1000, 500]
+
+    result = pd.concat(frames, ignore_index=True)
+    tm.assert_frame_equal(result, expr.execute())
+
+    # the connection is reusable after reading part of a result
+    frames = con.execute_iter(expr, chunksize=1000)
+    next(frames)
+    frames.close()
+    assert len(con.execute(alltypes.limit(10))) == 10
+
+
 def test_verbose_log_queries(con, db):
     queries = []
 
@@ -0,0 +1,127 @@
+import datetime
+
+import pytest
+
+import numpy as np
+import pandas as pd
+import pandas.util.testing as tm
+
+import ibis
+
+pytest.importorskip('clickhouse_driver')
+
+from ibis.clickhouse.client import ClickhouseClient  # noqa: E402
+
+
+class FakeDriverClient(object):
+
+    """Answers every query with the given columns, like the public API of
+    clickhouse-driver does"""
+
+    def __init__(self, columns_with_types, columns):
+        self.columns_with_types = columns_with_types
+        self.columns = columns
+        self.queries = []
+        self.disconnected = False
+
+    def execute(self, query, columnar=False, with_column_types=False,
+                external_tables=None):
+        assert columnar and with_column_types
+        self.queries.append(query)
+        data = [tuple(column) for column in self.columns if column]
+        return data, self.columns_with_types
+
+    def execute_iter(self, query, with_column_types=False,
+                     external_tables=None):
+        assert with_column_types
+        self.queries.append(query)
+        yield self.columns_with_types
+        for row in zip(*self.columns):
+            yield row
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+columns_with_types = [
+    ('id', 'Int32'),
+    ('maybe', 'Nullable(Int64)'),
+    ('name', 'String'),
+    ('day', 'Date'),
+    ('at', 'DateTime'),
+]
+columns = [
+    [1, 2, 3],
+    [1, None, 3],
+    ['a', 'b', None],
+    [datetime.date(2018, 1, i) for i in range(1, 4)],
+    [datetime.datetime(2018, 1, 1, i) for i in range(3)],
+]
+
+
+@pytest.fixture
+def con():
+    client = ClickhouseClient(host='localhost')
+    client.con = FakeDriverClient(columns_with_types, columns)
+    return client
+
+
+@pytest.fixture
+def t(con):
+    schema = ibis.schema([
+        ('id', 'int32'),
+        ('maybe', 'int64'),
+        ('name', 'string'),
+        ('day', 'date'),
+        ('at', 'timestamp'),
+    ])
+    return con.table_class('t', schema, con).to_expr()
+
+
+@pytest.fixture
+def expected():
+    return pd.DataFrame({
+        'id': np.array([1, 2, 3], dtype=np.int32),
+        'maybe': [1.0, np.nan, 3.0],
+        'name': ['a', 'b', None],
+        'day': pd.date_range('2018-01-01', periods=3, freq='D'),
+        'at': pd.date_range('2018-01-01', periods=3, freq='H'),
+    }, columns=[name for name, _ in columns_with_types])
+
+
+def test_execute_builds_typed_columns(con, t, expected):
+    result = t.execute()
+    tm.assert_frame_equal(result, expected)
+    assert not con.con.disconnected
+
+
+def test_execute_raw_sql_uses_result_types(con, expected):
+    result = con._exec_statement('SELECT * FROM t')
+    tm.assert_frame_equal(result, expected)
+    assert con.con.queries == ['SELECT * FROM t']
+
+
+def test_execute_iter_yields_chunks(con, t, expected):
+    frames = list(con.execute_iter(t, chunksize=2))
+    assert [len(frame) for frame in frames] == [2, 1]
+
+    tm.assert_frame_equal(frames[0], expected.iloc[:2])
+
+    result = pd.concat(frames, ignore_index=True)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_execute_iter_stops_early(con, t):
+    frames = con.execute_iter(t, chunksize=2)
+    next(frames)
+    frames.close()
+    assert con.con.disconnected
+
+
+def test_execute_empty_result(con, t):
+    con.con.columns = [[] for _ in columns]
+    result = t.execute()
+    assert list(result.columns) == [name for name, _ in columns_with_types]
+    assert result.id.dtype == np.int32
+    assert result.day.dtype == np.dtype('datetime64[ns]')
+    assert not len(result)
@@ -0,0 +1,103 @@
+import datetime
+
+import pytest
+
+import numpy as np
+import pandas as pd
+
+import ibis
+
+pytest.importorskip('clickhouse_driver')
+
+from ibis.clickhouse.client import (  # noqa: E402
+    ClickhouseClient, ClickhouseDatabaseTable, ClickhouseQuery,
+    ClickhouseTable
+)
+
+
+class FakeDriverClient(object):
+
+    """Records the rows of every INSERT statement"""
+
+    def __init__(self):
+        self.inserts = []
+
+    def process_insert_query(self, query, data, **kwargs):
+        self.inserts.append((query, data))
+
+
+class FakeColumnarDriverClient(FakeDriverClient):
+
+    """Records the columns of every INSERT statement, like clickhouse-driver
+    versions supporting columnar inserts"""
+
+    def process_insert_query(self, query, data, columnar=False):
+        assert columnar
+        self.inserts.append((query, data))
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'id': np.arange(5, dtype=np.int32),
+        'name': list('abcde'),
+        'day': pd.date_range('2018-01-01', periods=5, freq='D'),
+        'at': pd.date_range('2018-01-01', periods=5, freq='H'),
+    }, columns=['id', 'name', 'day', 'at'])
+
+
+def table(driver):
+    con = ClickhouseClient(host='localhost')
+    con.con = driver
+    schema = ibis.schema([
+        ('id', 'int32'),
+        ('name', 'string'),
+        ('day', 'date'),
+        ('at', 'timestamp'),
+    ])
+    return ClickhouseTable(ClickhouseDatabaseTable('db.t', schema, con))
+
+
+def test_insert_blocks(df):
+    driver = FakeDriverClient()
+    table(driver).insert(df, block_size=2)
+
+    queries, blocks = zip(*driver.inserts)
+    assert set(queries) == {
+        'INSERT INTO db.t (id, name, day, at) VALUES'
+    }
+    assert list(map(len, blocks)) == [2, 2, 1]
+    assert blocks[2] == [(
+        4, 'e', datetime.date(2018, 1, 5), datetime.datetime(2018, 1, 1, 4)
+    )]
+
+    # the inserted frame is left untouched
+    assert df.day.dtype == np.dtype('datetime64[ns]')
+
+
+def test_insert_columnar_blocks(df):
+    driver = FakeColumnarDriverClient()
+    table(driver).insert(df[['day', 'id']], block_size=3)
+
+    _, blocks = zip(*driver.inserts)
+    assert blocks[1] == [
+        [datetime.date(2018, 1, 4), datetime.date(2018, 1, 5)],
+        [3, 4],
+    ]
+
+
+def test_external_tables_rows(df):
+    con = ClickhouseClient(host='localhost')
+    query = ClickhouseQuery(con, 'SELECT 1', external_tables={'df': df})
+    [external] = query._external_tables()
+
+    assert external['name'] == 'df'
+    assert external['structure'] == [
+        ('id', 'Nullable(Int32)'),
+        ('name', 'Nullable(String)'),
+        ('day', 'Nullable(DateTime)'),
+        ('at', 'Nullable(DateTime)'),
+    ]
+    assert external['data'][1] == (
+        1, 'b', datetime.datetime(2018, 1, 2), datetime.datetime(2018, 1, 1, 1)
+    )
@@ -1,4 +1,7 @@
 import abc
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import six
 
@@ -12,8 +15,115 @@ import ibis.expr.operations as ops
 import ibis.sql.compiler as comp
 
 
+# The QueryFuture of the expression executing on each executor thread
+_current = threading.local()
+
+
+def current_future():
+    """
+    Return the :class:`QueryFuture` of the expression executing on the
+    current thread, or None if it is not executing on an executor thread.
+    Backends supporting cancellation poll its cancel_requested() method.
+    """
+    return getattr(_current, 'future', None)
+
+
+class QueryFuture(Future):
+    """
+    The future result of an expression executing on an executor thread.
+
+    Unlike other futures, an expression that is already running can be
+    cancelled on the backends that support it (Impala): cancel() returns
+    False, as the result is not known yet, but requests the cancellation of
+    the running query, in which case result() raises CancelledError.
+
+    Query futures can be awaited in asyncio coroutines (Python 3.5+).
+    """
+
+    def __init__(self):
+        super(QueryFuture, self).__init__()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        if super(QueryFuture, self).cancel():
+            return True
+        if self.running():
+            self._cancel_event.set()
+        return False
+
+    def cancel_requested(self):
+        """
+        Whether cancel() was called after the expression started running
+        """
+        return self._cancel_event.is_set()
+
+    def __await__(self):
+        import asyncio
+        return asyncio.wrap_future(self).__await__()
+
+
+def _submit(executor, function, *args, **kwargs):
+    """
+    Call `function` on a thread of `executor`, making its
+    :class:`QueryFuture` available to backends with current_future()
+    """
+    future = QueryFuture()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        _current.future = future
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            _current.future = None
+
+    executor.submit(run)
+    return future
+
+
 class Client(object):
-    pass
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    @property
+    def executor(self):
+        """The executor running the expressions submitted with
+        :meth:`execute_async`, on ``ibis.options.sql.async_workers`` threads.
+
+        Returns
+        -------
+        concurrent.futures.ThreadPoolExecutor
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=options.sql.async_workers
+                )
+        return self._executor
+
+    def execute_async(self, expr, params=None, limit='default', **kwargs):
+        """
+        Execute an expression on a thread of :attr:`executor`, see
+        :meth:`execute`
+
+        Returns
+        -------
+        future : QueryFuture
+          Its result is the result of ``execute(expr, ...)``. It can be
+          awaited in asyncio coroutines.
+        """
+        return self._submit(
+            self.execute, expr, params=params, limit=limit, **kwargs
+        )
+
+    def _submit(self, function, *args, **kwargs):
+        return _submit(self.executor, function, *args, **kwargs)
 
 
 class Query(object):
@@ -210,6 +320,25 @@ class SQLClient(six.with_metaclass(abc.ABCMeta, Client)):
         result = self._execute_query(query_ast, async=async, **kwargs)
         return result
 
+    def execute_async(self, expr, params=None, limit='default', **kwargs):
+        """
+        Compile an expression and execute it on a thread of
+        :attr:`executor`, see :meth:`execute`. The expression is compiled on
+        the calling thread, so that only the query runs in the background.
+
+        Returns
+        -------
+        future : QueryFuture
+          Its result is the result of ``execute(expr, ...)``. It can be
+          awaited in asyncio coroutines.
+
+        Examples
+        --------
+        >>> result = await client.execute_async(expr)  # doctest: +SKIP
+        """
+        query_ast = self._build_ast_ensure_limit(expr, limit, params=params)
+        return self._submit(self._execute_query, query_ast, **kwargs)
+
     def _execute_query(self, dml, async=False, **kwargs):
         klass = self.async_query if async else self.sync_query
         inst = klass(self, dml, **kwargs)
@@ -285,12 +414,92 @@ class SQLClient(six.with_metaclass(abc.ABCMeta, Client)):
 
 class QueryPipeline(object):
     """
-    Execute a series of queries, possibly asynchronously, and capture any
-    result sets generated
-
-    Note: No query pipelines have yet been implemented
+    Execute independent expressions concurrently, each on the backend it
+    depends on, running at most `max_workers` of them at the same time so
+    that as many connections are used at most
+
+    Parameters
+    ----------
+    max_workers : int, default None
+      Defaults to ibis.options.sql.async_workers
+
+    Examples
+    --------
+    >>> with QueryPipeline() as pipeline:  # doctest: +SKIP
+    ...     results = pipeline.execute([expr1, expr2, expr3])
     """
-    pass
+
+    def __init__(self, max_workers=None):
+        if max_workers is None:
+            max_workers = options.sql.async_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.futures = []
+
+    def submit(self, expr, params=None, limit='default', **kwargs):
+        """
+        Schedule the execution of an expression
+
+        Returns
+        -------
+        future : QueryFuture
+          Its result is the result of ``expr.execute(...)``
+        """
+        future = _submit(
+            self.executor, execute, expr, limit=limit, params=params, **kwargs
+        )
+        self.futures.append(future)
+        return future
+
+    def execute(self, exprs, params=None, limit='default', **kwargs):
+        """
+        Execute expressions concurrently and wait for all their results.
+        If one of them fails, the expressions that have not started yet are
+        cancelled and its exception is raised.
+
+        Parameters
+        ----------
+        exprs : list of Expr
+        params : dict, default None
+        limit : int, default 'default'
+
+        Returns
+        -------
+        results : list
+          The result of each expression, in the order of `exprs`
+        """
+        futures = [
+            self.submit(expr, params=params, limit=limit, **kwargs)
+            for expr in exprs
+        ]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def cancel(self):
+        """
+        Cancel the expressions submitted that have not started yet, and the
+        running ones on the backends supporting it
+        """
+        for future in self.futures:
+            future.cancel()
+
+    def close(self, wait=True):
+        """
+        Release the threads of the pipeline once the expressions submitted
+        have been executed
+        """
+        self.executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.cancel()
+        self.close()
 
 
 def validate_backends(backends):
@@ -313,6 +522,11 @@ def execute(expr, limit='default', async=False, params=None, **kwargs):
                            **kwargs)
 
 
+def execute_async(expr, limit='default', params=None, **kwargs):
+    backend, = validate_backends(list(find_backends(expr)))
+    return backend.execute_async(expr, limit=limit, params=params, **kwargs)
+
+
 def compile(expr, limit=None, params=None, **kwargs):
     backend, = validate_backends(list(find_backends(expr)))
     return backend.compile(expr, limit=limit, params=params, **kwargs)
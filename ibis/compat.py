@@ -123,3 +123,24 @@ except ImportError:
 
 def to_date(*args, **kwargs):
     return to_datetime(*args, **kwargs).date()
+
+
+try:
+    from pandas._libs.tslibs.parsing import (  # noqa: F401
+        guess_datetime_format
+    )
+except ImportError:
+    try:
+        from pandas._libs.tslibs.parsing import (  # noqa: F401
+            _guess_datetime_format as guess_datetime_format
+        )
+    except ImportError:
+        def guess_datetime_format(dt_str, **kwargs):
+            return None
+
+
+try:
+    from pandas.core.sorting import get_group_index_sorter  # noqa: F401
+except ImportError:
+    def get_group_index_sorter(group_index, ngroups):
+        return group_index.argsort(kind='mergesort')
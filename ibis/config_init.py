@@ -35,8 +35,16 @@ Number of rows to be retrieved for an unlimited table expression
 """
 
 
+sql_async_workers_doc = """
+Number of threads, and so of queries running at the same time, of the
+executor of a client's execute_async method and of a QueryPipeline
+"""
+
+
 with cf.config_prefix('sql'):
     cf.register_option('default_limit', 10000, sql_default_limit_doc)
+    cf.register_option('async_workers', 4, sql_async_workers_doc,
+                       validator=cf.is_int)
 
 
 impala_temp_db_doc = """
@@ -47,20 +55,133 @@ impala_temp_hdfs_path_doc = """
 HDFS path for storage of temporary data
 """
 
+impala_metadata_ttl_doc = """
+Number of seconds that an Impala client caches the results of metadata
+statements, such as table schemas and listings. Statements issued by Ibis
+that change a table invalidate its entries. Set to None (the default) to
+disable caching
+"""
+
+impala_upload_format_doc = """
+File format used to upload pandas DataFrames to HDFS: 'csv' or 'parquet'.
+Parquet requires pyarrow; CSV is used when pyarrow is not installed
+"""
+
+impala_upload_part_rows_doc = """
+Maximum number of rows in each file of an uploaded DataFrame
+"""
+
+impala_upload_threads_doc = """
+Number of files of an uploaded DataFrame written and uploaded
+concurrently
+"""
+
 
 with cf.config_prefix('impala'):
     cf.register_option('temp_db', '__ibis_tmp', impala_temp_db_doc)
     cf.register_option('temp_hdfs_path', '/tmp/ibis',
                        impala_temp_hdfs_path_doc)
+    cf.register_option('metadata_ttl', None, impala_metadata_ttl_doc,
+                       validator=cf.is_instance_factory(
+                           (type(None), float, int)))
+    cf.register_option('upload_format', 'csv', impala_upload_format_doc,
+                       validator=cf.is_one_of_factory(['csv', 'parquet']))
+    cf.register_option('upload_part_rows', 1000000,
+                       impala_upload_part_rows_doc, validator=cf.is_int)
+    cf.register_option('upload_threads', 4, impala_upload_threads_doc,
+                       validator=cf.is_int)
 
 
 clickhouse_temp_db_doc = """
 Database to use for temporary tables, views. functions, etc.
 """
 
+clickhouse_insert_block_size_doc = """
+The number of rows of a DataFrame sent to Clickhouse in each block, and
+converted to Python objects at a time, by ClickhouseTable.insert.
+"""
+
 with cf.config_prefix('clickhouse'):
     cf.register_option('temp_db', '__ibis_tmp', clickhouse_temp_db_doc)
+    cf.register_option('insert_block_size', 1048576,
+                       clickhouse_insert_block_size_doc, validator=cf.is_int)
+
 
+bigquery_page_size_doc = """
+The number of rows of a query result read by each request made to download
+it.
+"""
+
+bigquery_download_threads_doc = """
+The number of threads downloading the pages of a query result concurrently.
+"""
+
+bigquery_max_bytes_billed_doc = """
+Maximum number of bytes a query run by BigQueryClient.execute may process.
+Queries are first estimated with a dry run. Queries over the budget are
+refused with MaximumBytesBilledExceeded, unless reading only the most recent
+bigquery.partition_filter_days partitions of their partitioned tables brings
+them within budget. Also set as the maximum bytes billed of the query jobs.
+Set to None (the default) to disable the check.
+"""
+
+bigquery_partition_filter_days_doc = """
+Number of most recent daily partitions that queries over the
+bigquery.max_bytes_billed budget are restricted to, by filtering the
+partition column of their partitioned tables. Set to None (the default) to
+refuse such queries instead.
+"""
 
 with cf.config_prefix('bigquery'):
     cf.register_option('partition_col', 'PARTITIONTIME')
+    cf.register_option('max_bytes_billed', None, bigquery_max_bytes_billed_doc,
+                       validator=cf.is_instance_factory((type(None), int)))
+    cf.register_option('partition_filter_days', None,
+                       bigquery_partition_filter_days_doc,
+                       validator=cf.is_instance_factory((type(None), int)))
+    cf.register_option('page_size', 100000, bigquery_page_size_doc,
+                       validator=cf.is_int)
+    cf.register_option('download_threads', 4, bigquery_download_threads_doc,
+                       validator=cf.is_int)
+
+
+sqlite_pandas_udfs_doc = """
+Evaluate expressions over a single SQLite table that call functions SQLite
+computes with a Python UDF for every row, such as regex searches, in bulk
+with the pandas backend over the columns they use, instead of in SQLite.
+Only filters that need no Python UDF are applied while reading the table and
+the result limit is applied after pandas, so every other row of the table is
+loaded into memory
+"""
+
+with cf.config_prefix('sqlite'):
+    cf.register_option('pandas_udfs', False, sqlite_pandas_udfs_doc,
+                       validator=cf.is_bool)
+
+
+pandas_categorical_threshold_doc = """
+Dictionary encode string columns of pandas backend tables as pandas
+Categoricals when the ratio of distinct values to rows is at most this value.
+Set to None (the default) to disable encoding.
+"""
+
+pandas_join_prefilter_ratio_doc = """
+Before an equality join in the pandas backend, drop the rows of the larger side
+whose keys do not appear in the smaller side when the larger side has more than
+this many times the rows of the smaller side. Only sides whose unmatched rows
+are discarded by the join are filtered. Set to None to disable.
+"""
+
+with cf.config_prefix('pandas'):
+    cf.register_option(
+        'categorical_threshold',
+        None,
+        pandas_categorical_threshold_doc,
+        validator=cf.is_instance_factory((type(None), float, int)),
+    )
+    cf.register_option(
+        'join_prefilter_ratio',
+        10,
+        pandas_join_prefilter_ratio_doc,
+        validator=cf.is_instance_factory((type(None), float, int)),
+    )
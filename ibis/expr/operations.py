@@ -1308,6 +1308,12 @@ class SimpleCase(ValueOp):
     def _validate(self):
         assert len(self.cases) == len(self.results)
 
+    @property
+    def inputs(self):
+        # A result only needs to be computed on the rows that select it, so
+        # the results and the default are computed from the cases
+        return self.base, self.cases
+
     def root_tables(self):
         return distinct_roots(
             *itertools.chain(
@@ -1331,6 +1337,12 @@ class SearchedCase(ValueOp):
     def _validate(self):
         assert len(self.cases) == len(self.results)
 
+    @property
+    def inputs(self):
+        # A result only needs to be computed on the rows that select it, so
+        # the results and the default are computed from the cases
+        return self.cases,
+
     def root_tables(self):
         cases, results, default = self.args
         return distinct_roots(
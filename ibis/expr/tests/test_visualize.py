@@ -116,3 +116,9 @@ def test_optional_graphviz_repr():
     # turn it back on
     ibis.options.graphviz_repr = True
     assert expr._repr_png_() is not None
+
+
+def test_annotations(table):
+    expr = table.a + table.b
+    graph = viz.to_graph(expr, annotations={table.a.op(): 'annotated node'})
+    assert 'annotated node' in graph.source
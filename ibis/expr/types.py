@@ -184,6 +184,33 @@ class Expr(object):
         from ibis.client import execute
         return execute(self, limit=limit, async=async, params=params, **kwargs)
 
+    def execute_async(self, limit='default', params=None, **kwargs):
+        """
+        Execute the expression in the background on a thread of the executor
+        of its backend, see :meth:`execute`
+
+        Returns
+        -------
+        future : ibis.client.QueryFuture
+          Whose result() method waits for, and returns, the result of the
+          expression
+        """
+        from ibis.client import execute_async
+        return execute_async(self, limit=limit, params=params, **kwargs)
+
+    def aexecute(self, limit='default', params=None, **kwargs):
+        """
+        Execute the expression in the background, returning an awaitable for
+        asyncio coroutines. Compilation happens on the calling thread, and
+        the query on a thread of the executor of the backend, see
+        :meth:`execute_async`
+
+        Examples
+        --------
+        >>> result = await expr.aexecute()  # doctest: +SKIP
+        """
+        return self.execute_async(limit=limit, params=params, **kwargs)
+
     def compile(self, limit=None, params=None):
         """
         Compile expression to whatever execution target, to verify
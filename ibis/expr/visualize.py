@@ -95,7 +95,7 @@ def get_type(expr):
     ) + '<BR ALIGN="LEFT" />'
 
 
-def get_label(expr, argname=None):
+def get_label(expr, argname=None, annotation=None):
     import ibis.expr.operations as ops
 
     node = expr.op()
@@ -114,10 +114,32 @@ def get_label(expr, argname=None):
         else:
             label_fmt = '<{} \u27f6 {}>'
         label = label_fmt.format(name, typename)
+    if annotation is not None:
+        label = '{}<BR ALIGN="LEFT" /><I>{}</I>>'.format(
+            label[:-1], annotation
+        )
     return label
 
 
-def to_graph(expr, node_attr=None, edge_attr=None):
+def to_graph(expr, node_attr=None, edge_attr=None, annotations=None):
+    """Build the graph of `expr`.
+
+    Parameters
+    ----------
+    expr : ibis.expr.types.Expr
+    node_attr : Optional[Mapping[str, str]]
+    edge_attr : Optional[Mapping[str, str]]
+    annotations : Optional[Mapping[ops.Node, str]]
+        Text added to the label of each node, such as its execution
+        statistics
+
+    Returns
+    -------
+    graph : graphviz.Digraph
+    """
+    if annotations is None:
+        annotations = {}
+
     if node_attr is None:
         node_attr = {
             'shape': 'box',
@@ -144,7 +166,7 @@ def to_graph(expr, node_attr=None, edge_attr=None):
             seen.add(a)
 
             if a not in labeled:
-                label = get_label(e)
+                label = get_label(e, annotation=annotations.get(node))
             else:
                 label = None
 
@@ -153,7 +175,9 @@ def to_graph(expr, node_attr=None, edge_attr=None):
             for arg, arg_name in get_args(node):
                 if arg is not None:
                     b = str(hash(repr(arg.op())))
-                    label = get_label(arg, arg_name)
+                    label = get_label(
+                        arg, arg_name, annotation=annotations.get(arg.op())
+                    )
                     graph.node(b, label=label)
                     labeled.add(b)
                     graph.edge(a, b)
@@ -7,6 +7,7 @@ import ibis.expr.operations as ops
 from ibis.compat import parse_version
 from ibis.file.client import FileClient
 from ibis.pandas.api import PandasDialect
+from ibis.pandas.client import encode_low_cardinality_strings
 from ibis.pandas.core import execute_node, pre_execute, execute
 from ibis.pandas.execution.selection import physical_tables
 
@@ -96,7 +97,7 @@ class CSVClient(FileClient):
 def csv_read_table(op, client, scope, **kwargs):
     path = client.dictionary[op.name]
     df = _read_csv(path, schema=op.schema, header=0, **op.read_csv_kwargs)
-    return df
+    return encode_low_cardinality_strings(df)
 
 
 @pre_execute.register(ops.Selection, CSVClient)
@@ -117,6 +118,8 @@ def csv_pre_execute_selection(op, client, scope, **kwargs):
             if len(pd.Index(usecols) & header.columns) != len(usecols):
                 usecols = None
 
-        ops[table] = _read_csv(path, table.schema, usecols=usecols, header=0)
+        ops[table] = encode_low_cardinality_strings(
+            _read_csv(path, table.schema, usecols=usecols, header=0)
+        )
 
     return ops
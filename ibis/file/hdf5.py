@@ -2,6 +2,7 @@ import pandas as pd
 import ibis.expr.schema as sch
 import ibis.expr.operations as ops
 from ibis.file.client import FileClient
+from ibis.pandas.client import encode_low_cardinality_strings
 from ibis.pandas.core import execute_node, execute
 
 
@@ -71,4 +72,4 @@ def hdf_read_table(op, client, scope, **kwargs):
     key = op.name
     path = client.dictionary[key]
     df = pd.read_hdf(str(path), key, mode='r')
-    return df
+    return encode_low_cardinality_strings(df)
@@ -8,6 +8,7 @@ import ibis.expr.operations as ops
 from ibis.compat import parse_version
 from ibis.file.client import FileClient
 from ibis.pandas.api import PandasDialect
+from ibis.pandas.client import encode_low_cardinality_strings
 from ibis.pandas.core import execute_node, execute
 
 
@@ -108,4 +109,4 @@ def parquet_read_table(op, client, scope, **kwargs):
     path = client.dictionary[op.name]
     table = pq.read_table(str(path))
     df = table.to_pandas()
-    return df
+    return encode_low_cardinality_strings(df)
@@ -16,18 +16,69 @@
 # license), see the LICENSES directory.
 
 import posixpath
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from timeit import default_timer
 
 import six
 
 from ibis.config import options
 from ibis.util import implements
 import ibis.common as com
+import ibis.util as util
 
 
 class HDFSError(com.IbisError):
     pass
 
 
+class TransferProgress(object):
+
+    """
+    Progress callback for HDFS transfers that keeps track of the number of
+    bytes transferred and the throughput. Pass an instance as the `progress`
+    argument of `put`, `get` or `put_parts`; it may be shared by concurrent
+    transfers.
+
+    Parameters
+    ----------
+    callback : callable, optional
+      Also called as callback(path, nbytes) for every chunk transferred
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.nbytes = 0
+        self.start = None
+        self.end = None
+        self._lock = threading.Lock()
+
+    def __call__(self, path, nbytes):
+        with self._lock:
+            now = default_timer()
+            if self.start is None:
+                self.start = now
+            self.end = now
+            self.nbytes += nbytes
+        if self.callback is not None:
+            self.callback(path, nbytes)
+
+    @property
+    def elapsed(self):
+        """Seconds between the first and the last chunk transferred"""
+        if self.start is None:
+            return 0.0
+        return self.end - self.start
+
+    @property
+    def throughput(self):
+        """Bytes transferred per second, or None before two chunks"""
+        elapsed = self.elapsed
+        return self.nbytes / elapsed if elapsed else None
+
+
 class HDFS(object):
 
     """
@@ -90,7 +141,8 @@ class HDFS(object):
         """
         raise NotImplementedError
 
-    def get(self, hdfs_path, local_path='.', overwrite=False):
+    def get(self, hdfs_path, local_path='.', overwrite=False, n_threads=4,
+            retries=2, progress=None):
         """
         Download remote file or directory to the local filesystem
 
@@ -98,6 +150,13 @@ class HDFS(object):
         ----------
         hdfs_path : string
         local_path : string, default '.'
+        n_threads : int, default 4
+          Number of files of a directory downloaded concurrently
+        retries : int, default 2
+          Number of times a failed download is retried
+        progress : callable, optional
+          Called as progress(path, nbytes) for every chunk downloaded, e.g. a
+          TransferProgress
 
         Further keyword arguments passed down to any internal API used.
 
@@ -109,7 +168,7 @@ class HDFS(object):
         raise NotImplementedError
 
     def put(self, hdfs_path, resource, overwrite=False, verbose=None,
-            **kwargs):
+            n_threads=4, retries=None, progress=None, **kwargs):
         """
         Write file or directory to HDFS
 
@@ -121,6 +180,16 @@ class HDFS(object):
           Relative or absolute path to local resource, or a file-like object
         overwrite : boolean, default False
         verbose : boolean, default ibis options.verbose
+        n_threads : int, default 4
+          Number of files of a directory uploaded concurrently
+        retries : int, optional
+          Number of times a failed upload is retried, by default 2 for local
+          paths and 0 for file-like objects. Retrying a file-like object
+          checks whether `hdfs_path` exists first, unless `overwrite`, and
+          requires the object to be seekable
+        progress : callable, optional
+          Called as progress(path, nbytes) for every chunk uploaded, e.g. a
+          TransferProgress
 
         Further keyword arguments passed down to any internal API used.
 
@@ -131,8 +200,43 @@ class HDFS(object):
         """
         raise NotImplementedError
 
+    def put_parts(self, hdfs_dir, resource, part_size=2 ** 27,
+                  delimiter=b'\n', overwrite=False, n_threads=4, retries=2,
+                  progress=None):
+        """
+        Write a large file to HDFS as part files part-00000, part-00001, ...
+        in a directory, uploading the parts concurrently. This suits data
+        read as a directory, such as the files of an Impala table.
+
+        Parameters
+        ----------
+        hdfs_dir : string
+          Directory to write the parts to, created if it does not exist
+        resource : string or buffer-like
+          Path to a local file, or a binary file-like object
+        part_size : int, default 128MB
+          Approximate size of each part in bytes
+        delimiter : bytes or None, default b'\\n'
+          Every part ends after a delimiter, so that parts of delimited text
+          hold whole records. Pass None to split at exactly `part_size` bytes
+        overwrite : boolean, default False
+        n_threads : int, default 4
+          Number of parts uploaded concurrently. At most twice as many parts
+          are held in memory at once
+        retries : int, default 2
+          Number of times the upload of a failed part is retried
+        progress : callable, optional
+          Called as progress(path, nbytes) for every part uploaded
+
+        Returns
+        -------
+        paths : list of strings
+          The paths of the parts written
+        """
+        raise NotImplementedError
+
     def put_tarfile(self, hdfs_path, local_path, compression='gzip',
-                    verbose=None, overwrite=False):
+                    verbose=None, overwrite=False, n_threads=4):
         """
         Write contents of tar archive to HDFS directly without having to
         decompress it locally first
@@ -144,6 +248,9 @@ class HDFS(object):
         compression : {'gzip', 'bz2', None}
         overwrite : boolean, default False
         verbose : boolean, default None (global default)
+        n_threads : int, default 4
+          Number of files uploaded concurrently. Files are decompressed in
+          order, at most twice as many as are being uploaded
         """
         import tarfile
         modes = {
@@ -157,14 +264,24 @@ class HDFS(object):
                              .format(compression))
         mode = modes[compression]
 
-        tf = tarfile.open(local_path, mode=mode)
-        for info in tf:
-            if not info.isfile():
-                continue
+        def put_member(abspath, data):
+            return self.put(abspath, six.BytesIO(data), verbose=verbose,
+                            overwrite=overwrite)
 
-            buf = tf.extractfile(info)
-            abspath = posixpath.join(hdfs_path, info.path)
-            self.put(abspath, buf, verbose=verbose, overwrite=overwrite)
+        def uploads(tf):
+            for info in tf:
+                if not info.isfile():
+                    continue
+
+                data = tf.extractfile(info).read()
+                abspath = posixpath.join(hdfs_path, info.path)
+                yield put_member, (abspath, data)
+
+        tf = tarfile.open(local_path, mode=mode)
+        try:
+            _run_bounded(n_threads, uploads(tf))
+        finally:
+            tf.close()
 
     def put_zipfile(self, hdfs_path, local_path):
         raise NotImplementedError
@@ -307,22 +424,203 @@ class WebHDFS(HDFS):
 
     @implements(HDFS.put)
     def put(self, hdfs_path, resource, overwrite=False, verbose=None,
-            **kwargs):
+            n_threads=4, retries=None, progress=None, **kwargs):
         verbose = verbose or options.verbose
         if isinstance(resource, six.string_types):
-            # `resource` is a path.
-            return self.client.upload(hdfs_path, resource, overwrite=overwrite,
-                                      **kwargs)
+            if retries is None:
+                retries = 2
+            # `resource` is a path. HdfsCLI uploads the files of a directory
+            # concurrently and deletes what it wrote when an upload fails.
+            def upload():
+                return self.client.upload(
+                    hdfs_path, resource, overwrite=overwrite,
+                    n_threads=n_threads,
+                    progress=_chunk_progress(progress), **kwargs
+                )
+            return _retry(upload, retries, verbose=verbose)
         else:
             # `resource` is a file-like object.
             hdfs_path = self.client.resolve(hdfs_path)
-            self.client.write(hdfs_path, data=resource, overwrite=overwrite,
-                              **kwargs)
-            return hdfs_path
+            position = _tell(resource)
+            if retries is None or position is None:
+                retries = 0
+            elif retries and not overwrite and self.exists(hdfs_path):
+                raise HDFSError(
+                    'Remote path {0!r} already exists'.format(hdfs_path)
+                )
+
+            attempts = []
+
+            def write():
+                if attempts:
+                    # Replace what a failed attempt wrote
+                    resource.seek(position)
+                attempts.append(None)
+                data = resource
+                if progress is not None:
+                    data = _read_chunks(resource, hdfs_path, progress)
+                self.client.write(hdfs_path, data=data,
+                                  overwrite=overwrite or len(attempts) > 1,
+                                  **kwargs)
+                return hdfs_path
+            return _retry(write, retries, verbose=verbose)
+
+    @implements(HDFS.put_parts)
+    def put_parts(self, hdfs_dir, resource, part_size=2 ** 27,
+                  delimiter=b'\n', overwrite=False, n_threads=4, retries=2,
+                  progress=None):
+        if isinstance(resource, six.string_types):
+            with open(resource, 'rb') as reader:
+                return self.put_parts(hdfs_dir, reader, part_size=part_size,
+                                      delimiter=delimiter,
+                                      overwrite=overwrite,
+                                      n_threads=n_threads, retries=retries,
+                                      progress=progress)
+
+        hdfs_dir = self.client.resolve(hdfs_dir)
+        self.mkdir(hdfs_dir)
+        existing = frozenset(self.ls(hdfs_dir))
+
+        def uploads():
+            parts = _split_parts(resource, part_size, delimiter)
+            for i, data in enumerate(parts):
+                name = 'part-{0:05d}'.format(i)
+                path = posixpath.join(hdfs_dir, name)
+                if name in existing and not overwrite:
+                    raise HDFSError(
+                        'Remote path {0!r} already exists'.format(path)
+                    )
+                yield _retry, (self._write_part, retries, path, data,
+                               progress)
+        return _run_bounded(n_threads, uploads())
+
+    def _write_part(self, path, data, progress):
+        # Any file at `path` was checked to be overwritable in put_parts, or
+        # was written by a failed attempt
+        self.client.write(path, data=data, overwrite=True)
+        if progress is not None:
+            progress(path, len(data))
+        return path
 
     @implements(HDFS.get)
     def get(self, hdfs_path, local_path, overwrite=False, verbose=None,
-            **kwargs):
+            n_threads=4, retries=2, progress=None, **kwargs):
         verbose = verbose or options.verbose
-        return self.client.download(hdfs_path, local_path, overwrite=overwrite,
-                                    **kwargs)
+
+        # HdfsCLI downloads the files of a directory concurrently and deletes
+        # what it wrote when a download fails.
+        def download():
+            return self.client.download(
+                hdfs_path, local_path, overwrite=overwrite,
+                n_threads=n_threads, progress=_chunk_progress(progress),
+                **kwargs
+            )
+        return _retry(download, retries, verbose=verbose)
+
+
+def _run_bounded(n_threads, calls):
+    """Run the (function, args) pairs of the iterable `calls` in a pool of
+    `n_threads` threads, taking at most twice as many pairs from `calls` as
+    there are calls running, so that lazily read data is bounded in memory.
+
+    Returns
+    -------
+    results : list
+      The results of the calls, in order
+    """
+    slots = threading.BoundedSemaphore(2 * n_threads)
+
+    def run(function, args):
+        try:
+            return function(*args)
+        finally:
+            slots.release()
+
+    futures = []
+    with ThreadPoolExecutor(n_threads) as executor:
+        for function, args in calls:
+            slots.acquire()
+            futures.append(executor.submit(run, function, args))
+        return [future.result() for future in futures]
+
+
+def _retry(function, retries, *args, **kwargs):
+    """Call `function(*args)`, calling it again up to `retries` times with an
+    exponential backoff when it raises.
+    """
+    verbose = kwargs.pop('verbose', options.verbose)
+    for attempt in range(retries + 1):
+        try:
+            return function(*args)
+        except Exception as e:
+            if attempt == retries:
+                raise
+            if verbose:
+                util.log('HDFS transfer failed, retrying: {0}'.format(e))
+            time.sleep(0.1 * 2 ** attempt)
+
+
+def _chunk_progress(progress):
+    """Adapt a progress(path, nbytes) callback receiving the size of every
+    chunk to HdfsCLI's callbacks, which receive the bytes transferred so far
+    for each file and -1 when a file is complete.
+    """
+    if progress is None:
+        return None
+
+    transferred = {}
+    lock = threading.Lock()
+
+    def callback(path, nbytes):
+        if nbytes < 0:
+            return
+        with lock:
+            chunk = nbytes - transferred.get(path, 0)
+            transferred[path] = nbytes
+        progress(path, chunk)
+    return callback
+
+
+def _tell(resource):
+    """The position of the file-like `resource`, or None if it cannot be
+    rewound to it."""
+    try:
+        return resource.tell() if resource.seekable() else None
+    except (AttributeError, IOError, ValueError):
+        return None
+
+
+def _read_chunks(reader, path, progress, chunk_size=2 ** 16):
+    """Yield the chunks of `reader`, reporting each to `progress`"""
+    while True:
+        chunk = reader.read(chunk_size)
+        if not chunk:
+            return
+        progress(path, len(chunk))
+        yield chunk
+
+
+def _split_parts(reader, part_size, delimiter):
+    """Read `reader` in parts of about `part_size` bytes, each ending after a
+    `delimiter` unless it is the last part or `delimiter` is None.
+    """
+    pending = b''
+    while True:
+        chunk = reader.read(part_size)
+        if not chunk:
+            if pending:
+                yield pending
+            return
+
+        data = pending + chunk
+        if delimiter is None:
+            yield data
+            continue
+
+        end = data.rfind(delimiter)
+        if end < 0:
+            pending = data
+        else:
+            end += len(delimiter)
+            pending = data[end:]
+            yield data[:end]
@@ -21,6 +21,7 @@ import threading
 
 from posixpath import join as pjoin
 from collections import deque
+from concurrent.futures import CancelledError
 
 import numpy as np
 import pandas as pd
@@ -35,12 +36,13 @@ import ibis.expr.operations as ops
 
 from ibis.config import options
 from ibis.client import (Query, AsyncQuery, Database,
-                         DatabaseEntity, SQLClient)
+                         DatabaseEntity, SQLClient, current_future)
 from ibis.compat import lzip, parse_version
 from ibis.filesystems import HDFS, WebHDFS
 from ibis.impala import udf, ddl
 from ibis.impala.compat import impyla, ImpylaError, HS2Error
 from ibis.impala.compiler import build_ast, ImpalaDialect
+from ibis.impala.metadata_cache import MetadataCache
 from ibis.util import log
 from ibis.sql.compiler import DDL, DML
 
@@ -240,9 +242,11 @@ class ImpalaCursor(object):
             self._wait_synchronous()
 
     def _wait_synchronous(self):
-        # Wait to finish, but cancel if KeyboardInterrupt
+        # Wait to finish, but cancel if KeyboardInterrupt, or if the future
+        # of the expression executing on this thread is cancelled
         from impala.hiveserver2 import OperationalError
         loop_start = time.time()
+        future = current_future()
 
         def _sleep_interval(start_time):
             elapsed = time.time() - start_time
@@ -264,6 +268,9 @@ class ImpalaCursor(object):
                     raise OperationalError("Operation is in ERROR_STATE")
                 if not cur._op_state_is_executing(state):
                     break
+                if future is not None and future.cancel_requested():
+                    self.cancel()
+                    raise CancelledError('Query cancelled')
                 time.sleep(_sleep_interval(loop_start))
         except KeyboardInterrupt:
             print('Canceling query')
@@ -656,13 +663,21 @@ class ImpalaTable(ir.TableExpr, DatabaseEntity):
             database = self._database
         statement = ddl.RenameTable(self._qualified_name, new_name,
                                     new_database=database)
-        self._client._execute(statement)
+        try:
+            self._client._execute(statement)
+        finally:
+            self._client._invalidate_table(self._qualified_name)
+            self._client._invalidate_table(statement.new_qualified_name)
 
         op = self.op().change_name(statement.new_qualified_name)
         return type(self)(op)
 
     def _execute(self, stmt):
-        return self._client._execute(stmt)
+        # Every statement executed here changes the table
+        try:
+            return self._client._execute(stmt)
+        finally:
+            self._client._invalidate_table(self._qualified_name)
 
     @property
     def is_partitioned(self):
@@ -680,6 +695,14 @@ class ImpalaTable(ir.TableExpr, DatabaseEntity):
         -------
         partition_schema : ibis Schema
         """
+        return self._client.metadata_cache.get(
+            ('partition_schema',) + self._client._table_key(
+                self._qualified_name
+            ),
+            self._get_partition_schema
+        )
+
+    def _get_partition_schema(self):
         schema = self.schema()
         name_to_type = dict(zip(schema.names, schema.types))
 
@@ -851,6 +874,8 @@ class ImpalaClient(SQLClient):
 
         self._temp_objects = weakref.WeakValueDictionary()
 
+        self.metadata_cache = MetadataCache()
+
         self._ensure_temp_db_exists()
 
     def _build_ast(self, expr, context):
@@ -911,6 +936,28 @@ class ImpalaClient(SQLClient):
         database = database or self.current_database
         return '{0}.`{1}`'.format(database, name)
 
+    def _table_key(self, name, database=None):
+        """
+        Return the lower case (database, table) names of a possibly fully
+        qualified table name, as used by the metadata cache
+        """
+        qualified_name = self._fully_qualified_name(name, database)
+        db, quoted, unquoted = ddl.fully_qualified_re.match(
+            qualified_name
+        ).groups()
+        return db.strip('`').lower(), (quoted or unquoted).lower()
+
+    def _invalidate_table(self, name, database=None):
+        self.metadata_cache.invalidate_table(
+            *self._table_key(name, database=database)
+        )
+
+    def raw_sql(self, query, results=False):
+        # Any statement other than a query might change metadata we cached
+        if not _is_query(query):
+            self.metadata_cache.clear()
+        return super(ImpalaClient, self).raw_sql(query, results=results)
+
     def list_tables(self, like=None, database=None):
         """
         List tables in the current (or indicated) database. Like the SHOW
@@ -938,10 +985,12 @@ class ImpalaClient(SQLClient):
                 return self.list_tables(like=like, database=database)
             statement += " LIKE '{0}'".format(like)
 
-        with self._execute(statement, results=True) as cur:
-            result = self._get_list(cur)
+        def list_tables():
+            with self._execute(statement, results=True) as cur:
+                return tuple(self._get_list(cur))
 
-        return result
+        key = 'tables', (database or self.current_database).lower(), like
+        return list(self.metadata_cache.get(key, list_tables))
 
     def _get_list(self, cur):
         tuples = cur.fetchall()
@@ -988,7 +1037,10 @@ class ImpalaClient(SQLClient):
             # which is easier for manual cleanup, if necessary
             self.hdfs.mkdir(path)
         statement = ddl.CreateDatabase(name, path=path, can_exist=force)
-        return self._execute(statement)
+        try:
+            return self._execute(statement)
+        finally:
+            self.metadata_cache.invalidate_database(name)
 
     def drop_database(self, name, force=False):
         """
@@ -1030,7 +1082,10 @@ class ImpalaClient(SQLClient):
                                          'being dropped, or set '
                                          'force=True'.format(name))
         statement = ddl.DropDatabase(name, must_exist=not force)
-        return self._execute(statement)
+        try:
+            return self._execute(statement)
+        finally:
+            self.metadata_cache.invalidate_database(name)
 
     def list_databases(self, like=None):
         """
@@ -1069,6 +1124,12 @@ class ImpalaClient(SQLClient):
         -------
         schema : ibis Schema
         """
+        return self.metadata_cache.get(
+            ('schema',) + self._table_key(table_name, database=database),
+            lambda: self._describe_schema(table_name, database=database)
+        )
+
+    def _describe_schema(self, table_name, database=None):
         qualified_name = self._fully_qualified_name(table_name, database)
         query = 'DESCRIBE {0}'.format(qualified_name)
         tuples = self.con.fetchall(query)
@@ -1154,7 +1215,7 @@ class ImpalaClient(SQLClient):
         ast = self._build_ast(expr, ImpalaDialect.make_context())
         select = ast.queries[0]
         statement = ddl.CreateView(name, select, database=database)
-        return self._execute(statement)
+        return self._execute_on_table(statement, name, database=database)
 
     def drop_view(self, name, database=None, force=False):
         """
@@ -1169,7 +1230,7 @@ class ImpalaClient(SQLClient):
         """
         statement = ddl.DropView(name, database=database,
                                  must_exist=not force)
-        return self._execute(statement)
+        return self._execute_on_table(statement, name, database=database)
 
     def create_table(self, table_name, obj=None, schema=None, database=None,
                      external=False, force=False,
@@ -1239,7 +1300,8 @@ class ImpalaClient(SQLClient):
         else:
             raise com.IbisError('Must pass expr or schema')
 
-        return self._execute(statement)
+        return self._execute_on_table(statement, table_name,
+                                      database=database)
 
     def avro_file(self, hdfs_dir, avro_schema, name=None, database=None,
                   external=True, persist=False):
@@ -1267,7 +1329,7 @@ class ImpalaClient(SQLClient):
         stmt = ddl.CreateTableAvro(name, hdfs_dir, avro_schema,
                                    database=database,
                                    external=external)
-        self._execute(stmt)
+        self._execute_on_table(stmt, name, database=database)
         return self._wrap_new_table(name, database, persist)
 
     def delimited_file(self, hdfs_dir, schema, name=None, database=None,
@@ -1316,7 +1378,7 @@ class ImpalaClient(SQLClient):
                                         na_rep=na_rep,
                                         lineterminator=lineterminator,
                                         escapechar=escapechar)
-        self._execute(stmt)
+        self._execute_on_table(stmt, name, database=database)
         return self._wrap_new_table(name, database, persist)
 
     def parquet_file(self, hdfs_dir, schema=None, name=None, database=None,
@@ -1376,7 +1438,7 @@ class ImpalaClient(SQLClient):
                                       example_table=like_table,
                                       external=external,
                                       can_exist=False)
-        self._execute(stmt)
+        self._execute_on_table(stmt, name, database=database)
         return self._wrap_new_table(name, database, persist)
 
     def _get_concrete_table_path(self, name, database, persist=False):
@@ -1418,7 +1480,7 @@ class ImpalaClient(SQLClient):
         set_card = ("alter table {0} set tblproperties('numRows'='{1}', "
                     "'STATS_GENERATED_VIA_STATS_TASK' = 'true')"
                     .format(qualified_name, cardinality))
-        self._execute(set_card)
+        self._execute_on_table(set_card, qualified_name)
 
         self._temp_objects[id(t)] = t
 
@@ -1495,7 +1557,7 @@ class ImpalaClient(SQLClient):
         """
         statement = ddl.DropTable(table_name, database=database,
                                   must_exist=not force)
-        self._execute(statement)
+        self._execute_on_table(statement, table_name, database=database)
 
     def truncate_table(self, table_name, database=None):
         """
@@ -1507,7 +1569,7 @@ class ImpalaClient(SQLClient):
         database : string, default None (optional)
         """
         statement = ddl.TruncateTable(table_name, database=database)
-        self._execute(statement)
+        self._execute_on_table(statement, table_name, database=database)
 
     def drop_table_or_view(self, name, database=None, force=False):
         """
@@ -1540,7 +1602,7 @@ class ImpalaClient(SQLClient):
         >>> con.cache_table('my_table', database=db, pool=pool)  # noqa: E501 # doctest: +SKIP
         """
         statement = ddl.CacheTable(table_name, database=database, pool=pool)
-        self._execute(statement)
+        self._execute_on_table(statement, table_name, database=database)
 
     def _get_table_schema(self, tname):
         return self.get_schema(tname)
@@ -1770,7 +1832,7 @@ class ImpalaClient(SQLClient):
         cmd = 'COMPUTE {0}STATS'.format(maybe_inc)
 
         stmt = self._table_command(cmd, name, database=database)
-        self._execute(stmt)
+        self._execute_on_table(stmt, name, database=database)
 
     def invalidate_metadata(self, name=None, database=None):
         """
@@ -1786,7 +1848,12 @@ class ImpalaClient(SQLClient):
         stmt = 'INVALIDATE METADATA'
         if name is not None:
             stmt = self._table_command(stmt, name, database=database)
-        self._execute(stmt)
+            self._execute_on_table(stmt, name, database=database)
+        else:
+            try:
+                self._execute(stmt)
+            finally:
+                self.metadata_cache.clear()
 
     def refresh(self, name, database=None):
         """
@@ -1802,7 +1869,7 @@ class ImpalaClient(SQLClient):
         """
         # TODO(wesm): can this statement be cancelled?
         stmt = self._table_command('REFRESH', name, database=database)
-        self._execute(stmt)
+        self._execute_on_table(stmt, name, database=database)
 
     def describe_formatted(self, name, database=None):
         """
@@ -1815,6 +1882,12 @@ class ImpalaClient(SQLClient):
           Table name. Can be fully qualified (with database)
         database : string, optional
         """
+        return self.metadata_cache.get(
+            ('describe_formatted',) + self._table_key(name, database=database),
+            lambda: self._describe_formatted(name, database=database)
+        )
+
+    def _describe_formatted(self, name, database=None):
         from ibis.impala.metadata import parse_metadata
 
         stmt = self._table_command('DESCRIBE FORMATTED',
@@ -1870,6 +1943,16 @@ class ImpalaClient(SQLClient):
             result = adapter(result)
         return result
 
+    def _execute_on_table(self, stmt, name, database=None):
+        """
+        Execute a statement that changes a table, forgetting the cached
+        metadata of the table
+        """
+        try:
+            return self._execute(stmt)
+        finally:
+            self._invalidate_table(name, database=database)
+
     def _table_command(self, cmd, name, database=None):
         qualified_name = self._fully_qualified_name(name, database)
         return '{0} {1}'.format(cmd, qualified_name)
@@ -1898,8 +1981,9 @@ class ImpalaClient(SQLClient):
         ----------
         df : DataFrame
         path : string
-          Absolute output path
-        format : {'csv'}, default 'csv'
+          Absolute output path. For 'parquet', the directory that the Parquet
+          files are written to, which is created if it does not exist
+        format : {'csv', 'parquet'}, default 'csv'
         async : boolean, default False
           Not yet supported
 
@@ -1913,6 +1997,11 @@ class ImpalaClient(SQLClient):
             raise NotImplementedError
 
         writer = DataFrameWriter(self, df)
+        if format == 'parquet':
+            self.hdfs.mkdir(path)
+            return writer.write_parquet(path)
+        elif format != 'csv':
+            raise ValueError('Invalid format {0!r}'.format(format))
         return writer.write_csv(path)
 
 
@@ -1948,6 +2037,16 @@ class ImpalaTemporaryTable(ops.DatabaseTable):
             pass
 
 
+_query_re = re.compile(
+    r'^\s*(select|with|show|describe|explain|values)\b', re.IGNORECASE
+)
+
+
+def _is_query(statement):
+    return (isinstance(statement, six.string_types) and
+            _query_re.match(statement) is not None)
+
+
 def _validate_compatible(from_schema, to_schema):
     if set(from_schema.names) != set(to_schema.names):
         raise com.IbisInputError('Schemas have different names')
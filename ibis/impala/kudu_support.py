@@ -160,7 +160,8 @@ class KuduImpalaInterface(object):
                                    database=database,
                                    can_exist=False)
 
-        self.impala_client._execute(stmt)
+        self.impala_client._execute_on_table(stmt, impala_name,
+                                             database=database)
 
     def table(self, kudu_name, name=None, database=None, persist=False,
               external=True):
@@ -0,0 +1,108 @@
+# Copyright 2014 Cloudera Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from collections import namedtuple
+from timeit import default_timer
+
+from ibis.config import options
+
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'currsize'))
+
+
+class MetadataCache(object):
+
+    """
+    Cache of the results of metadata statements (SHOW TABLES, DESCRIBE, ...)
+    issued by an ImpalaClient. Entries expire options.impala.metadata_ttl
+    seconds after they are computed; nothing is cached if the option is None
+    or 0.
+
+    Entries are keyed by (kind, database, table) tuples with lower case
+    database and table names, so that the entries of a table can be
+    invalidated when Ibis changes it. Listings of the tables of a database
+    use the key ('tables', database, like).
+    """
+
+    def __init__(self, timer=default_timer):
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        """
+        Return the cached value for `key`, or the result of calling
+        `compute()`, which is cached if caching is enabled.
+        """
+        ttl = options.impala.metadata_ttl
+        if not ttl:
+            return compute()
+
+        now = self.timer()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = now + ttl, value
+        return value
+
+    def invalidate_table(self, database, name):
+        """
+        Forget the entries of a table, and the table listings of its database
+        """
+        database, name = database.lower(), name.lower()
+        self._discard(
+            lambda kind, db, table: db == database and (
+                table == name or kind == 'tables'
+            )
+        )
+
+    def invalidate_database(self, database):
+        """
+        Forget the entries of all tables of a database
+        """
+        database = database.lower()
+        self._discard(lambda kind, db, table: db == database)
+
+    def clear(self):
+        """
+        Forget all entries, keeping the hit and miss counts
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def cache_info(self):
+        """
+        Return the number of hits and misses and the number of entries
+
+        Returns
+        -------
+        info : CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, len(self._entries))
+
+    def _discard(self, predicate):
+        with self._lock:
+            for key in [key for key in self._entries if predicate(*key)]:
+                del self._entries[key]
@@ -13,13 +13,45 @@
 # limitations under the License.
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from posixpath import join as pjoin
 
+import numpy as np
+import pandas as pd
+
 import ibis.util as util
 import ibis.common as com
+import ibis.expr.datatypes as dt
 import ibis.expr.schema as sch
+from ibis.compat import BytesIO, unicode_type
 from ibis.config import options
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+
+if pa is not None:
+    _arrow_types = {
+        dt.Boolean: pa.bool_(),
+        dt.Int8: pa.int8(),
+        dt.Int16: pa.int16(),
+        dt.Int32: pa.int32(),
+        dt.Int64: pa.int64(),
+        dt.UInt8: pa.uint8(),
+        dt.UInt16: pa.uint16(),
+        dt.UInt32: pa.uint32(),
+        dt.UInt64: pa.uint64(),
+        dt.Halffloat: pa.float32(),
+        dt.Float: pa.float32(),
+        dt.Double: pa.float64(),
+        dt.String: pa.string(),
+        dt.Date: pa.date32(),
+        dt.Timestamp: pa.timestamp('ns'),
+    }
+
 
 class DataFrameWriter(object):
 
@@ -36,21 +68,102 @@ class DataFrameWriter(object):
 
         self.temp_hdfs_dirs = []
 
-    def write_temp_csv(self):
+    def _make_temp_dir(self):
         temp_hdfs_dir = pjoin(options.impala.temp_hdfs_path,
                               'pandas_{0}'.format(util.guid()))
         self.hdfs.mkdir(temp_hdfs_dir)
 
         # Keep track of the temporary HDFS file
         self.temp_hdfs_dirs.append(temp_hdfs_dir)
+        return temp_hdfs_dir
 
-        # Write the file to HDFS
-        hdfs_path = pjoin(temp_hdfs_dir, '0.csv')
-
-        self.write_csv(hdfs_path)
+    def write_temp_csv(self):
+        temp_hdfs_dir = self._make_temp_dir()
+        self.write_csv_parts(temp_hdfs_dir)
+        return temp_hdfs_dir
 
+    def write_temp_parquet(self):
+        temp_hdfs_dir = self._make_temp_dir()
+        self.write_parquet(temp_hdfs_dir)
         return temp_hdfs_dir
 
+    def write_csv_parts(self, hdfs_dir, part_rows=None, threads=None):
+        """
+        Write the DataFrame to HDFS as delimited text files of at most
+        `part_rows` rows each, in the format expected by `delimited_table`.
+        Files are serialized in memory and uploaded by `threads` worker
+        threads, so no local temporary file is written.
+
+        Parameters
+        ----------
+        hdfs_dir : string
+          Existing HDFS directory to write the files to
+        part_rows : int, default options.impala.upload_part_rows
+        threads : int, default options.impala.upload_threads
+
+        Returns
+        -------
+        paths : list of strings
+          The HDFS paths of the written files
+        """
+        return self._write_parts(hdfs_dir, 'csv', _to_csv_bytes,
+                                 part_rows=part_rows, threads=threads)
+
+    def write_parquet(self, hdfs_dir, part_rows=None, threads=None):
+        """
+        Write the DataFrame to HDFS as Parquet files of at most `part_rows`
+        rows each. Files are serialized in memory and uploaded by `threads`
+        worker threads, so no local temporary file is written.
+
+        Parameters
+        ----------
+        hdfs_dir : string
+          Existing HDFS directory to write the files to
+        part_rows : int, default options.impala.upload_part_rows
+        threads : int, default options.impala.upload_threads
+
+        Returns
+        -------
+        paths : list of strings
+          The HDFS paths of the written files
+        """
+        if pq is None:
+            raise com.IbisError('Writing Parquet files requires pyarrow')
+
+        schema = self.get_schema()
+
+        def to_parquet_bytes(part):
+            buf = BytesIO()
+            pq.write_table(_to_arrow_table(part, schema), buf,
+                           use_deprecated_int96_timestamps=True)
+            return buf.getvalue()
+
+        return self._write_parts(hdfs_dir, 'parq', to_parquet_bytes,
+                                 part_rows=part_rows, threads=threads)
+
+    def _write_parts(self, hdfs_dir, extension, serialize, part_rows=None,
+                     threads=None):
+        part_rows = part_rows or options.impala.upload_part_rows
+        threads = threads or options.impala.upload_threads
+
+        starts = range(0, max(len(self.df), 1), part_rows)
+
+        def write_part(args):
+            i, start = args
+            part = self.df.iloc[start:start + part_rows]
+            path = pjoin(hdfs_dir, '{0}.{1}'.format(i, extension))
+
+            buf = BytesIO(serialize(part))
+
+            if options.verbose:
+                util.log('Writing {0} to: {1}'.format(extension, path))
+
+            self.hdfs.put(path, buf)
+            return path
+
+        with ThreadPoolExecutor(min(threads, len(starts))) as executor:
+            return list(executor.map(write_part, enumerate(starts)))
+
     def write_csv(self, path):
         import csv
 
@@ -99,6 +212,15 @@ class DataFrameWriter(object):
                                           external=True,
                                           persist=False)
 
+    def parquet_table(self, parquet_dir, name=None, database=None):
+        temp_parquet_name = 'ibis_tmp_pandas_{0}'.format(util.guid())
+        return self.client.parquet_file(parquet_dir,
+                                        schema=self.get_schema(),
+                                        name=temp_parquet_name,
+                                        database=database,
+                                        external=True,
+                                        persist=False)
+
     def __del__(self):
         try:
             self.cleanup()
@@ -112,7 +234,74 @@ class DataFrameWriter(object):
         self.csv_dir = None
 
 
+def _to_csv_bytes(df):
+    import csv
+
+    data = df.to_csv(None, header=False, index=False,
+                     sep=',',
+                     quoting=csv.QUOTE_NONE,
+                     escapechar='\\',
+                     na_rep='#NULL')
+    if isinstance(data, unicode_type):
+        data = data.encode('utf-8')
+    return data
+
+
+def _to_arrow_table(df, schema):
+    """Convert `df` to a pyarrow Table whose column types follow the ibis
+    `schema`, so that every part file of a DataFrame has the same types even
+    when a part has only null values in a column.
+    """
+    arrays = []
+    for name, ibis_type in zip(schema.names, schema.types):
+        values = df[name]
+        if isinstance(ibis_type, dt.Category):
+            categories = values.cat.categories
+            values = values.astype(categories.dtype)
+            ibis_type = sch.infer(
+                pd.DataFrame({name: categories})
+            )[name]
+        if isinstance(ibis_type, dt.Timestamp) and ibis_type.timezone:
+            values = values.dt.tz_convert('UTC').dt.tz_localize(None)
+        elif isinstance(ibis_type, dt.Date) and values.dtype.kind == 'M':
+            values = values.dt.date
+        elif isinstance(ibis_type, dt.Halffloat):
+            # Parquet has no half precision floating point type
+            values = values.astype(np.float32)
+        arrays.append(
+            pa.Array.from_pandas(values, type=_arrow_type(ibis_type))
+        )
+    return pa.Table.from_arrays(arrays, schema.names)
+
+
+def _arrow_type(ibis_type):
+    if isinstance(ibis_type, dt.Decimal):
+        return pa.decimal128(ibis_type.precision, ibis_type.scale)
+    try:
+        return _arrow_types[type(ibis_type)]
+    except KeyError:
+        raise com.UnsupportedBackendType(
+            'Columns of type {0} cannot be written to Parquet'.format(
+                ibis_type
+            )
+        )
+
+
 def write_temp_dataframe(client, df):
+    """
+    Upload `df` to a temporary HDFS directory and expose it as a temporary
+    Impala table. The data is written as Parquet files if pyarrow is
+    installed and `options.impala.upload_format` is 'parquet', and as
+    delimited text files otherwise.
+
+    Returns
+    -------
+    (writer, table) : (DataFrameWriter, ImpalaTable)
+      The table's data is deleted when the writer is garbage collected
+    """
     writer = DataFrameWriter(client, df)
+    if options.impala.upload_format == 'parquet' and pq is not None:
+        path = writer.write_temp_parquet()
+        return writer, writer.parquet_table(path)
     path = writer.write_temp_csv()
     return writer, writer.delimited_table(path)
@@ -1,5 +1,8 @@
+import threading
 import unittest
 
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 
@@ -18,6 +21,8 @@ pytest.importorskip('sqlalchemy')
 pytest.importorskip('hdfs')
 pytest.importorskip('impala.dbapi')
 
+from ibis.impala.client import ImpalaCursor  # noqa: E402
+
 
 ENV = IbisTestEnv()
 
@@ -378,3 +383,52 @@ LIMIT 10"""
         con.set_options({'request_pool': 'baz.quux'})
         result = dict(con.raw_sql('set', True).fetchall())
         assert result['REQUEST_POOL'] == 'baz.quux'
+
+
+class ExecutingCursor(object):
+    """An impyla cursor whose operation never finishes executing"""
+
+    def __init__(self):
+        self.polled = threading.Event()
+        self.cancelled = threading.Event()
+
+    def execute_async(self, stmt):
+        pass
+
+    def status(self):
+        self.polled.set()
+        return 'RUNNING_STATE'
+
+    def _op_state_is_error(self, state):
+        return False
+
+    def _op_state_is_executing(self, state):
+        return True
+
+    def cancel_operation(self):
+        self.cancelled.set()
+
+    def close(self):
+        pass
+
+
+class FakeConnection(object):
+
+    def __init__(self):
+        self.connection_pool_size = 0
+        self.lock = threading.Lock()
+
+
+def test_cancel_running_query():
+    impyla_cursor = ExecutingCursor()
+    cursor = ImpalaCursor(impyla_cursor, FakeConnection(), None, None, {})
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = ibis.client._submit(executor, cursor.execute, 'SELECT 1')
+        assert impyla_cursor.polled.wait(timeout=10)
+        assert not future.cancel()
+
+        with pytest.raises(CancelledError):
+            future.result(timeout=10)
+
+    assert impyla_cursor.cancelled.is_set()
@@ -0,0 +1,168 @@
+import pytest
+
+pytest.importorskip('hdfs')
+pytest.importorskip('impala.dbapi')
+
+import ibis  # noqa: E402
+import ibis.expr.schema as sch  # noqa: E402
+
+from ibis.impala.client import ImpalaClient  # noqa: E402
+from ibis.impala.metadata_cache import CacheInfo, MetadataCache  # noqa: E402
+from ibis.sql.compiler import DDL, DML  # noqa: E402
+
+
+class FakeCursor(object):
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+    def release(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class FakeImpalaConnection(object):
+
+    """Records the statements executed and answers the metadata statements
+    issued by ImpalaClient"""
+
+    database = 'default'
+
+    def __init__(self):
+        self.statements = []
+        self.tables = ['functional', 'alltypes']
+
+    def _rows(self, statement):
+        self.statements.append(statement)
+        if statement.startswith('SHOW DATABASES'):
+            return [('__ibis_tmp',)]
+        if statement.startswith('SHOW TABLES'):
+            return [(name,) for name in self.tables]
+        if statement.startswith('DESCRIBE'):
+            return [('key', 'string', ''), ('value', 'double', '')]
+        return []
+
+    def execute(self, query, **kwargs):
+        if isinstance(query, (DDL, DML)):
+            query = query.compile()
+        return FakeCursor(self._rows(query))
+
+    def fetchall(self, query):
+        return self._rows(query)
+
+    def count(self, prefix):
+        return sum(statement.startswith(prefix)
+                   for statement in self.statements)
+
+
+@pytest.fixture
+def con():
+    return ImpalaClient(FakeImpalaConnection())
+
+
+@pytest.fixture
+def metadata_ttl():
+    with ibis.config.option_context('impala.metadata_ttl', 60):
+        yield
+
+
+def test_cache_disabled_by_default(con):
+    con.get_schema('alltypes')
+    con.get_schema('alltypes')
+    assert con.con.count('DESCRIBE') == 2
+    assert con.metadata_cache.cache_info() == CacheInfo(0, 0, 0)
+
+
+def test_get_schema_cached(con, metadata_ttl):
+    expected = sch.Schema(['key', 'value'], ['string', 'double'])
+    assert con.get_schema('alltypes').equals(expected)
+
+    # the same table, named differently
+    assert con.get_schema('ALLTYPES', database='default').equals(expected)
+    assert con.table('default.`alltypes`').schema().equals(expected)
+
+    assert con.con.count('DESCRIBE') == 1
+    assert con.metadata_cache.cache_info() == CacheInfo(2, 1, 1)
+
+
+def test_list_tables_cached(con, metadata_ttl):
+    assert con.exists_table('alltypes')
+    assert con.exists_table('alltypes')
+    assert con.list_tables() == ['functional', 'alltypes']
+    assert con.list_tables() == ['functional', 'alltypes']
+    assert con.con.count('SHOW TABLES') == 2
+
+
+def test_ddl_invalidates_table(con, metadata_ttl):
+    con.get_schema('alltypes')
+    con.get_schema('functional')
+    con.list_tables()
+
+    con.drop_table('alltypes')
+
+    con.get_schema('alltypes')
+    con.get_schema('functional')
+    con.list_tables()
+    assert con.con.count('DESCRIBE') == 3
+    assert con.con.count('SHOW TABLES') == 2
+
+
+def test_table_ddl_invalidates_table(con, metadata_ttl):
+    t = con.table('alltypes')
+    t.alter(tbl_properties={'foo': 'bar'})
+    con.get_schema('alltypes')
+    assert con.con.count('DESCRIBE') == 2
+
+
+def test_raw_sql_invalidates(con, metadata_ttl):
+    con.get_schema('alltypes')
+    con.raw_sql('SELECT 1')
+    con.get_schema('alltypes')
+    assert con.con.count('DESCRIBE') == 1
+
+    con.raw_sql('ALTER TABLE alltypes ADD COLUMNS (x int)')
+    con.get_schema('alltypes')
+    assert con.con.count('DESCRIBE') == 2
+
+
+def test_invalidate_metadata_clears(con, metadata_ttl):
+    con.get_schema('alltypes')
+    con.invalidate_metadata()
+    assert con.metadata_cache.cache_info().currsize == 0
+
+
+def test_metadata_cache_expires(metadata_ttl):
+    now = [0.0]
+    cache = MetadataCache(timer=lambda: now[0])
+    values = iter(range(3))
+
+    def get():
+        return cache.get(('schema', 'db', 'table'), lambda: next(values))
+
+    assert get() == 0
+    now[0] = 59.0
+    assert get() == 0
+    now[0] = 61.0
+    assert get() == 1
+    assert cache.cache_info() == CacheInfo(1, 2, 1)
+
+
+def test_metadata_cache_invalidate_database(metadata_ttl):
+    cache = MetadataCache()
+    cache.get(('schema', 'a', 'x'), lambda: 1)
+    cache.get(('tables', 'a', None), lambda: 1)
+    cache.get(('schema', 'b', 'x'), lambda: 1)
+
+    cache.invalidate_table('A', 'y')
+    assert cache.cache_info().currsize == 2
+
+    cache.invalidate_database('a')
+    assert cache.cache_info().currsize == 1
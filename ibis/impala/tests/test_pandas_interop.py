@@ -22,6 +22,7 @@ from pandas.util.testing import assert_frame_equal
 import pandas as pd
 
 import ibis
+import ibis.common as com
 import ibis.expr.datatypes as dt
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
@@ -239,6 +240,16 @@ class TestPandasInterop(ImpalaE2E, unittest.TestCase):
     def test_round_trip_exhaustive(self):
         self._check_roundtrip(exhaustive_df)
 
+    def test_round_trip_exhaustive_parquet(self):
+        pytest.importorskip('pyarrow')
+
+        writer = DataFrameWriter(self.con, exhaustive_df)
+        path = writer.write_temp_parquet()
+
+        table = writer.parquet_table(path)
+        df2 = table.execute()
+        assert_frame_equal(df2, exhaustive_df)
+
     def _check_roundtrip(self, df):
         writer = DataFrameWriter(self.con, df)
         path = writer.write_temp_csv()
@@ -248,6 +259,100 @@ class TestPandasInterop(ImpalaE2E, unittest.TestCase):
         assert_frame_equal(df2, df)
 
 
+class FakeHDFS(object):
+
+    def __init__(self):
+        self.files = {}
+
+    def put(self, hdfs_path, resource, **kwargs):
+        self.files[hdfs_path] = resource.read()
+        return hdfs_path
+
+
+class FakeClient(object):
+
+    def __init__(self):
+        self.hdfs = FakeHDFS()
+
+
+def test_write_csv_parts():
+    client = FakeClient()
+    writer = DataFrameWriter(client, exhaustive_df)
+    paths = writer.write_csv_parts('/tmp/ibis/parts', part_rows=4, threads=2)
+
+    assert paths == ['/tmp/ibis/parts/{0}.csv'.format(i) for i in range(3)]
+
+    expected = DataFrameWriter(FakeClient(), exhaustive_df)
+    expected.write_csv_parts('/tmp/ibis/whole', part_rows=len(exhaustive_df))
+    data = b''.join(client.hdfs.files[path] for path in paths)
+    assert data == expected.hdfs.files['/tmp/ibis/whole/0.csv']
+    assert data.count(b'\n') == len(exhaustive_df)
+    assert b'#NULL' in data
+
+
+def test_write_parquet_parts():
+    pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+    from ibis.compat import BytesIO
+
+    client = FakeClient()
+    writer = DataFrameWriter(client, exhaustive_df)
+    paths = writer.write_parquet('/tmp/ibis/parts', part_rows=3, threads=2)
+
+    assert paths == ['/tmp/ibis/parts/{0}.parq'.format(i) for i in range(4)]
+    assert sorted(client.hdfs.files) == sorted(paths)
+
+    parts = [
+        pq.read_table(BytesIO(client.hdfs.files[path])) for path in paths
+    ]
+
+    # every part has the same schema, even the last one which has no null
+    # strings
+    assert all(part.schema.equals(parts[0].schema) for part in parts)
+
+    result = pd.concat(
+        [part.to_pandas() for part in parts], ignore_index=True
+    )
+    assert_frame_equal(result, exhaustive_df, check_dtype=False)
+
+
+def test_write_parquet_parts_types():
+    pytest.importorskip('pyarrow')
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from ibis.compat import BytesIO
+
+    df = pd.DataFrame({
+        'category': pd.Categorical(['a', 'b', None, None]),
+        'uint8': np.array([1, 2, 3, 4], dtype='uint8'),
+        'float16': np.array([1, 2, None, None], dtype='float16'),
+        'timestamp': pd.to_datetime(['2017-01-01', None, None, None]),
+    }, columns=['category', 'uint8', 'float16', 'timestamp'])
+
+    client = FakeClient()
+    writer = DataFrameWriter(client, df)
+    paths = writer.write_parquet('/tmp/ibis/parts', part_rows=2)
+
+    # the second part has only null values in all but one column
+    schemas = [
+        pq.read_table(BytesIO(client.hdfs.files[path])).schema
+        for path in paths
+    ]
+    assert schemas[1].equals(schemas[0])
+    assert [field.type for field in schemas[0]] == [
+        pa.string(), pa.uint8(), pa.float32(), pa.timestamp('ns')
+    ]
+
+
+def test_write_parquet_unsupported_type():
+    pytest.importorskip('pyarrow')
+
+    df = pd.DataFrame({'interval': pd.to_timedelta([1, 2], unit='s')})
+    writer = DataFrameWriter(FakeClient(), df)
+    with pytest.raises(com.UnsupportedBackendType):
+        writer.write_parquet('/tmp/ibis/parts')
+
+
 def test_timestamp_with_timezone():
     df = pd.DataFrame({
         'A': pd.date_range('20130101', periods=3, tz='US/Eastern')
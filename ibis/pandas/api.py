@@ -6,9 +6,10 @@ import toolz
 from ibis.pandas.client import PandasClient
 from ibis.pandas.decimal import execute_node  # noqa: F401
 from ibis.pandas.execution import execute  # noqa: F401
+from ibis.pandas.profiling import profile  # noqa: F401
 
 
-__all__ = 'connect', 'execute', 'dialect'
+__all__ = 'connect', 'execute', 'dialect', 'profile'
 
 
 def connect(dictionary):
@@ -14,6 +14,7 @@ import ibis.expr.schema as sch
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 
+from ibis.config import options
 from ibis.compat import PY2, DatetimeTZDtype, CategoricalDtype, parse_version
 
 
@@ -277,6 +278,92 @@ def ibis_schema_apply_to(schema, df):
     return df
 
 
+def encode_low_cardinality_strings(df, threshold=None):
+    """Dictionary encode the low cardinality string columns of `df`.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    threshold : Optional[float]
+        The maximum ratio of distinct values to rows for a string column to be
+        encoded. Defaults to ``ibis.options.pandas.categorical_threshold``.
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        `df` with every low cardinality string column replaced by a
+        :class:`pandas.Categorical` with lexically sorted categories, or `df`
+        itself if no columns were encoded.
+    """
+    if threshold is None:
+        threshold = options.pandas.categorical_threshold
+
+    if threshold is None or df.empty:
+        return df
+
+    encoded = {}
+    max_categories = threshold * len(df)
+    for column_name, column in df.iteritems():
+        if column.dtype != np.object_:
+            continue
+
+        try:
+            codes, categories = pd.factorize(column, sort=True)
+        except TypeError:
+            # unhashable or unorderable values such as lists or mixed types
+            continue
+
+        if len(categories) > max_categories:
+            continue
+
+        if infer_pandas_dtype(categories) not in {'string', 'unicode'}:
+            continue
+
+        encoded[column_name] = pd.Categorical.from_codes(codes, categories)
+
+    if not encoded:
+        return df
+    return df.assign(**encoded)
+
+
+def decode_low_cardinality_strings(expr, result):
+    """Decode the dictionary encoded string columns of `result`, the result
+    of executing `expr`, back to object columns.
+
+    Parameters
+    ----------
+    expr : ibis.expr.types.Expr
+    result : object
+
+    Returns
+    -------
+    result : object
+        `result` itself if it has no dictionary encoded string columns.
+    """
+    if isinstance(result, pd.Series):
+        if (
+            isinstance(expr, ir.StringColumn) and
+            isinstance(result.dtype, CategoricalDtype)
+        ):
+            return result.astype(result.cat.categories.dtype)
+    elif (
+        isinstance(expr, ir.TableExpr) and expr._is_materialized() and
+        isinstance(result, pd.DataFrame)
+    ):
+        schema = expr.schema()
+        names = [
+            name for name, dtype in zip(schema.names, schema.types)
+            if isinstance(dtype, dt.String) and name in result.columns and
+            isinstance(result[name].dtype, CategoricalDtype)
+        ]
+        if names:
+            result = result.copy(deep=False)
+            for name in names:
+                column = result[name]
+                result[name] = column.astype(column.cat.categories.dtype)
+    return result
+
+
 dt.DataType.to_pandas = ibis_dtype_to_pandas
 sch.Schema.to_pandas = ibis_schema_to_pandas
 sch.Schema.apply_to = ibis_schema_apply_to
@@ -292,12 +379,38 @@ class PandasClient(client.Client):
 
     def __init__(self, dictionary):
         self.dictionary = dictionary
+        self._encoded_tables = {}
 
     def table(self, name, schema=None):
         df = self.dictionary[name]
         schema = sch.infer(df, schema=schema)
         return PandasTable(name, schema, self).to_expr()
 
+    def load_table(self, name):
+        """Return the DataFrame bound to `name`, dictionary encoding its low
+        cardinality string columns if
+        ``ibis.options.pandas.categorical_threshold`` is set.
+
+        Encoded frames are cached until either the DataFrame bound to `name`
+        or the threshold changes.
+        """
+        df = self.dictionary[name]
+        threshold = options.pandas.categorical_threshold
+        if threshold is None:
+            return df
+
+        try:
+            source, cached_threshold, encoded = self._encoded_tables[name]
+        except KeyError:
+            pass
+        else:
+            if source is df and cached_threshold == threshold:
+                return encoded
+
+        encoded = encode_low_cardinality_strings(df, threshold=threshold)
+        self._encoded_tables[name] = df, threshold, encoded
+        return encoded
+
     def execute(self, query, params=None, limit='default', async=False):
         from ibis.pandas.execution import execute
 
@@ -313,7 +426,8 @@ class PandasClient(client.Client):
             )
 
         assert isinstance(query, ir.Expr)
-        return execute(query, params=params)
+        result = execute(query, params=params)
+        return decode_low_cardinality_strings(query, result)
 
     def compile(self, expr, *args, **kwargs):
         return expr
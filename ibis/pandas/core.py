@@ -84,6 +84,7 @@ import datetime
 import six
 
 import numpy as np
+import pandas as pd
 
 import toolz
 
@@ -100,8 +101,11 @@ from ibis.client import find_backends
 
 import ibis.pandas.aggcontext as agg_ctx
 from ibis.pandas.dispatch import (
-     execute_node, pre_execute, post_execute, execute_literal
+     execute_node, pre_execute, post_execute, execute_literal,
+     pre_execute_default, post_execute_default
 )
+from ibis.pandas.frame import LazyFrame
+from ibis.pandas.profiling import call_rule
 
 
 integer_types = six.integer_types + (np.integer,)
@@ -149,8 +153,9 @@ def execute_with_scope(expr, scope, context=None, **kwargs):
 
     pre_executed_scope = map(
         functools.partial(
-            pre_execute, op, scope=scope, context=context, **kwargs),
-        clients
+            call_rule, 'pre_execute', pre_execute, pre_execute, op,
+            scope=scope, context=context, **kwargs),
+        pre_executing_clients(op, clients)
     )
     new_scope = toolz.merge(scope, *pre_executed_scope)
     result = execute_until_in_scope(
@@ -172,6 +177,8 @@ def execute_with_scope(expr, scope, context=None, **kwargs):
         **kwargs
     )
 
+    if isinstance(result, LazyFrame):
+        return result.to_frame()
     return result
 
 
@@ -201,8 +208,13 @@ def execute_until_in_scope(
 
     new_scope = execute_bottom_up(
         expr, scope, context=context, post_execute_=post_execute_, **kwargs)
-    pre_executor = functools.partial(pre_execute, op, scope=scope, **kwargs)
-    new_scope = toolz.merge(new_scope, *map(pre_executor, clients))
+    pre_executor = functools.partial(
+        call_rule, 'pre_execute', pre_execute, pre_execute, op,
+        scope=scope, **kwargs
+    )
+    new_scope = toolz.merge(
+        new_scope, *map(pre_executor, pre_executing_clients(op, clients))
+    )
     return execute_until_in_scope(
         expr, new_scope,
         context=context, clients=clients, post_execute_=post_execute_,
@@ -293,11 +305,90 @@ def execute_bottom_up(expr, scope, context=None, post_execute_=None, **kwargs):
         new_scope[arg.op()] if hasattr(arg, 'op') else arg
         for arg in computable_args
     ]
-    result = execute_node(op, *data, scope=scope, context=context, **kwargs)
-    computed = post_execute_(op, result)
+    if any(isinstance(arg, LazyFrame) for arg in data):
+        data = materialize_lazy_frames(execute_node, op, data)
+    result = call_rule(
+        'execute_node', execute_node, execute_node, op, *data,
+        scope=scope, context=context, **kwargs
+    )
+    if isinstance(result, LazyFrame):
+        result, = materialize_lazy_frames(post_execute, op, [result])
+    if post_execute.dispatch(type(op), type(result)) is post_execute_default:
+        # skip the call to the default rule, which returns result unchanged
+        return {op: result}
+    computed = call_rule(
+        'post_execute', post_execute, post_execute_, op, result
+    )
     return {op: computed}
 
 
+def pre_executing_clients(op, clients):
+    """Return the clients in `clients` with a ``pre_execute`` rule for `op`
+    other than the default rule, which returns an empty scope.
+    """
+    op_type = type(op)
+    return [
+        client for client in clients
+        if pre_execute.dispatch(op_type, type(client)) is not
+        pre_execute_default
+    ]
+
+
+# Whether the rule a dispatcher resolves for a signature containing
+# LazyFrames is also the rule it resolves when DataFrames are passed instead
+_lazy_frame_rules = {}
+
+
+def accepts_lazy_frames(dispatcher, types):
+    """Can the rule `dispatcher` resolves for `types` be given
+    :class:`~ibis.pandas.frame.LazyFrame` arguments?
+
+    This is the case if the same rule would be called with DataFrames, such
+    as rules registered for both types and rules that accept any object.
+    """
+    key = dispatcher.name, types
+    version = dispatcher.version
+    try:
+        cached_version, accepted = _lazy_frame_rules[key]
+    except KeyError:
+        pass
+    else:
+        if cached_version == version:
+            return accepted
+
+    frame_types = tuple(
+        pd.DataFrame if issubclass(typ, LazyFrame) else typ for typ in types
+    )
+    rule = dispatcher.dispatch(*types)
+    accepted = rule is not None and rule is dispatcher.dispatch(*frame_types)
+    _lazy_frame_rules[key] = version, accepted
+    return accepted
+
+
+def materialize_lazy_frames(dispatcher, op, data):
+    """Convert the :class:`~ibis.pandas.frame.LazyFrame` instances in `data`
+    to DataFrames, unless the rule of `dispatcher` for `op` and `data` accepts
+    them.
+
+    Parameters
+    ----------
+    dispatcher : multipledispatch.Dispatcher
+    op : ibis.expr.operations.Node
+    data : List[object]
+
+    Returns
+    -------
+    data : List[object]
+    """
+    types = (type(op),) + tuple(map(type, data))
+    if accepts_lazy_frames(dispatcher, types):
+        return data
+    return [
+        arg.to_frame() if isinstance(arg, LazyFrame) else arg
+        for arg in data
+    ]
+
+
 def execute(expr, params=None, scope=None, context=None, **kwargs):
     """Execute an expression against data that are bound to it. If no data
     are bound, raise an Exception.
@@ -1,8 +1,13 @@
 from __future__ import absolute_import
 
+import collections
 import contextlib
 
 from multipledispatch import Dispatcher, halt_ordering, restart_ordering
+from multipledispatch.conflict import ambiguous, edge
+from multipledispatch.dispatcher import (
+    MDNotImplementedError, ambiguity_warn, str_signature
+)
 
 import pandas as pd
 
@@ -11,8 +16,146 @@ import ibis.expr.operations as ops
 import ibis.expr.datatypes as dt
 
 
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ('hits', 'misses', 'currsize')
+)
+
+
+# Whether this version of multipledispatch orders signatures lazily, on the
+# first dispatch after a registration
+_LAZY_ORDERING = isinstance(getattr(Dispatcher, 'ordering', None), property)
+
+
+class ExecutionDispatcher(Dispatcher):
+    """A :class:`~multipledispatch.Dispatcher` for the rules called on every
+    node of an expression during execution.
+
+    Resolved rules are cached per signature, like in the base class, but
+
+    * cache hits and misses are counted, see :meth:`cache_info`
+    * :meth:`dispatch` uses the cache as well
+    * registering a rule only forgets the resolutions it can change, and
+      inserts the rule into the existing ordering of the rules instead of
+      recomputing it, which takes a noticeable amount of time for
+      ``execute_node``
+    * :attr:`version` is incremented by every registration, so that caches
+      derived from the resolved rules can tell when they are stale
+    """
+
+    __slots__ = 'hits', 'misses', 'version'
+
+    def __init__(self, name, doc=None):
+        super(ExecutionDispatcher, self).__init__(name, doc=doc)
+        self.hits = self.misses = 0
+        self.version = 0
+
+    def __call__(self, *args, **kwargs):
+        types = tuple([type(arg) for arg in args])
+        func = self.dispatch(*types)
+        if func is None:
+            raise NotImplementedError(
+                'Could not find signature for {}: <{}>'.format(
+                    self.name, str_signature(types)
+                )
+            )
+        try:
+            return func(*args, **kwargs)
+        except MDNotImplementedError:
+            funcs = self.dispatch_iter(*types)
+            next(funcs)  # the rule that was just called
+            for func in funcs:
+                try:
+                    return func(*args, **kwargs)
+                except MDNotImplementedError:
+                    pass
+
+            raise NotImplementedError(
+                'Matching functions for {}: <{}> found, but none completed '
+                'successfully'.format(self.name, str_signature(types))
+            )
+
+    def dispatch(self, *types):
+        try:
+            func = self._cache[types]
+        except KeyError:
+            self.misses += 1
+            func = super(ExecutionDispatcher, self).dispatch(*types)
+            if func is not None:
+                self._cache[types] = func
+        else:
+            self.hits += 1
+        return func
+
+    def add(self, signature, func):
+        self.version += 1
+        if (not _LAZY_ORDERING or not signature or any(
+            isinstance(typ, (tuple, list)) for typ in signature
+        )):
+            # union types are added one signature at a time by the base
+            # class, variadic and annotated signatures invalidate everything
+            return super(ExecutionDispatcher, self).add(signature, func)
+
+        signature = tuple(signature)
+        cache, self._cache = self._cache, {}
+        ordering = getattr(self, '_ordering', None)
+        is_new = signature not in self.funcs
+
+        super(ExecutionDispatcher, self).add(signature, func)
+
+        self._cache.update(
+            (types, cached) for types, cached in cache.items()
+            if len(types) != len(signature) or
+            not all(map(issubclass, types, signature))
+        )
+
+        if ordering is not None:
+            if not is_new:
+                self._ordering = ordering
+            else:
+                self._insert(signature, ordering)
+
+    def _insert(self, signature, ordering):
+        """Insert `signature` into a copy of `ordering`, if it can be placed
+        after every signature that is more specific than it and before every
+        signature that is less specific than it.
+        """
+        more_specific = [
+            i for i, other in enumerate(ordering) if edge(other, signature)
+        ]
+        less_specific = [
+            i for i, other in enumerate(ordering) if edge(signature, other)
+        ]
+        position = max(more_specific) + 1 if more_specific else 0
+        if less_specific and min(less_specific) < position:
+            return
+
+        self._ordering = (
+            ordering[:position] + [signature] + ordering[position:]
+        )
+        ambiguities = {
+            (signature, other) for other in ordering
+            if ambiguous(signature, other)
+        }
+        if ambiguities:
+            ambiguity_warn(self, ambiguities)
+
+    def cache_info(self):
+        """Return the hits, misses and size of the cache of resolved rules.
+
+        Returns
+        -------
+        info : CacheInfo
+        """
+        return CacheInfo(self.hits, self.misses, len(self._cache))
+
+    def cache_clear(self):
+        """Clear the cache of resolved rules and its statistics."""
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+
 # Individual operation execution
-execute_node = Dispatcher(
+execute_node = ExecutionDispatcher(
     'execute_node',
     doc=(
         'Execute an individual operation given the operation and its computed '
@@ -30,7 +173,7 @@ def execute_node_without_scope(node, **kwargs):
     )
 
 
-pre_execute = Dispatcher(
+pre_execute = ExecutionDispatcher(
     'pre_execute',
     doc="""\
 Given a node, compute a (possibly partial) scope prior to standard execution.
@@ -79,7 +222,7 @@ def execute_node_literal_value_interval(op, value, datatype, **kwargs):
     return pd.Timedelta(value, unit=datatype.unit)
 
 
-post_execute = Dispatcher(
+post_execute = ExecutionDispatcher(
     'post_execute',
     doc="""\
 Execute code on the result of a computation.
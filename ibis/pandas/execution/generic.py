@@ -18,7 +18,10 @@ import ibis
 import ibis.common as com
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
-from ibis.compat import functools, map, DatetimeTZDtype, zip
+import ibis.expr.types as ir
+from ibis.compat import (
+    functools, map, DatetimeTZDtype, zip, guess_datetime_format
+)
 
 from ibis.pandas.core import (
     execute,
@@ -32,7 +35,8 @@ from ibis.pandas.core import (
 )
 
 from ibis.pandas.dispatch import execute_node
-from ibis.pandas.execution import constants
+from ibis.pandas.execution import constants, util
+from ibis.pandas.frame import ColumnFrame, ConcatFrame, LazyFrame
 
 
 @execute_node.register(ops.Literal, object, dt.Interval)
@@ -85,15 +89,51 @@ def execute_cast_series_timestamp(op, data, type, **kwargs):
             'M8[ns]' if tz is None else DatetimeTZDtype('ns', tz)
         )
 
-    if isinstance(from_type, (dt.String, dt.Integer)):
-        timestamps = pd.to_datetime(
-            data.values, infer_datetime_format=True, unit='ns',
-        ).tz_localize(tz)
+    if isinstance(from_type, dt.String):
+        timestamps = parse_datetime_strings(data.values).tz_localize(tz)
+        return pd.Series(timestamps, index=data.index, name=data.name)
+
+    if isinstance(from_type, dt.Integer):
+        timestamps = pd.to_datetime(data.values, unit='ns').tz_localize(tz)
         return pd.Series(timestamps, index=data.index, name=data.name)
 
     raise TypeError("Don't know how to cast {} to {}".format(from_type, type))
 
 
+def parse_datetime_strings(values):
+    """Parse an array of datetime strings, parsing every distinct string
+    only once.
+
+    The format is guessed from the first distinct value and used to parse all
+    of them with a fixed format, falling back to per-value format inference
+    if the guess fails.
+
+    Parameters
+    ----------
+    values : np.ndarray[object]
+
+    Returns
+    -------
+    timestamps : pd.DatetimeIndex
+    """
+    codes, uniques = pd.factorize(values)
+    if not len(uniques):
+        return pd.DatetimeIndex(np.full(len(values), 'NaT', dtype='M8[ns]'))
+
+    datetime_format = guess_datetime_format(uniques[0])
+    try:
+        if datetime_format is None:
+            raise ValueError('Unable to guess datetime format')
+        parsed = pd.to_datetime(uniques, format=datetime_format)
+    except ValueError:
+        parsed = pd.to_datetime(uniques, infer_datetime_format=True)
+
+    timestamps = parsed.take(codes)
+    if (codes == -1).any():
+        timestamps = timestamps.where(codes != -1)
+    return timestamps
+
+
 def _normalize(values, original_index, name, timezone=None):
     index = pd.DatetimeIndex(values, tz=timezone)
     return pd.Series(index.normalize(), index=original_index, name=name)
@@ -113,19 +153,9 @@ def execute_cast_series_date(op, data, type, **kwargs):
         )
 
     if from_type.equals(dt.string):
-        try:
-            date_values = data.values.astype('datetime64[D]').astype(
-                'datetime64[ns]'
-            )
-        except TypeError:
-            date_values = _normalize(
-                pd.to_datetime(
-                    data.values, infer_datetime_format=True, box=False
-                ),
-                data.index,
-                data.name,
-            )
-        return pd.Series(date_values, index=data.index, name=data.name)
+        return _normalize(
+            parse_datetime_strings(data.values), data.index, data.name
+        )
 
     if isinstance(from_type, dt.Integer):
         return pd.Series(
@@ -323,7 +353,9 @@ def execute_round_series(op, data, places, **kwargs):
     return result if places else result.astype('int64')
 
 
-@execute_node.register(ops.TableColumn, (pd.DataFrame, DataFrameGroupBy))
+@execute_node.register(
+    ops.TableColumn, (pd.DataFrame, DataFrameGroupBy, ColumnFrame)
+)
 def execute_table_column_df_or_df_groupby(op, data, **kwargs):
     return data[op.name]
 
@@ -360,17 +392,31 @@ def execute_aggregation_dataframe(op, data, scope=None, **kwargs):
             (by_op.name, by.get_name()) for by, by_op in grouping_key_pairs
             if hasattr(by_op, 'name')
         )
-        source = data.groupby(grouping_keys)
+        source, categories = util.group_by(data, grouping_keys)
     else:
         source = data
+        categories = {}
+
+    # compute the simple metrics in one pass over the groups, the rest are
+    # executed one at a time
+    if op.by:
+        simple_metrics = _aggregate_simple_metrics(
+            op, data, grouping_keys, scope, **kwargs
+        )
+    else:
+        simple_metrics = {}
 
     new_scope = toolz.merge(scope, {op.table.op(): source})
     pieces = [
-        pd.Series(execute(metric, new_scope, **kwargs), name=metric.get_name())
-        for metric in op.metrics
+        simple_metrics[i] if i in simple_metrics else pd.Series(
+            execute(metric, new_scope, **kwargs), name=metric.get_name()
+        )
+        for i, metric in enumerate(op.metrics)
     ]
 
-    result = pd.concat(pieces, axis=1).reset_index()
+    result = util.decode_group_keys(
+        pd.concat(pieces, axis=1).reset_index(), categories
+    )
     result.columns = [columns.get(c, c) for c in result.columns]
 
     if op.having:
@@ -393,6 +439,141 @@ def execute_aggregation_dataframe(op, data, scope=None, **kwargs):
     return result
 
 
+# Reductions that can be computed by DataFrameGroupBy.agg, along with the
+# name of the equivalent pandas aggregation
+GROUPED_AGGREGATIONS = {
+    ops.Count: 'count',
+    ops.CountDistinct: 'nunique',
+    ops.Max: 'max',
+    ops.Mean: 'mean',
+    ops.Min: 'min',
+    ops.StandardDev: 'std',
+    ops.Sum: 'sum',
+    ops.Variance: 'var',
+}
+
+
+def _lower_grouped_metric(metric, table_op, data, scope, **kwargs):
+    """Compute the input of a simple grouped reduction.
+
+    Parameters
+    ----------
+    metric : ir.ScalarExpr
+    table_op : ops.TableNode
+        The table being aggregated
+    data : pd.DataFrame
+        The data of `table_op`
+    scope : dict
+
+    Returns
+    -------
+    lowered : Optional[Tuple[pd.Series, str, Optional[np.dtype]]]
+        The values to aggregate, the name of the pandas aggregation and the
+        dtype to cast the result back to, or ``None`` if `metric` cannot be
+        computed by :meth:`pandas.core.groupby.DataFrameGroupBy.agg`.
+    """
+    op = metric.op()
+    how = GROUPED_AGGREGATIONS.get(type(op))
+    if how is None:
+        return None
+
+    if isinstance(op, ops.VarianceBase) and op.how != 'sample':
+        return None
+
+    arg_op = op.arg.op()
+    if isinstance(op.arg, ir.TableExpr):
+        if arg_op is not table_op:
+            return None
+        values = pd.Series(1, index=data.index)
+        how = 'sum'
+    elif (isinstance(arg_op, ops.TableColumn) and
+            arg_op.table.op() is table_op and arg_op.name in data):
+        values = data[arg_op.name]
+        if util.is_categorical(values):
+            return None
+    else:
+        return None
+
+    where = op.where
+    if where is None:
+        return values, how, None
+
+    dtype = values.dtype
+    if not util.is_row_wise(where) or not (
+        pd.api.types.is_numeric_dtype(dtype) and
+        not pd.api.types.is_bool_dtype(dtype)
+    ):
+        return None
+
+    mask = execute(where, toolz.merge(scope, {table_op: data}), **kwargs)
+    if not isinstance(mask, pd.Series):
+        return None
+
+    # masked out values are ignored by every aggregation in the same way as
+    # missing values
+    if how in {'sum', 'min', 'max'} and pd.api.types.is_integer_dtype(dtype):
+        return values.where(mask), how, dtype
+    return values.where(mask), how, None
+
+
+def _aggregate_simple_metrics(op, data, grouping_keys, scope, **kwargs):
+    """Compute the simple metrics of `op` with a single call to
+    :meth:`pandas.core.groupby.DataFrameGroupBy.agg`.
+
+    Parameters
+    ----------
+    op : ops.Aggregation
+    data : pd.DataFrame
+    grouping_keys : List[Union[str, pd.Series]]
+    scope : dict
+
+    Returns
+    -------
+    results : Dict[int, pd.Series]
+        The result of each simple metric, keyed by its position in
+        ``op.metrics``
+    """
+    table_op = op.table.op()
+    columns = collections.OrderedDict()
+    aggregations = collections.OrderedDict()
+    lowered_metrics = {}
+    masked = False
+
+    for i, metric in enumerate(op.metrics):
+        lowered = _lower_grouped_metric(
+            metric, table_op, data, scope, **kwargs
+        )
+        if lowered is not None:
+            values, how, dtype = lowered
+            column = ibis.util.guid()
+            columns[column] = values
+            aggregations[column] = how
+            lowered_metrics[i] = metric.get_name(), column, dtype
+            masked = masked or metric.op().where is not None
+
+    # a single unmasked metric gains nothing from being lowered
+    if not masked and len(lowered_metrics) < 2:
+        return {}
+
+    keys = [
+        data[key] if isinstance(key, six.string_types) else key
+        for key in grouping_keys
+    ]
+    grouped, _ = util.group_by(pd.DataFrame(columns), keys)
+    aggregated = grouped.agg(aggregations)
+
+    results = {}
+    for i, (name, column, dtype) in lowered_metrics.items():
+        result = aggregated[column].rename(name)
+        # pandas sums groups without any values to 0, like the per metric
+        # rules do, so only mins and maxes of such groups are missing and
+        # stay floating point
+        if dtype is not None and result.notnull().all():
+            result = result.astype(dtype)
+        results[i] = result
+    return results
+
+
 @execute_node.register(ops.Reduction, SeriesGroupBy, type(None))
 def execute_reduction_series_groupby(op, data, mask, context=None, **kwargs):
     return context.agg(data, type(op).__name__.lower())
@@ -568,8 +749,25 @@ def execute_binary_op(op, left, right, **kwargs):
         raise NotImplementedError(
             'Binary operation {} not implemented'.format(op_type.__name__)
         )
-    else:
-        return operation(left, right)
+
+    # evaluate operations between dictionary encoded columns and scalars once
+    # per category
+    if util.is_categorical(left) and not isinstance(right, pd.Series):
+        return util.compute_on_categories(
+            lambda values: operation(values, right), left
+        )
+    if util.is_categorical(right) and not isinstance(left, pd.Series):
+        return util.compute_on_categories(
+            lambda values: operation(left, values), right
+        )
+
+    # categoricals can only be compared to categoricals with identical
+    # categories, so decode before combining with another column
+    if util.is_categorical(left):
+        left = left.astype(object)
+    if util.is_categorical(right):
+        right = right.astype(object)
+    return operation(left, right)
 
 
 @execute_node.register(ops.BinaryOp, SeriesGroupBy, SeriesGroupBy)
@@ -651,9 +849,22 @@ def execute_series_distinct(op, data, **kwargs):
     return pd.Series(data.unique(), name=data.name)
 
 
-@execute_node.register(ops.Union, pd.DataFrame, pd.DataFrame)
-def execute_union_dataframe_dataframe(op, left, right, **kwargs):
-    return pd.concat([left, right], axis=0)
+@execute_node.register(
+    ops.Union, (pd.DataFrame, ConcatFrame), (pd.DataFrame, ConcatFrame), bool
+)
+def execute_union_dataframe_dataframe(op, left, right, distinct, **kwargs):
+    # Defer concatenating the rows of the inputs, so that a chain of unions
+    # copies each input once instead of once per union
+    result = ConcatFrame.from_tables([left, right])
+    if not distinct:
+        return result
+    data = result.to_frame()
+    return util.reset_default_index(data.loc[util.distinct_rows(data)])
+
+
+@execute_node.register(ops.Distinct, pd.DataFrame)
+def execute_distinct_dataframe(op, data, **kwargs):
+    return util.reset_default_index(data.loc[util.distinct_rows(data)])
 
 
 @execute_node.register(ops.IsNull, pd.Series)
@@ -765,10 +976,199 @@ def execute_node_where_scalar_scalar_series(op, cond, true, false, **kwargs):
     return pd.Series(np.repeat(true, len(false))) if cond else false
 
 
+@execute_node.register(ops.SearchedCase, list)
+def execute_searched_case(op, whens, scope=None, **kwargs):
+    results = op.results + [op.default]
+    reference = _case_reference(whens)
+    if reference is None:
+        # every condition is a scalar, so only one result is computed
+        choice = next(
+            (i for i, when in enumerate(whens) if pd.notnull(when) and when),
+            len(whens)
+        )
+        return execute(results[choice], scope=scope, **kwargs)
+
+    nrows = len(reference)
+    conditions = [_case_condition(when, nrows) for when in whens]
+    choices = np.select(
+        conditions, np.arange(len(conditions)), default=len(conditions)
+    )
+    return _compute_case_results(
+        results, choices, reference.index, scope=scope, **kwargs
+    )
+
+
+@execute_node.register(ops.SimpleCase, pd.Series, list)
+def execute_simple_case_series(op, base, cases, scope=None, **kwargs):
+    results = op.results + [op.default]
+    if any(isinstance(case, pd.Series) for case in cases):
+        conditions = [
+            _case_condition(base == case, len(base)) for case in cases
+        ]
+        choices = np.select(
+            conditions, np.arange(len(conditions)), default=len(conditions)
+        )
+    else:
+        # look up every row in the cases at once, the first equal case wins
+        first_cases = collections.OrderedDict()
+        for i, case in enumerate(cases):
+            if pd.notnull(case):
+                first_cases.setdefault(case, i)
+        positions = np.array(
+            list(first_cases.values()) + [len(cases)], dtype=np.int64
+        )
+        indexer = pd.Index(list(first_cases.keys())).get_indexer(base.values)
+        choices = positions[indexer]
+    return _compute_case_results(
+        results, choices, base.index, scope=scope, **kwargs
+    )
+
+
+@execute_node.register(ops.SimpleCase, scalar_types + (type(None),), list)
+def execute_simple_case_scalar(op, base, cases, scope=None, **kwargs):
+    results = op.results + [op.default]
+    reference = _case_reference(cases)
+    if reference is None:
+        choice = next(
+            (
+                i for i, case in enumerate(cases)
+                if pd.notnull(base) and base == case
+            ),
+            len(cases)
+        )
+        return execute(results[choice], scope=scope, **kwargs)
+
+    base = util.broadcast_scalar(base, reference.index)
+    return execute_simple_case_series(
+        op, base, cases, scope=scope, **kwargs
+    )
+
+
+def _case_reference(values):
+    """Return the first Series of `values`, or ``None`` if every value is a
+    scalar.
+    """
+    reference = None
+    for value in values:
+        if isinstance(value, pd.Series):
+            if reference is None:
+                reference = value
+        elif not isinstance(value, scalar_types + (type(None),)):
+            raise com.OperationNotDefinedError(
+                'CASE expressions over {} are not supported by the pandas '
+                'backend'.format(type(value).__name__)
+            )
+    return reference
+
+
+def _case_condition(when, nrows):
+    """Convert the computed case `when` to a boolean array, where missing
+    values are false.
+    """
+    if isinstance(when, pd.Series):
+        return when.fillna(False).values.astype(bool)
+    return np.repeat(pd.notnull(when) and bool(when), nrows)
+
+
+def _compute_case_results(results, choices, index, scope=None, **kwargs):
+    """Compute the result of each row of a CASE expression.
+
+    Each result is computed only on the rows whose index in `results` is in
+    `choices`, and not at all if there are no such rows.
+
+    Parameters
+    ----------
+    results : List[ir.ValueExpr]
+        The result of every case, followed by the default
+    choices : np.ndarray[int]
+        The index in `results` of the result of every row
+    index : pd.Index
+        The index of the computed cases
+    scope : dict
+
+    Returns
+    -------
+    result : pd.Series
+    """
+    nrows = len(choices)
+    is_scalar = [not result.op().root_tables() for result in results]
+
+    if all(is_scalar):
+        values = [
+            execute(result, scope=scope, **kwargs) for result in results
+        ]
+        result = pd.Series(values).take(choices)
+        result.index = index
+        return result
+
+    # the rows of each result, in the order of the results
+    order = np.argsort(choices, kind='mergesort')
+    bounds = np.cumsum(np.bincount(choices, minlength=len(results)))
+
+    pieces = []
+    for i, (result, scalar) in enumerate(zip(results, is_scalar)):
+        rows = order[bounds[i - 1] if i else 0:bounds[i]]
+        if not len(rows):
+            continue
+
+        if scalar:
+            value = execute(result, scope=scope, **kwargs)
+            if pd.isnull(value):
+                # rows without a piece are missing in the result
+                continue
+            values = np.repeat(value, len(rows))
+        else:
+            values = _execute_on_rows(
+                result, rows, nrows, scope=scope, **kwargs
+            ).values
+        pieces.append(pd.Series(values, index=rows))
+
+    if not pieces:
+        return pd.Series(np.nan, index=index)
+    result = pd.concat(pieces).reindex(pd.RangeIndex(nrows))
+    result.index = index
+    return result
+
+
+def _execute_on_rows(expr, rows, nrows, scope=None, **kwargs):
+    """Execute the column expression `expr` on the rows at the positions
+    `rows` of its root tables, which have `nrows` rows.
+    """
+    tables = {}
+    for table in expr.op().root_tables():
+        try:
+            data = scope[table]
+        except KeyError:
+            data = execute(table.to_expr(), scope=scope, **kwargs)
+        if isinstance(data, LazyFrame):
+            data = data.to_frame()
+        tables[table] = data
+
+    if util.is_row_wise(expr) and all(
+        len(data.index) == nrows for data in tables.values()
+    ):
+        new_scope = {
+            table: data.iloc[rows] for table, data in tables.items()
+        }
+        result = execute(expr, scope=toolz.merge(scope, new_scope), **kwargs)
+    else:
+        # reductions and analytic functions need every row
+        result = execute(expr, scope=toolz.merge(scope, tables), **kwargs)
+        if isinstance(result, pd.Series):
+            result = result.iloc[rows]
+
+    if not isinstance(result, pd.Series):
+        result = util.broadcast_scalar(result, pd.RangeIndex(len(rows)))
+
+    assert len(result) == len(rows), \
+        'CASE result does not have one value per selected row'
+    return result
+
+
 @execute_node.register(
     ibis.pandas.client.PandasTable, ibis.pandas.client.PandasClient)
 def execute_database_table_client(op, client, **kwargs):
-    return client.dictionary[op.name]
+    return client.load_table(op.name)
 
 
 MATH_FUNCTIONS = {
@@ -868,5 +1268,22 @@ def execute_node_least_list(op, value, **kwargs):
 
 @execute_node.register(ops.Coalesce, collections.Sequence)
 def execute_node_coalesce(op, values, **kwargs):
-    # TODO: this is slow
-    return compute_row_reduction(coalesce, values)
+    series = [value for value in values if isinstance(value, pd.Series)]
+    if not series:
+        return coalesce(values)
+
+    index = series[0].index
+    result = None
+    for value in values:
+        if isinstance(value, pd.Series):
+            result = value if result is None else result.fillna(value)
+        elif pd.notnull(value):
+            result = (
+                util.broadcast_scalar(value, index) if result is None
+                else result.fillna(value)
+            )
+
+        # the remaining values are not needed once no value is missing
+        if result is not None and not result.isnull().any():
+            break
+    return result
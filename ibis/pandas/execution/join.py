@@ -1,12 +1,22 @@
 import operator
 
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
 
+import toolz
+
+import ibis.expr.lineage as lin
 import ibis.expr.operations as ops
+import ibis.expr.types as ir
+from ibis.compat import zip
+from ibis.config import options
 
-from ibis.pandas.dispatch import execute_node
+from ibis.pandas.client import PandasClient
+from ibis.pandas.dispatch import execute_node, pre_execute
 from ibis.pandas.core import execute
-from ibis.pandas.execution import constants
+from ibis.pandas.execution import constants, util
 
 
 def _compute_join_column(column_expr, **kwargs):
@@ -21,6 +31,289 @@ def _compute_join_column(column_expr, **kwargs):
     return new_column, root_table
 
 
+# Comparisons that can be evaluated between the two sides of a join, along
+# with their mirror image when the operands are swapped
+RANGE_PREDICATES = {
+    ops.Less: (operator.lt, operator.gt),
+    ops.LessEqual: (operator.le, operator.ge),
+    ops.Greater: (operator.gt, operator.lt),
+    ops.GreaterEqual: (operator.ge, operator.le),
+    ops.NotEquals: (operator.ne, operator.ne),
+}
+
+
+def _flatten_predicates(predicates):
+    """Split conjunctions and ``BETWEEN`` predicates into simple comparisons.
+
+    Parameters
+    ----------
+    predicates : List[ir.BooleanColumn]
+
+    Returns
+    -------
+    flattened : List[Tuple[Type[ops.Comparison], ir.Expr, ir.Expr]]
+    """
+    for predicate in predicates:
+        op = predicate.op()
+        if isinstance(op, ops.And):
+            for flattened in _flatten_predicates([op.left, op.right]):
+                yield flattened
+        elif isinstance(op, ops.Between):
+            yield ops.GreaterEqual, op.arg, op.lower_bound
+            yield ops.LessEqual, op.arg, op.upper_bound
+        elif isinstance(op, ops.Comparison):
+            yield type(op), op.left, op.right
+        else:
+            raise TypeError(
+                'Unsupported join predicate {}'.format(type(op).__name__)
+            )
+
+
+def _join_side(expr, left_op, right_op):
+    try:
+        root_table, = expr.op().root_tables()
+    except ValueError:
+        root_table = None
+
+    if root_table is not left_op and root_table is not right_op:
+        raise TypeError(
+            'Join predicate operands must each reference exactly one side '
+            'of the join'
+        )
+    return root_table
+
+
+def _compute_join_values(expr, root_table, data, scope=None, **kwargs):
+    op = expr.op()
+    if isinstance(op, ops.TableColumn):
+        return np.asarray(data[op.name])
+    new_scope = toolz.merge(scope or {}, {root_table: data})
+    return np.asarray(execute(expr, new_scope, **kwargs))
+
+
+def _factorize_keys(left_keys, right_keys, nleft, nright):
+    """Jointly factorize the equality keys of both sides of a join.
+
+    Returns
+    -------
+    left_codes, right_codes : np.ndarray[int64], np.ndarray[int64]
+        Equal keys have equal codes and rows with a null key have code -1.
+    """
+    codes = np.zeros(nleft + nright, dtype=np.int64)
+    null = np.zeros(nleft + nright, dtype=np.bool_)
+
+    for left_key, right_key in zip(left_keys, right_keys):
+        key_codes, uniques = pd.factorize(
+            np.concatenate([left_key, right_key])
+        )
+        null |= key_codes == -1
+        # refactorize the combined codes to keep them dense
+        codes, _ = pd.factorize(codes * (len(uniques) + 1) + key_codes + 1)
+
+    codes = codes.astype(np.int64)
+    codes[null] = -1
+    return codes[:nleft], codes[nleft:]
+
+
+def _expand_ranges(starts, stops):
+    """Return the row numbers and positions of the ranges
+    ``[starts[i], stops[i])``.
+    """
+    counts = np.maximum(stops - starts, 0)
+    rows = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    return rows, np.repeat(starts, counts) + offsets
+
+
+def _range_join_indexers(left_codes, right_codes, comparisons):
+    """Compute the matching row pairs of an equality and range join.
+
+    Right rows are sorted by equality key and then by the right operand of
+    the first ordering comparison, so that each left row's candidates are a
+    contiguous range found with binary search. The remaining comparisons are
+    evaluated on the candidate pairs only.
+    """
+    ordering = [
+        i for i, (func, _, _) in enumerate(comparisons)
+        if func is not operator.ne
+    ]
+    left_valid = left_codes != -1
+    right_valid = right_codes != -1
+
+    if ordering:
+        func, left_values, right_values = comparisons.pop(ordering[0])
+        left_valid &= pd.notnull(left_values)
+        right_valid &= pd.notnull(right_values)
+
+        # dense ranks over both sides let equality codes and values be
+        # searched together as a single integer key
+        uniques = np.unique(np.concatenate([
+            left_values[left_valid], right_values[right_valid]
+        ]))
+        width = len(uniques) + 1
+        left_ranks = np.searchsorted(uniques, left_values[left_valid])
+        right_ranks = np.searchsorted(uniques, right_values[right_valid])
+    else:
+        func = None
+        width = 1
+        left_ranks = right_ranks = 0
+
+    right_rows = np.flatnonzero(right_valid)
+    right_keys = right_codes[right_valid] * width + right_ranks
+    order = np.argsort(right_keys, kind='mergesort')
+    right_rows = right_rows[order]
+    right_keys = right_keys[order]
+
+    left_rows = np.flatnonzero(left_valid)
+    bucket = left_codes[left_valid] * width
+    bucket_start = np.searchsorted(right_keys, bucket, side='left')
+    bucket_stop = np.searchsorted(right_keys, bucket + width, side='left')
+    starts, stops = bucket_start, bucket_stop
+
+    if func is not None:
+        keys = bucket + left_ranks
+        if func is operator.lt:
+            starts = np.searchsorted(right_keys, keys, side='right')
+        elif func is operator.le:
+            starts = np.searchsorted(right_keys, keys, side='left')
+        elif func is operator.gt:
+            stops = np.searchsorted(right_keys, keys, side='left')
+        else:
+            stops = np.searchsorted(right_keys, keys, side='right')
+
+    rows, positions = _expand_ranges(starts, stops)
+    left_indexer = left_rows[rows]
+    right_indexer = right_rows[positions]
+
+    if comparisons:
+        mask = np.ones(len(left_indexer), dtype=np.bool_)
+        for func, left_values, right_values in comparisons:
+            mask &= func(
+                left_values[left_indexer], right_values[right_indexer]
+            )
+        left_indexer = left_indexer[mask]
+        right_indexer = right_indexer[mask]
+    return left_indexer, right_indexer
+
+
+def _add_unmatched_rows(how, left_indexer, right_indexer, nleft, nright):
+    if how in {'left', 'outer'}:
+        unmatched = np.setdiff1d(np.arange(nleft), left_indexer)
+        left_indexer = np.concatenate([left_indexer, unmatched])
+        right_indexer = np.concatenate(
+            [right_indexer, np.full(len(unmatched), -1, dtype=np.int64)]
+        )
+    if how in {'right', 'outer'}:
+        unmatched = np.setdiff1d(np.arange(nright), right_indexer)
+        left_indexer = np.concatenate(
+            [left_indexer, np.full(len(unmatched), -1, dtype=np.int64)]
+        )
+        right_indexer = np.concatenate([right_indexer, unmatched])
+    return left_indexer, right_indexer
+
+
+def _take_rows(df, indexer):
+    if (indexer == -1).any():
+        return util.reset_default_index(df).reindex(indexer)
+    return df.take(indexer)
+
+
+def _build_join_result(left, right, left_indexer, right_indexer, shared):
+    """Assemble the result of a join from row indexers, naming columns the
+    same way :func:`pandas.merge` does.
+    """
+    left_rows = _take_rows(left, left_indexer)
+    right_rows = _take_rows(right, right_indexer)
+    overlapping = frozenset(left.columns) & frozenset(right.columns)
+    left_suffix, right_suffix = constants.JOIN_SUFFIXES
+
+    columns = OrderedDict()
+    for name in left.columns:
+        column = left_rows[name].values
+        if name in shared:
+            column = np.where(
+                left_indexer == -1, right_rows[name].values, column
+            )
+        elif name in overlapping:
+            name += left_suffix
+        columns[name] = column
+
+    for name in right.columns:
+        if name in shared:
+            continue
+        column = right_rows[name].values
+        if name in overlapping:
+            name += right_suffix
+        columns[name] = column
+
+    return pd.DataFrame(columns, columns=list(columns.keys()))
+
+
+def execute_range_join(op, left, right, how, **kwargs):
+    """Join `left` and `right` on a mix of equality and inequality predicates
+    without materializing their cross product.
+    """
+    left_op = op.left.op()
+    right_op = op.right.op()
+    data = {left_op: left, right_op: right}
+
+    equal_keys = {left_op: [], right_op: []}
+    equal_names = {left_op: [], right_op: []}
+    comparisons = []
+
+    for op_type, first, second in _flatten_predicates(op.predicates):
+        operands = first, second
+        roots = [
+            _join_side(operand, left_op, right_op) for operand in operands
+        ]
+        if roots[0] is roots[1]:
+            raise TypeError(
+                'Join predicate operands must reference different sides of '
+                'the join'
+            )
+        values = [
+            _compute_join_values(operand, root, data[root], **kwargs)
+            for operand, root in zip(operands, roots)
+        ]
+
+        if op_type is ops.Equals:
+            for operand, root, value in zip(operands, roots, values):
+                equal_keys[root].append(value)
+                equal_names[root].append(getattr(operand.op(), 'name', None))
+            continue
+
+        try:
+            func, swapped = RANGE_PREDICATES[op_type]
+        except KeyError:
+            raise TypeError(
+                'Unsupported join predicate {}'.format(op_type.__name__)
+            )
+        if roots[0] is left_op:
+            comparisons.append((func, values[0], values[1]))
+        else:
+            comparisons.append((swapped, values[1], values[0]))
+
+    left_codes, right_codes = _factorize_keys(
+        equal_keys[left_op], equal_keys[right_op], len(left), len(right)
+    )
+    left_indexer, right_indexer = _range_join_indexers(
+        left_codes, right_codes, comparisons
+    )
+    left_indexer, right_indexer = _add_unmatched_rows(
+        how, left_indexer, right_indexer, len(left), len(right)
+    )
+    shared = frozenset(
+        left_name for left_name, right_name in zip(
+            equal_names[left_op], equal_names[right_op]
+        ) if left_name is not None and left_name == right_name
+    )
+    return _build_join_result(
+        left, right, left_indexer, right_indexer, shared
+    )
+
+
 @execute_node.register(ops.Join, pd.DataFrame, pd.DataFrame)
 def execute_materialized_join(op, left, right, **kwargs):
     op_type = type(op)
@@ -37,9 +330,7 @@ def execute_materialized_join(op, left, right, **kwargs):
 
     for predicate in map(operator.methodcaller('op'), op.predicates):
         if not isinstance(predicate, ops.Equals):
-            raise TypeError(
-                'Only equality join predicates supported with pandas'
-            )
+            return execute_range_join(op, left, right, how, **kwargs)
         new_left_column, left_pred_root = _compute_join_column(
             predicate.left,
             **kwargs
@@ -52,16 +343,72 @@ def execute_materialized_join(op, left, right, **kwargs):
         )
         on[right_pred_root].append(new_right_column)
 
+    left, right, left_on, right_on = _semi_join_reduce(
+        how, left, right, on[left_op], on[right_op]
+    )
     df = pd.merge(
         left, right,
         how=how,
-        left_on=on[left_op],
-        right_on=on[right_op],
+        left_on=left_on,
+        right_on=right_on,
         suffixes=constants.JOIN_SUFFIXES,
     )
     return df
 
 
+def _semi_join_reduce(how, left, right, left_on, right_on):
+    """Drop the rows of the larger side of a join that cannot match.
+
+    Only a side whose unmatched rows are discarded by the join can be reduced:
+    either side of an inner join, the right side of a left join and the left
+    side of a right join.
+
+    Parameters
+    ----------
+    how : str
+    left, right : pd.DataFrame
+    left_on, right_on : List[Union[str, pd.Series]]
+        The join keys, in the form accepted by :func:`pandas.merge`.
+
+    Returns
+    -------
+    reduced : Tuple[pd.DataFrame, pd.DataFrame, List, List]
+    """
+    ratio = options.pandas.join_prefilter_ratio
+    nleft, nright = len(left), len(right)
+    if ratio is None or not left_on:
+        return left, right, left_on, right_on
+
+    if how in {'inner', 'left'} and nright > ratio * nleft:
+        right, right_on = _semi_join(right, right_on, left, left_on)
+    elif how in {'inner', 'right'} and nleft > ratio * nright:
+        left, left_on = _semi_join(left, left_on, right, right_on)
+    return left, right, left_on, right_on
+
+
+def _semi_join(df, on, other, other_on):
+    keys = _join_key_values(df, on)
+    other_keys = _join_key_values(other, other_on)
+    if len(keys) == 1:
+        key, = keys
+        other_key, = other_keys
+        mask = key.isin(other_key).values
+    else:
+        mask = pd.MultiIndex.from_arrays(keys).isin(
+            pd.MultiIndex.from_arrays(other_keys)
+        )
+
+    if mask.all():
+        return df, on
+    return df.loc[mask], [
+        key[mask] if isinstance(key, pd.Series) else key for key in on
+    ]
+
+
+def _join_key_values(df, on):
+    return [key if isinstance(key, pd.Series) else df[key] for key in on]
+
+
 @execute_node.register(
     ops.AsOfJoin, pd.DataFrame, pd.DataFrame, (pd.Timedelta, type(None))
 )
@@ -110,3 +457,90 @@ def _validate_columns(orig_columns, *key_lists):
                 overlapping_columns
             )
         )
+
+
+def _referenced_columns(exprs, join_op):
+    """Compute the columns of each side of `join_op` used by `exprs`.
+
+    Parameters
+    ----------
+    exprs : List[ir.Expr]
+    join_op : ops.Join
+
+    Returns
+    -------
+    columns : Optional[Dict[ops.TableNode, Set[str]]]
+        ``None`` if `exprs` depend on tables other than the sides of the join,
+        in which case the origin of their columns cannot be determined.
+    """
+    sides = join_op.left, join_op.right
+    columns = {side.op(): set() for side in sides}
+    unknown = []
+
+    def visit(expr):
+        op = expr.op()
+        if isinstance(op, ops.TableColumn):
+            table_op = op.table.op()
+            if table_op in columns:
+                columns[table_op].add(op.name)
+            elif table_op is join_op:
+                for side in sides:
+                    if op.name in side.schema():
+                        columns[side.op()].add(op.name)
+            else:
+                unknown.append(op)
+            return lin.halt, None
+        if isinstance(expr, ir.TableExpr):
+            if op in columns:
+                columns[op].update(expr.columns)
+            else:
+                unknown.append(op)
+            return lin.halt, None
+        return lin.proceed, None
+
+    for _ in lin.traverse(visit, exprs):
+        pass
+    return None if unknown else columns
+
+
+@pre_execute.register((ops.Selection, ops.Aggregation), PandasClient)
+def pre_execute_prune_join_columns(op, client, scope=None, **kwargs):
+    """Drop the columns of a join's inputs that are never used by `op`.
+
+    Returns a scope mapping each side of the join to its pruned data so that
+    :func:`pandas.merge` neither hashes nor copies unused columns.
+    """
+    join_op = op.table.op()
+    if not isinstance(join_op, tuple(constants.JOIN_TYPES)):
+        return {}
+
+    sides = join_op.left, join_op.right
+    side_ops = [side.op() for side in sides]
+    if (side_ops[0] is side_ops[1] or
+            any(side_op in scope for side_op in side_ops) or
+            any(isinstance(side_op, ops.Join) for side_op in side_ops)):
+        return {}
+
+    if isinstance(op, ops.Selection):
+        if not op.selections:
+            return {}
+        exprs = op.selections + op.predicates + op.sort_keys
+    else:
+        exprs = (
+            op.metrics + op.by + op.having + op.predicates + op.sort_keys
+        )
+
+    columns = _referenced_columns(
+        list(exprs) + list(join_op.predicates), join_op
+    )
+    if columns is None:
+        return {}
+
+    pruned = {}
+    for side, side_op in zip(sides, side_ops):
+        used = columns[side_op]
+        names = [name for name in side.columns if name in used]
+        if len(names) < len(side.columns):
+            data = execute(side, scope=scope, **kwargs)
+            pruned[side_op] = data.loc[:, names]
+    return pruned
@@ -14,14 +14,17 @@ import toolz
 
 from multipledispatch import Dispatcher
 
+import ibis.expr.lineage as lin
 import ibis.expr.types as ir
 import ibis.expr.operations as ops
 
 from ibis.compat import functools
 
-from ibis.pandas.dispatch import execute_node
+from ibis.pandas.client import PandasClient
+from ibis.pandas.dispatch import execute_node, pre_execute
 from ibis.pandas.core import execute
 from ibis.pandas.execution import constants, util
+from ibis.pandas.frame import ColumnFrame
 
 
 compute_projection = Dispatcher(
@@ -34,7 +37,7 @@ Parameters
 ----------
 expr : Union[ir.ScalarExpr, ir.ColumnExpr, ir.TableExpr]
 parent : ops.Selection
-data : pd.DataFrame
+data : Union[pd.DataFrame, ColumnFrame]
 scope : dict, optional
 
 Returns
@@ -48,7 +51,9 @@ projection is a window operation.
 """)
 
 
-@compute_projection.register(ir.ScalarExpr, ops.Selection, pd.DataFrame)
+@compute_projection.register(
+    ir.ScalarExpr, ops.Selection, (pd.DataFrame, ColumnFrame)
+)
 def compute_projection_scalar_expr(expr, parent, data, scope=None, **kwargs):
     name = expr._name
     assert name is not None, 'Scalar selection name is None'
@@ -72,12 +77,12 @@ def compute_projection_scalar_expr(expr, parent, data, scope=None, **kwargs):
 
     new_scope = toolz.merge(scope, additional_scope, factory=OrderedDict)
     scalar = execute(expr, new_scope, **kwargs)
-    result = pd.Series([scalar], name=name).repeat(len(data.index))
-    result.index = data.index
-    return result
+    return util.broadcast_scalar(scalar, data.index, name=name)
 
 
-@compute_projection.register(ir.ColumnExpr, ops.Selection, pd.DataFrame)
+@compute_projection.register(
+    ir.ColumnExpr, ops.Selection, (pd.DataFrame, ColumnFrame)
+)
 def compute_projection_column_expr(expr, parent, data, scope=None, **kwargs):
     result_name = getattr(expr, '_name', None)
     op = expr.op()
@@ -117,7 +122,9 @@ def compute_projection_column_expr(expr, parent, data, scope=None, **kwargs):
     return result.rename(result_name)
 
 
-@compute_projection.register(ir.TableExpr, ops.Selection, pd.DataFrame)
+@compute_projection.register(
+    ir.TableExpr, ops.Selection, (pd.DataFrame, ColumnFrame)
+)
 def compute_projection_table_expr(expr, parent, data, **kwargs):
     if expr is parent.table:
         return data
@@ -135,7 +142,9 @@ def compute_projection_table_expr(expr, parent, data, **kwargs):
     return map_new_column_names_to_data(mapping, data)
 
 
-@compute_projection.register(object, ops.Selection, pd.DataFrame)
+@compute_projection.register(
+    object, ops.Selection, (pd.DataFrame, ColumnFrame)
+)
 def compute_projection_default(op, parent, data, **kwargs):
     raise TypeError(
         "Don't know how to compute projection of {}".format(type(op).__name__)
@@ -179,9 +188,13 @@ def remap_overlapping_column_names(table_op, root_table, data_columns):
 
 
 def map_new_column_names_to_data(mapping, df):
-    if mapping is not None:
-        return df.loc[:, mapping.keys()].rename(columns=mapping)
-    return df
+    if mapping is None:
+        return df
+
+    columns = list(mapping.keys())
+    if columns == list(df.columns) and columns == list(mapping.values()):
+        return df
+    return df.loc[:, columns].rename(columns=mapping, copy=False)
 
 
 def _compute_predicates(table_op, predicates, data, scope, **kwargs):
@@ -205,31 +218,65 @@ def _compute_predicates(table_op, predicates, data, scope, **kwargs):
     addition to the simple case of named columns coming directly from the input
     table.
     """
-    for predicate in predicates:
-        # Map each root table of the predicate to the data so that we compute
-        # predicates on the result instead of any left or right tables if the
-        # Selection is on a Join. Project data to only inlude columns from
-        # the root table.
-        root_tables = predicate.op().root_tables()
+    data_columns = frozenset(data.columns)
+
+    # Map each root table of the predicates to the data so that we compute
+    # predicates on the result instead of any left or right tables if the
+    # Selection is on a Join. Project data to only inlude columns from
+    # the root table, handling suffixes. The projection is computed once per
+    # root table and shared by every predicate.
+    root_table_data = {}
 
-        # handle suffixes
+    for predicate in predicates:
         additional_scope = {}
-        data_columns = frozenset(data.columns)
 
-        for root_table in root_tables:
-            mapping = remap_overlapping_column_names(
-                table_op, root_table, data_columns
-            )
-            if mapping is not None:
-                new_data = data.loc[:, mapping.keys()].rename(columns=mapping)
-            else:
-                new_data = data
-            additional_scope[root_table] = new_data
+        for root_table in predicate.op().root_tables():
+            if root_table not in root_table_data:
+                root_table_data[root_table] = map_new_column_names_to_data(
+                    remap_overlapping_column_names(
+                        table_op, root_table, data_columns
+                    ),
+                    data
+                )
+            additional_scope[root_table] = root_table_data[root_table]
 
         new_scope = toolz.merge(scope, additional_scope)
         yield execute(predicate, new_scope, **kwargs)
 
 
+def _required_columns(table_op, selections, data):
+    """Compute the columns of `data` needed to compute `selections`.
+
+    Returns
+    -------
+    columns : List[str]
+        All of the columns of `data` if it cannot be determined which columns
+        are used.
+    """
+    if isinstance(table_op, ops.Join):
+        return list(data.columns)
+
+    names = set()
+    unknown = []
+
+    def visit(expr):
+        op = expr.op()
+        if isinstance(op, ops.TableColumn) and op.table.op() is table_op:
+            names.add(op.name)
+            return lin.halt, None
+        if isinstance(expr, ir.TableExpr) or isinstance(op, ops.TableColumn):
+            unknown.append(op)
+            return lin.halt, None
+        return lin.proceed, None
+
+    for _ in lin.traverse(visit, selections):
+        pass
+
+    if unknown:
+        return list(data.columns)
+    return [name for name in data.columns if name in names]
+
+
 physical_tables = Dispatcher(
     'physical_tables',
     doc="""\
@@ -279,12 +326,38 @@ def physical_tables_node(node):
     return list(toolz.unique(tables, key=id))
 
 
-@execute_node.register(ops.Selection, pd.DataFrame)
+@execute_node.register(ops.Selection, (pd.DataFrame, ColumnFrame))
 def execute_selection_dataframe(op, data, scope=None, **kwargs):
     selections = op.selections
     predicates = op.predicates
     sort_keys = op.sort_keys
+    row_wise = all(map(util.is_row_wise, selections))
+
+    # Only row-wise projections can be computed from the columns alone
+    if isinstance(data, ColumnFrame) and (
+        predicates or sort_keys or not row_wise
+    ):
+        data = data.to_frame()
+
     result = data
+    predicate = None
+
+    if predicates:
+        predicates = _compute_predicates(
+            op.table.op(), predicates, data, scope, **kwargs
+        )
+        predicate = functools.reduce(operator.and_, predicates)
+        assert len(predicate) == len(data), \
+            'Selection predicate length does not match underlying table'
+
+        # Filter the columns we need before projecting, so that derived
+        # columns are only computed on the rows that survive the filter
+        if selections and row_wise:
+            data = data.loc[
+                predicate, _required_columns(op.table.op(), selections, data)
+            ]
+            result = data
+            predicate = None
 
     # Build up the individual pandas structures from column expressions
     if selections:
@@ -295,17 +368,53 @@ def execute_selection_dataframe(op, data, scope=None, **kwargs):
                 selection, op, data, scope=scope, **kwargs
             )
             data_pieces.append(pandas_object)
-        result = pd.concat(data_pieces, axis=1)
 
-    if predicates:
-        predicates = _compute_predicates(
-            op.table.op(), predicates, data, scope, **kwargs
-        )
-        predicate = functools.reduce(operator.and_, predicates)
-        assert len(predicate) == len(result), \
-            'Selection predicate length does not match underlying table'
+        # Defer building a DataFrame until a rule or the caller needs one
+        if row_wise and predicate is None and not sort_keys:
+            return ColumnFrame.from_pieces(data_pieces)
+        result = _concat_columns(data_pieces)
+
+    if predicate is not None:
         result = result.loc[predicate]
 
     if sort_keys:
         result = util.compute_sorted_frame(sort_keys, result, **kwargs)
-    return result.reset_index(drop=True)
+    return util.reset_default_index(result)
+
+
+def _concat_columns(pieces):
+    """Build a DataFrame from the columns of `pieces`, which all share the
+    same index.
+
+    Unlike ``pd.concat(pieces, axis=1)`` this neither aligns the pieces nor
+    keeps a concatenated copy alive alongside the result.
+    """
+    columns = OrderedDict()
+    for piece in pieces:
+        if isinstance(piece, pd.DataFrame):
+            columns.update(piece.iteritems())
+        else:
+            columns[piece.name] = piece
+    return pd.DataFrame(columns)
+
+
+@pre_execute.register(ops.Limit, PandasClient)
+def pre_execute_limit_sorted_selection(op, client, scope=None, **kwargs):
+    """Compute only the rows of a sorted selection that a limit keeps.
+
+    Returns a scope mapping the sorted selection to its first ``n + offset``
+    rows, which are found without sorting the whole selection.
+    """
+    selection = op.table.op()
+    if (not isinstance(selection, ops.Selection) or
+            not selection.sort_keys or selection in scope):
+        return {}
+
+    unsorted = ops.Selection(
+        selection.table, selection.selections, selection.predicates
+    ).to_expr()
+    data = execute(unsorted, scope=scope, **kwargs)
+    result = util.compute_sorted_frame_head(
+        selection.sort_keys, data, op.n + op.offset, **kwargs
+    )
+    return {selection: util.reset_default_index(result)}
@@ -14,14 +14,34 @@ from pandas.core.groupby import SeriesGroupBy
 
 import ibis
 
-from ibis.compat import reduce, maketrans
+from ibis.compat import functools, reduce, maketrans
 import ibis.expr.operations as ops
 
 from ibis.pandas.dispatch import execute_node
 from ibis.pandas.core import integer_types, scalar_types
+from ibis.pandas.execution import util
+
+
+def categorical_aware(func):
+    """Evaluate a string operation on a dictionary encoded column once per
+    category instead of once per row.
+
+    Operations with column valued arguments are computed as usual.
+    """
+    @functools.wraps(func)
+    def wrapper(op, data, *args, **kwargs):
+        if util.is_categorical(data) and not any(
+            isinstance(arg, pd.Series) for arg in args
+        ):
+            return util.compute_on_categories(
+                lambda values: func(op, values, *args, **kwargs), data
+            )
+        return func(op, data, *args, **kwargs)
+    return wrapper
 
 
 @execute_node.register(ops.StringLength, pd.Series)
+@categorical_aware
 def execute_string_length_series(op, data, **kwargs):
     return data.str.len().astype('int32')
 
@@ -32,21 +52,25 @@ def execute_string_length_series(op, data, **kwargs):
     (pd.Series,) + integer_types,
     (pd.Series,) + integer_types
 )
+@categorical_aware
 def execute_string_substring(op, data, start, length, **kwargs):
     return data.str[start:start + length]
 
 
 @execute_node.register(ops.Strip, pd.Series)
+@categorical_aware
 def execute_string_strip(op, data, **kwargs):
     return data.str.strip()
 
 
 @execute_node.register(ops.LStrip, pd.Series)
+@categorical_aware
 def execute_string_lstrip(op, data, **kwargs):
     return data.str.lstrip()
 
 
 @execute_node.register(ops.RStrip, pd.Series)
+@categorical_aware
 def execute_string_rstrip(op, data, **kwargs):
     return data.str.rstrip()
 
@@ -57,6 +81,7 @@ def execute_string_rstrip(op, data, **kwargs):
     (pd.Series,) + integer_types,
     (pd.Series,) + six.string_types
 )
+@categorical_aware
 def execute_string_lpad(op, data, length, pad, **kwargs):
     return data.str.pad(length, side='left', fillchar=pad)
 
@@ -67,31 +92,37 @@ def execute_string_lpad(op, data, length, pad, **kwargs):
     (pd.Series,) + integer_types,
     (pd.Series,) + six.string_types
 )
+@categorical_aware
 def execute_string_rpad(op, data, length, pad, **kwargs):
     return data.str.pad(length, side='right', fillchar=pad)
 
 
 @execute_node.register(ops.Reverse, pd.Series)
+@categorical_aware
 def execute_string_reverse(op, data, **kwargs):
     return data.str[::-1]
 
 
 @execute_node.register(ops.Lowercase, pd.Series)
+@categorical_aware
 def execute_string_lower(op, data, **kwargs):
     return data.str.lower()
 
 
 @execute_node.register(ops.Uppercase, pd.Series)
+@categorical_aware
 def execute_string_upper(op, data, **kwargs):
     return data.str.upper()
 
 
 @execute_node.register(ops.Capitalize, pd.Series)
+@categorical_aware
 def execute_string_capitalize(op, data, **kwargs):
     return data.str.capitalize()
 
 
 @execute_node.register(ops.Repeat, pd.Series, (pd.Series,) + integer_types)
+@categorical_aware
 def execute_string_repeat(op, data, times, **kwargs):
     return data.str.repeat(times)
 
@@ -103,6 +134,7 @@ def execute_string_repeat(op, data, times, **kwargs):
     (pd.Series, type(None)) + integer_types,
     (pd.Series, type(None)) + integer_types,
 )
+@categorical_aware
 def execute_string_contains(op, data, needle, start, end, **kwargs):
     return data.str.find(needle, start, end)
 
@@ -171,6 +203,7 @@ def sql_like_to_regex(pattern, escape=None):
     ops.StringSQLLike,
     pd.Series, six.string_types, (six.string_types, type(None))
 )
+@categorical_aware
 def execute_string_like_series_string(op, data, pattern, escape, **kwargs):
     new_pattern = re.compile(sql_like_to_regex(pattern, escape=escape))
     return data.map(
@@ -222,6 +255,7 @@ def execute_group_concat_series_gb_mask(
 
 
 @execute_node.register(ops.StringAscii, pd.Series)
+@categorical_aware
 def execute_string_ascii(op, data, **kwargs):
     return data.map(ord).astype('int32')
 
@@ -234,6 +268,7 @@ def execute_string_ascii_group_by(op, data, **kwargs):
 
 
 @execute_node.register(ops.RegexSearch, pd.Series, six.string_types)
+@categorical_aware
 def execute_series_regex_search(op, data, pattern, **kwargs):
     return data.map(
         lambda x, pattern=re.compile(pattern): pattern.search(x) is not None
@@ -253,6 +288,7 @@ def execute_series_regex_search_gb(op, data, pattern, **kwargs):
     (pd.Series,) + six.string_types,
     integer_types,
 )
+@categorical_aware
 def execute_series_regex_extract(op, data, pattern, index, **kwargs):
     def extract(x, pattern=re.compile(pattern), index=index):
         match = pattern.match(x)
@@ -286,6 +322,7 @@ def execute_series_regex_extract_gb(op, data, pattern, index, **kwargs):
     six.string_types,
     six.string_types,
 )
+@categorical_aware
 def execute_series_regex_replace(op, data, pattern, replacement, **kwargs):
     def replacer(x, pattern=re.compile(pattern)):
         return pattern.sub(replacement, x)
@@ -350,6 +387,7 @@ def execute_series_translate_scalar_series(
     six.string_types,
     six.string_types,
 )
+@categorical_aware
 def execute_series_translate_scalar_scalar(
     op, data, from_string, to_string, **kwargs
 ):
@@ -361,6 +399,7 @@ def execute_series_translate_scalar_scalar(
     pd.Series,
     integer_types,
 )
+@categorical_aware
 def execute_series_right(op, data, nchars, **kwargs):
     return data.str[-nchars:]
 
@@ -67,14 +67,162 @@ def execute_timestamp_truncate(op, data, **kwargs):
     return pd.Series(array, name=data.name)
 
 
+# Intervals in these units have no fixed width, so they are represented by
+# pd.DateOffset objects and applied with month arithmetic
+CALENDAR_UNIT_MONTHS = {'Y': 12, 'Q': 3, 'M': 1}
+
+
+# Day based intervals added to timezone aware timestamps shift wall clock time
+WALL_CLOCK_UNITS = frozenset({'W', 'D'})
+
+
+def shift_timestamps(timestamps, interval_expr, interval, subtract=False):
+    """Add the interval values `interval` computed for `interval_expr` to
+    `timestamps`, or subtract them if `subtract` is True.
+
+    Parameters
+    ----------
+    timestamps : pd.Series[datetime64]
+    interval_expr : ibis.expr.types.IntervalColumn
+    interval : pd.Series
+    subtract : bool
+
+    Returns
+    -------
+    shifted : pd.Series[datetime64]
+    """
+    unit = interval_expr.type().unit
+
+    if unit in CALENDAR_UNIT_MONTHS:
+        months = offset_months(interval)
+        if months is not None:
+            return add_months(timestamps, -months if subtract else months)
+        # offsets that aren't whole months are applied one by one
+        return timestamps - interval if subtract else timestamps + interval
+
+    if subtract:
+        interval = -interval
+
+    timezone = getattr(timestamps.dt, 'tz', None)
+    if timezone is not None and unit in WALL_CLOCK_UNITS:
+        wall_clock = timestamps.dt.tz_localize(None) + interval
+        return wall_clock.dt.tz_localize(timezone)
+    return timestamps + interval
+
+
+def add_months(timestamps, months):
+    """Shift `timestamps` by `months`, clipping days past the end of the
+    resulting month to its last day the same way :class:`pd.DateOffset` does.
+
+    Parameters
+    ----------
+    timestamps : pd.Series[datetime64]
+    months : Union[pd.Series[int], int]
+        Null counts shift to null timestamps.
+
+    Returns
+    -------
+    shifted : pd.Series[datetime64]
+    """
+    timezone = getattr(timestamps.dt, 'tz', None)
+    if timezone is not None:
+        # shift wall clock times
+        timestamps = timestamps.dt.tz_localize(None)
+
+    values = timestamps.values
+    days = values.astype('M8[D]')
+    month_starts = values.astype('M8[M]')
+    day_of_month = days - month_starts.astype('M8[D]')
+    time_of_day = values - days.astype('M8[ns]')
+
+    months = np.asarray(months)
+    missing_months = pd.isnull(months)
+    shifted = month_starts + np.where(missing_months, 0, months).astype(
+        np.int64
+    )
+    shifted_days = shifted.astype('M8[D]')
+    month_length = (shifted + 1).astype('M8[D]') - shifted_days
+    day = np.minimum(
+        day_of_month.astype(np.int64), month_length.astype(np.int64) - 1
+    )
+
+    result = (
+        shifted_days + day.astype('m8[D]')
+    ).astype('M8[ns]') + time_of_day
+    result[pd.isnull(values) | missing_months] = np.datetime64('NaT')
+
+    result = pd.Series(result, index=timestamps.index, name=timestamps.name)
+    if timezone is not None:
+        return result.dt.tz_localize(timezone)
+    return result
+
+
+def calendar_offsets(counts, unit):
+    """Convert the integer `counts` of an interval in the calendar unit `unit`
+    to :class:`pd.DateOffset` objects.
+
+    Only one offset is constructed per distinct count.
+
+    Parameters
+    ----------
+    counts : pd.Series[int]
+    unit : str
+
+    Returns
+    -------
+    offsets : pd.Series[object]
+    """
+    if unit == 'Y':
+        resolution, multiplier = 'years', 1
+    else:
+        resolution, multiplier = 'months', CALENDAR_UNIT_MONTHS[unit]
+
+    codes, uniques = pd.factorize(counts)
+    offsets = np.empty(len(uniques) + 1, dtype=object)
+    offsets[:-1] = [
+        pd.offsets.DateOffset(**{resolution: int(n) * multiplier})
+        for n in uniques
+    ]
+    offsets[-1] = None  # code -1 marks a null count
+    return pd.Series(
+        offsets.take(codes), index=counts.index, name=counts.name
+    )
+
+
+def offset_months(offsets):
+    """Return the number of months each :class:`pd.DateOffset` in `offsets`
+    shifts by, or None if any of them isn't a whole number of months.
+
+    Parameters
+    ----------
+    offsets : pd.Series[object]
+
+    Returns
+    -------
+    months : Optional[np.ndarray[float64]]
+        Null offsets are NaN.
+    """
+    codes, uniques = pd.factorize(offsets)
+    months = np.empty(len(uniques) + 1, dtype=np.float64)
+    for i, offset in enumerate(uniques):
+        kwds = getattr(offset, 'kwds', None)
+        if kwds is None or not set(kwds) <= {'years', 'months'}:
+            return None
+        months[i] = offset.n * (
+            12 * kwds.get('years', 0) + kwds.get('months', 0)
+        )
+    months[-1] = np.nan  # code -1 marks a null offset
+    return months.take(codes)
+
+
 @execute_node.register(ops.IntervalFromInteger, pd.Series)
 def execute_interval_from_integer_series(op, data, **kwargs):
-    resolution = '{}s'.format(op.resolution)
-
-    def convert_to_offset(n):
-        return pd.offsets.DateOffset(**{resolution: n})
+    unit = op.unit
+    if unit in CALENDAR_UNIT_MONTHS:
+        return calendar_offsets(data, unit)
 
-    return data.apply(convert_to_offset)
+    values = data.values.astype('m8[{}]'.format(unit)).astype('m8[ns]')
+    return pd.Series(values, index=data.index, name=data.name)
 
 
 @execute_node.register(ops.TimestampAdd, datetime.datetime, datetime.timedelta)
@@ -83,8 +231,10 @@ def execute_timestamp_add_datetime_timedelta(op, left, right, **kwargs):
 
 
 @execute_node.register(ops.TimestampAdd, datetime.datetime, pd.Series)
+@execute_node.register(ops.DateAdd, datetime.date, pd.Series)
 def execute_timestamp_add_datetime_series(op, left, right, **kwargs):
-    return pd.Timestamp(left) + right
+    timestamps = pd.Series(pd.Timestamp(left), index=right.index)
+    return shift_timestamps(timestamps, op.right, right).rename(right.name)
 
 
 @execute_node.register(ops.IntervalAdd, datetime.timedelta, datetime.timedelta)
@@ -101,15 +251,21 @@ def execute_interval_add_multiply_delta_series(op, left, right, **kwargs):
 
 
 @execute_node.register(
-    (ops.TimestampAdd, ops.IntervalAdd), pd.Series, datetime.timedelta)
+    (ops.TimestampAdd, ops.DateAdd, ops.IntervalAdd),
+    pd.Series,
+    datetime.timedelta
+)
 def execute_timestamp_interval_add_series_delta(op, left, right, **kwargs):
     return left + pd.Timedelta(right)
 
 
 @execute_node.register(
-    (ops.TimestampAdd, ops.IntervalAdd), pd.Series, pd.Series)
+    (ops.TimestampAdd, ops.DateAdd, ops.IntervalAdd), pd.Series, pd.Series
+)
 def execute_timestamp_interval_add_series_series(op, left, right, **kwargs):
-    return left + right
+    if isinstance(op, ops.IntervalAdd):
+        return left + right
+    return shift_timestamps(left, op.right, right)
 
 
 @execute_node.register(ops.TimestampSub, datetime.datetime, datetime.timedelta)
@@ -117,21 +273,33 @@ def execute_timestamp_sub_datetime_timedelta(op, left, right, **kwargs):
     return pd.Timestamp(left) - pd.Timedelta(right)
 
 
-@execute_node.register(
-    (ops.TimestampDiff, ops.TimestampSub), datetime.datetime, pd.Series)
-def execute_timestamp_diff_sub_datetime_series(op, left, right, **kwargs):
+@execute_node.register(ops.TimestampSub, datetime.datetime, pd.Series)
+@execute_node.register(ops.DateSub, datetime.date, pd.Series)
+def execute_timestamp_sub_datetime_series(op, left, right, **kwargs):
+    timestamps = pd.Series(pd.Timestamp(left), index=right.index)
+    return shift_timestamps(
+        timestamps, op.right, right, subtract=True
+    ).rename(right.name)
+
+
+@execute_node.register(ops.TimestampDiff, datetime.datetime, pd.Series)
+def execute_timestamp_diff_datetime_series(op, left, right, **kwargs):
     return pd.Timestamp(left) - right
 
 
-@execute_node.register(ops.TimestampSub, pd.Series, datetime.timedelta)
+@execute_node.register(
+    (ops.TimestampSub, ops.DateSub), pd.Series, datetime.timedelta
+)
 def execute_timestamp_sub_series_timedelta(op, left, right, **kwargs):
     return left - pd.Timedelta(right)
 
 
 @execute_node.register(
-    (ops.TimestampDiff, ops.TimestampSub), pd.Series, pd.Series)
+    (ops.TimestampDiff, ops.TimestampSub, ops.DateSub), pd.Series, pd.Series)
 def execute_timestamp_diff_sub_series_series(op, left, right, **kwargs):
-    return left - right
+    if isinstance(op, ops.TimestampDiff):
+        return left - right
+    return shift_timestamps(left, op.right, right, subtract=True)
 
 
 @execute_node.register(ops.TimestampDiff, datetime.datetime, datetime.datetime)
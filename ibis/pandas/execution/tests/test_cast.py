@@ -139,3 +139,25 @@ def test_cast_to_decimal(t, df, type):
         1 <= len(element.as_tuple().digits) <= type.precision
         for element in result.values
     )
+
+
+@pytest.mark.parametrize(
+    'values',
+    [
+        ['2017-01-02', '2017-01-03', '2017-01-02', None],
+        ['2017-01-02 01:02:03', '2017-01-02 01:02:03', '2017-01-03 00:00:00'],
+        ['Jan 2 2017', '2017-01-03', 'Jan 2 2017'],
+        [None, None],
+    ]
+)
+@pytest.mark.parametrize('to', ['timestamp', 'date'])
+def test_cast_strings_to_temporal(values, to):
+    df = pd.DataFrame({'strings': values})
+    t = ibis.pandas.connect({'df': df}).table(
+        'df', schema={'strings': dt.string}
+    )
+    result = t.strings.cast(to).execute()
+    expected = pd.to_datetime(df.strings).rename('strings')
+    if to == 'date':
+        expected = expected.dt.normalize()
+    tm.assert_series_equal(result, expected)
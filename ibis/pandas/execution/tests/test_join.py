@@ -5,9 +5,10 @@ import pytest
 
 import ibis
 
-
 pytest.importorskip('multipledispatch')
 
+from ibis.pandas.dispatch import pre_execute  # noqa: E402
+
 pytestmark = pytest.mark.pandas
 
 
@@ -81,19 +82,130 @@ def test_join_with_multiple_predicates_written_as_one(
     tm.assert_frame_equal(result[expected.columns], expected)
 
 
+@join_type
+@pytest.mark.parametrize('ratio', [0, 1])
+@pytest.mark.parametrize(
+    'predicates',
+    [
+        lambda left, right: [left.key == right.key],
+        lambda left, right: [
+            left.key == right.key, left.key2 == right.key3
+        ],
+        lambda left, right: [right.key.length() == left.key.length()],
+    ]
+)
+def test_join_prefilter(how, left, right, ratio, predicates):
+    expr = left.join(right, predicates(left, right), how=how)[
+        left.key.name('left_key'), left.value, right.other_value
+    ]
+    with ibis.config.option_context('pandas.join_prefilter_ratio', None):
+        expected = expr.execute()
+    with ibis.config.option_context('pandas.join_prefilter_ratio', ratio):
+        result = expr.execute()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_join_prunes_unused_columns(client, left, right):
+    expr = left.join(right, left.key == right.key)[
+        left.value, right.other_value
+    ]
+    scope = pre_execute(expr.op(), client, scope={})
+    assert list(scope[left.op()].columns) == ['key', 'value']
+    assert list(scope[right.op()].columns) == ['key', 'other_value']
+
+    expr = left.join(right, left.key == right.key)[left, right.other_value]
+    scope = pre_execute(expr.op(), client, scope={})
+    assert left.op() not in scope
+    assert list(scope[right.op()].columns) == ['key', 'other_value']
+
+    expr = left.join(right, left.key == right.key)[
+        left, right.other_value, right.key3
+    ]
+    assert pre_execute(expr.op(), client, scope={}) == {}
+
+
 @join_type
 def test_join_with_invalid_predicates(how, left, right):
-    predicate = (left.key == right.key) & (left.key2 <= right.key3)
+    predicate = (left.key == right.key) | (left.key2 <= right.key3)
     expr = left.join(right, predicate, how=how)
     with pytest.raises(TypeError):
         expr.execute()
 
-    predicate = left.key >= right.key
+    predicate = (left.key == right.key) & (left.key2 <= left.key)
     expr = left.join(right, predicate, how=how)
     with pytest.raises(TypeError):
         expr.execute()
 
 
+def _cross_join_filter(df1, df2, how, predicate):
+    df1 = df1.add_prefix('left_').assign(_left_row=range(len(df1)))
+    df2 = df2.add_prefix('right_').assign(_right_row=range(len(df2)))
+    cross = pd.merge(df1.assign(_cross=1), df2.assign(_cross=1), on='_cross')
+    matched = cross.loc[predicate(cross)]
+    pieces = [matched]
+    if how in {'left', 'outer'}:
+        pieces.append(df1.loc[~df1._left_row.isin(matched._left_row)])
+    if how in {'right', 'outer'}:
+        pieces.append(df2.loc[~df2._right_row.isin(matched._right_row)])
+    return pd.concat(pieces, ignore_index=True)
+
+
+@join_type
+@pytest.mark.parametrize(
+    ('predicate', 'expected_predicate'),
+    [
+        (
+            lambda left, right: [
+                left.key == right.key, left.key2 <= right.key3
+            ],
+            lambda df: (df.left_key == df.right_key) & (
+                df.left_key2 <= df.right_key3
+            ),
+        ),
+        (
+            lambda left, right: left.key >= right.key,
+            lambda df: df.left_key >= df.right_key,
+        ),
+        (
+            lambda left, right: right.other_value.between(
+                left.value, left.value + 1
+            ),
+            lambda df: df.right_other_value.between(
+                df.left_value, df.left_value + 1
+            ),
+        ),
+        (
+            lambda left, right: (left.key != right.key) & (
+                left.value < right.other_value
+            ),
+            lambda df: (df.left_key != df.right_key) & (
+                df.left_value < df.right_other_value
+            ),
+        ),
+    ]
+)
+def test_join_with_non_equality_predicates(
+    how, left, right, df1, df2, predicate, expected_predicate
+):
+    expr = left.join(right, predicate(left, right), how=how)[
+        left.value, left.key2, right.other_value, right.key3
+    ]
+    result = expr.execute()
+    expected = _cross_join_filter(df1, df2, how, expected_predicate)
+    expected = expected.rename(columns={
+        'left_value': 'value',
+        'left_key2': 'key2',
+        'right_other_value': 'other_value',
+        'right_key3': 'key3',
+    })
+    columns = ['value', 'key2', 'other_value', 'key3']
+    tm.assert_frame_equal(
+        result[columns].sort_values(columns).reset_index(drop=True),
+        expected[columns].sort_values(columns).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
 @join_type
 @pytest.mark.xfail(reason='Hard to detect this case')
 def test_join_with_duplicate_non_key_columns(how, left, right, df1, df2):
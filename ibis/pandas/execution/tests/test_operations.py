@@ -82,6 +82,23 @@ def test_selection(t, df):
     tm.assert_frame_equal(result[expected.columns], expected)
 
 
+def test_selection_with_filter_and_scalar_projection(t, df):
+    expr = t[t.plain_int64 > 1][
+        t.plain_int64,
+        ibis.literal('a').name('string_literal'),
+        ibis.literal(1.5).name('float_literal'),
+        t.plain_float64.max().name('max_float64'),
+    ]
+    result = expr.execute()
+    expected = df.loc[df.plain_int64 > 1, ['plain_int64']].assign(
+        string_literal='a',
+        float_literal=1.5,
+        max_float64=df.plain_float64.max(),
+    ).reset_index(drop=True)
+    tm.assert_frame_equal(result, expected)
+    assert isinstance(result.index, pd.RangeIndex)
+
+
 def test_mutate(t, df):
     expr = t.mutate(x=t.plain_int64 + 1, y=t.plain_int64 * 2)
     result = expr.execute()
@@ -89,6 +106,19 @@ def test_mutate(t, df):
     tm.assert_frame_equal(result[expected.columns], expected)
 
 
+def test_chained_mutate(t, df):
+    expr = t.mutate(x=t.plain_int64 + 1)
+    expr = expr.mutate(y=expr.x * 2)[['plain_int64', 'x', 'y']]
+    expr = expr[expr.y > 4].mutate(z=lambda t: t.x + t.y)
+    result = expr.execute()
+    expected = df[['plain_int64']].assign(x=df.plain_int64 + 1)
+    expected = expected.assign(y=expected.x * 2)
+    expected = expected[expected.y > 4].reset_index(drop=True)
+    expected = expected.assign(z=expected.x + expected.y)
+    tm.assert_frame_equal(result, expected)
+    assert isinstance(result, pd.DataFrame)
+
+
 @pytest.mark.parametrize(
     'where',
     [
@@ -166,6 +196,86 @@ def test_aggregation_group_by(t, df, where, ibis_func, pandas_func):
     tm.assert_frame_equal(lhs, rhs)
 
 
+@pytest.mark.parametrize(
+    'where',
+    [
+        lambda t: None,
+        lambda t: t.dup_strings == 'd',
+        lambda t: t.plain_float64 > 4.0,
+    ]
+)
+def test_aggregation_group_by_simple_metrics(t, df, where):
+    ibis_where = where(t)
+    expr = t.group_by(t.dup_strings).aggregate(
+        sum_int64=t.plain_int64.sum(where=ibis_where),
+        mean_float64=t.plain_float64.mean(where=ibis_where),
+        count_float64=t.plain_float64.count(where=ibis_where),
+        count=t.count(),
+        min_int64=t.plain_int64.min(where=ibis_where),
+        max_float64=t.plain_float64.max(where=ibis_where),
+        std_float64=t.plain_float64.std(where=ibis_where),
+        var_int64=t.plain_int64.var(where=ibis_where),
+        nunique_dup_ints=t.dup_ints.nunique(where=ibis_where),
+    )
+    result = expr.execute()
+
+    pandas_where = where(df)
+    if pandas_where is None:
+        pandas_where = pd.Series(True, index=df.index)
+    expected = df.groupby('dup_strings').apply(
+        lambda df, mask=pandas_where: df.loc[mask[df.index]].pipe(
+            lambda df: pd.Series({
+                'sum_int64': df.plain_int64.sum(),
+                'mean_float64': df.plain_float64.mean(),
+                'count_float64': df.plain_float64.count(),
+                'min_int64': df.plain_int64.min(),
+                'max_float64': df.plain_float64.max(),
+                'std_float64': df.plain_float64.std(),
+                'var_int64': df.plain_int64.var(),
+                'nunique_dup_ints': df.dup_ints.nunique(),
+            })
+        )
+    ).assign(count=df.groupby('dup_strings').size()).reset_index()
+    tm.assert_frame_equal(
+        result[expected.columns], expected, check_dtype=False
+    )
+    assert result.sum_int64.dtype == np.int64
+    assert result['count'].dtype == np.int64
+
+
+def test_aggregation_group_by_simple_metrics_empty_group():
+    df = pd.DataFrame({
+        'key': list('aabb'),
+        'value': [1, 2, 3, 4],
+        'nulls': [1.0, np.nan, np.nan, np.nan],
+    })
+    t = ibis.pandas.connect({'df': df}).table('df')
+    where = t.value > 2
+
+    # derived arguments are not computed in a single aggregation pass
+    expr = t.group_by('key').aggregate(
+        sum_value=t.value.sum(where=where),
+        max_value=t.value.max(where=where),
+        sum_nulls=t.nulls.sum(),
+        count_nulls=t.nulls.count(),
+    )
+    expected_expr = t.group_by('key').aggregate(
+        sum_value=(t.value + 0).sum(where=where),
+        max_value=(t.value + 0).max(where=where),
+        sum_nulls=(t.nulls + 0).sum(),
+        count_nulls=(t.nulls + 0).count(),
+    )
+    result = expr.execute()
+    expected = expected_expr.execute()
+    tm.assert_frame_equal(result, expected)
+
+    # group 'a' has no values: its sums are 0 and its max is missing
+    assert result.sum_value.tolist() == [0, 7]
+    assert result.sum_value.dtype == np.int64
+    assert result.sum_nulls.tolist() == [1.0, 0.0]
+    assert pd.isnull(result.max_value[0])
+
+
 def test_aggregation_without_group_by(t, df):
     expr = t.aggregate(
         avg_plain_int64=t.plain_int64.mean(),
@@ -347,6 +457,68 @@ def test_complex_sort_by(t, df):
     tm.assert_frame_equal(result[expected.columns], expected)
 
 
+@pytest.mark.parametrize(
+    ('key', 'pandas_by', 'pandas_ascending'),
+    [
+        (lambda t: [t.a], ['a'], True),
+        (lambda t: [ibis.desc(t.a)], ['a'], False),
+        (lambda t: [ibis.desc(t.b)], ['b'], False),
+        (lambda t: [t.s, ibis.desc(t.b)], ['s', 'b'], [True, False]),
+        (lambda t: [ibis.desc(t.s), t.a], ['s', 'a'], [False, True]),
+        (
+            lambda t: [t.ts, ibis.desc(t.s), t.b],
+            ['ts', 's', 'b'],
+            [True, False, True],
+        ),
+    ]
+)
+def test_sort_by_with_ties_and_nulls(key, pandas_by, pandas_ascending):
+    n = 100
+    np.random.seed(0)
+    df = pd.DataFrame({
+        'a': np.random.choice([np.nan, 1.5, 2.0, -3.0], size=n),
+        'b': np.random.choice(n, size=n),
+        's': np.random.choice(['x', 'y', None, 'z'], size=n),
+        'ts': pd.Series(pd.to_datetime(
+            np.random.choice(['2018-01-01', '2017-02-03', None], size=n)
+        )),
+    })
+    t = ibis.pandas.connect({'df': df}).table('df')
+    result = t.sort_by(key(t)).execute()
+    expected = df.sort_values(
+        pandas_by, ascending=pandas_ascending, kind='mergesort'
+    ).reset_index(drop=True)
+    tm.assert_frame_equal(result[expected.columns], expected)
+
+
+@pytest.mark.parametrize(('n', 'offset'), [(0, 0), (3, 0), (4, 2), (20, 0)])
+@pytest.mark.parametrize(
+    ('key', 'pandas_by', 'pandas_ascending'),
+    [
+        (lambda t: [t.a], ['a'], True),
+        (lambda t: [ibis.desc(t.a)], ['a'], False),
+        (lambda t: [t.b, ibis.desc(t.c)], ['b', 'c'], [True, False]),
+        (lambda t: [ibis.desc(t.b), t.c], ['b', 'c'], [False, True]),
+        (lambda t: [ibis.desc(t.a * 2), t.c], ['a', 'c'], [False, True]),
+        (lambda t: [t.d, t.c], ['d', 'c'], True),
+    ]
+)
+def test_sort_by_limit(n, offset, key, pandas_by, pandas_ascending):
+    df = pd.DataFrame({
+        'a': [3.0, np.nan, 1.0, 3.0, 2.0, 1.0, np.nan, 5.0, 3.0, 0.0],
+        'b': [2, 1, 2, 1, 0, 0, 1, 2, 0, 2],
+        'c': list(range(10)),
+        'd': list('bcabcabcab'),
+    })
+    t = ibis.pandas.connect({'df': df}).table('df')
+    expr = t.sort_by(key(t)).limit(n, offset=offset)
+    result = expr.execute()
+    expected = df.sort_values(
+        pandas_by, ascending=pandas_ascending, kind='mergesort'
+    ).reset_index(drop=True).iloc[offset:offset + n]
+    tm.assert_frame_equal(result[expected.columns], expected)
+
+
 def test_distinct(t, df):
     expr = t.dup_strings.distinct()
     result = expr.execute()
@@ -354,6 +526,109 @@ def test_distinct(t, df):
     tm.assert_series_equal(result, expected)
 
 
+@pytest.mark.parametrize('distinct', [False, True])
+def test_union(t, df, distinct):
+    left = t[['dup_strings', 'dup_ints']]
+    right = t[t.dup_strings == 'a'][['dup_strings', 'dup_ints']]
+    expr = left.union(right, distinct=distinct).union(right, distinct=False)
+    result = expr.execute()
+
+    left_df = df[['dup_strings', 'dup_ints']]
+    right_df = left_df[left_df.dup_strings == 'a']
+    expected = pd.concat([left_df, right_df], ignore_index=True)
+    if distinct:
+        expected = expected.drop_duplicates().reset_index(drop=True)
+    expected = pd.concat([expected, right_df], ignore_index=True)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_distinct_table(t, df):
+    expr = t[['dup_strings', 'dup_ints']].distinct()
+    result = expr.execute()
+    expected = df[['dup_strings', 'dup_ints']].drop_duplicates().reset_index(
+        drop=True
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_distinct_table_with_nulls():
+    df = pd.DataFrame({
+        'a': [1.0, np.nan, 1.0, np.nan, 2.0],
+        'b': ['x', None, 'x', None, None],
+    })
+    t = ibis.pandas.connect({'df': df}).table('df')
+    result = t.distinct().execute()
+    expected = df.drop_duplicates().reset_index(drop=True)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_searched_case(t, df):
+    expr = ibis.case().when(
+        t.plain_int64 > 2, 'large'
+    ).when(
+        t.plain_int64 > 1, 'medium'
+    ).else_('small').end().name('size')
+    result = t[expr].execute()['size']
+    expected = pd.Series(
+        np.select(
+            [df.plain_int64 > 2, df.plain_int64 > 1],
+            ['large', 'medium'],
+            default='small'
+        ),
+        name='size',
+        dtype=object,
+    )
+    tm.assert_series_equal(result, expected)
+
+
+def test_searched_case_column_results(t, df):
+    expr = ibis.case().when(
+        t.plain_float64 > 5, t.plain_float64 * 2
+    ).when(
+        t.plain_float64 > 4, t.plain_float64.sum()
+    ).end()
+    result = t.mutate(result=expr).execute().result
+    expected = pd.Series(
+        np.select(
+            [df.plain_float64 > 5, df.plain_float64 > 4],
+            [df.plain_float64 * 2, df.plain_float64.sum()],
+            default=np.nan
+        ),
+        name='result',
+    )
+    tm.assert_series_equal(result, expected)
+
+
+def test_simple_case(t, df):
+    expr = t.dup_strings.case().when(
+        'a', t.plain_int64
+    ).when(
+        'd', t.plain_int64 * 10
+    ).when(
+        'a', 0
+    ).else_(-1).end().name('result')
+    result = t[t.plain_int64 > 1][expr].execute().result
+    filtered = df[df.plain_int64 > 1].reset_index(drop=True)
+    expected = pd.Series(
+        np.select(
+            [filtered.dup_strings == 'a', filtered.dup_strings == 'd'],
+            [filtered.plain_int64, filtered.plain_int64 * 10],
+            default=-1
+        ),
+        name='result',
+    )
+    tm.assert_series_equal(result, expected)
+
+
+def test_coalesce(t, df):
+    expr = ibis.coalesce(
+        t.strings_with_nulls, ibis.NA, t.plain_strings, 'z'
+    ).name('result')
+    result = t[expr].execute().result
+    expected = df.strings_with_nulls.fillna(df.plain_strings).rename('result')
+    tm.assert_series_equal(result, expected)
+
+
 def test_count_distinct(t, df):
     expr = t.dup_strings.nunique()
     result = expr.execute()
@@ -777,3 +1052,44 @@ def test_quantile_groupby(batting, batting_df):
                            interpolation=intp)
                 .rename('res'))
     tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    'expr_func',
+    [
+        lambda t: t.dup_strings.upper(),
+        lambda t: t.dup_strings.length(),
+        lambda t: t.dup_strings.re_search('[ab]'),
+        lambda t: t.strings_with_nulls == 'a',
+        lambda t: t.strings_with_nulls != 'a',
+        lambda t: t.dup_strings > 'a',
+        lambda t: t.dup_strings.isin(['a']),
+        lambda t: t[t.dup_strings == 'd'].plain_int64,
+        lambda t: t.sort_by('strings_with_nulls').strings_with_nulls,
+        lambda t: t.sort_by(ibis.desc('dup_strings')).plain_int64,
+    ]
+)
+def test_dictionary_encoded_strings(t, expr_func):
+    expr = expr_func(t)
+    expected = expr.execute()
+    with ibis.config.option_context('pandas.categorical_threshold', 1.0):
+        result = expr.execute()
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    'expr_func',
+    [
+        lambda t: t.groupby(['dup_strings', 'strings_with_nulls']).aggregate(
+            total=t.plain_int64.sum()
+        ),
+        lambda t: t[['dup_strings', 'strings_with_nulls', 'plain_int64']],
+        lambda t: t.mutate(upper=t.dup_strings.upper()),
+    ]
+)
+def test_dictionary_encoded_strings_frame(t, expr_func):
+    expr = expr_func(t)
+    expected = expr.execute()
+    with ibis.config.option_context('pandas.categorical_threshold', 1.0):
+        result = expr.execute()
+    tm.assert_frame_equal(result, expected)
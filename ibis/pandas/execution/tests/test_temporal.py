@@ -1,5 +1,6 @@
 import pytest
 import datetime
+import operator
 from operator import methodcaller
 
 import numpy as np
@@ -182,3 +183,122 @@ def test_interval_arithmetic(op, expected):
     result = expr.execute()
     expected = pd.Series(expected(data, data), name='td')
     tm.assert_series_equal(result, expected)
+
+
+@pytest.fixture(scope='module')
+def offsets_df():
+    return pd.DataFrame({
+        'timestamps': pd.to_datetime([
+            '2017-01-31 10:30:00',
+            '2016-02-29 00:00:01',
+            '2017-05-15 23:59:59',
+            None,
+            '2018-12-31 12:00:00',
+        ]),
+        'ints': [1, -2, 3, 4, 13],
+    })
+
+
+@pytest.mark.parametrize(
+    'unit', ['Y', 'Q', 'M', 'W', 'D', 'h', 'm', 's', 'ms', 'us']
+)
+@pytest.mark.parametrize('tz', [None, 'America/New_York'])
+@pytest.mark.parametrize(
+    ('op', 'offset_op'),
+    [
+        (lambda x, y: x + y, lambda x, y: x + y),
+        (lambda x, y: x - y, lambda x, y: x - y),
+    ]
+)
+def test_integer_to_interval_arithmetic(offsets_df, unit, tz, op, offset_op):
+    df = offsets_df.assign(timestamps=offsets_df.timestamps.dt.tz_localize(tz))
+    t = ibis.pandas.connect({'df': df}).table('df')
+    interval = t.ints.to_interval(unit=unit)
+    result = op(t.timestamps, interval).execute()
+
+    resolution = '{}s'.format(interval.type().resolution)
+    if resolution == 'quarters':
+        offsets = [pd.DateOffset(months=3 * n) for n in df.ints]
+    else:
+        offsets = [pd.DateOffset(**{resolution: n}) for n in df.ints]
+    expected = pd.Series(
+        [
+            pd.NaT if pd.isnull(value) else offset_op(value, offset)
+            for value, offset in zip(df.timestamps, offsets)
+        ],
+    )
+    tm.assert_series_equal(result, expected, check_names=False)
+
+
+def test_interval_from_integer_fixed_width(offsets_df):
+    t = ibis.pandas.connect({'df': offsets_df}).table('df')
+    result = t.ints.to_interval(unit='h').execute()
+    expected = pd.to_timedelta(offsets_df.ints, unit='h')
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize('unit', ['Y', 'Q', 'M'])
+def test_interval_from_integer_calendar_units(offsets_df, unit):
+    t = ibis.pandas.connect({'df': offsets_df}).table('df')
+    result = t.ints.to_interval(unit=unit).execute()
+    months = {'Y': 12, 'Q': 3, 'M': 1}[unit]
+    if unit == 'Y':
+        offsets = [pd.DateOffset(years=n) for n in offsets_df.ints]
+    else:
+        offsets = [pd.DateOffset(months=months * n) for n in offsets_df.ints]
+    expected = pd.Series(offsets, name='ints')
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    'literal', [ibis.timestamp('2017-01-31'), ibis.date('2017-01-31')]
+)
+@pytest.mark.parametrize('op', [operator.add, operator.sub])
+def test_scalar_month_interval_arithmetic(offsets_df, literal, op):
+    t = ibis.pandas.connect({'df': offsets_df}).table('df')
+    result = op(literal, t.ints.to_interval(unit='M')).execute()
+    value = pd.Timestamp('2017-01-31')
+    expected = pd.Series(
+        [op(value, pd.DateOffset(months=n)) for n in offsets_df.ints]
+    )
+    tm.assert_series_equal(result, expected, check_names=False)
+
+
+def test_calendar_interval_column_in_table(offsets_df):
+    t = ibis.pandas.connect({'df': offsets_df}).table('df')
+    result = t[t.ints, t.ints.to_interval(unit='M').name('months')].execute()
+    expected = pd.DataFrame({
+        'ints': offsets_df.ints,
+        'months': [pd.DateOffset(months=n) for n in offsets_df.ints],
+    }, columns=['ints', 'months'])
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('op', [operator.add, operator.sub])
+def test_month_interval_arithmetic_with_nulls(offsets_df, op):
+    df = offsets_df.assign(ints=[1, None, 3, 4, None])
+    t = ibis.pandas.connect({'df': df}).table('df', schema={'ints': 'int64'})
+    result = op(t.timestamps, t.ints.to_interval(unit='M')).execute()
+    expected = pd.Series([
+        pd.NaT if pd.isnull(value) or pd.isnull(n)
+        else op(value, pd.DateOffset(months=int(n)))
+        for value, n in zip(df.timestamps, df.ints)
+    ])
+    tm.assert_series_equal(result, expected, check_names=False)
+
+
+def test_calendar_interval_execute_function(offsets_df):
+    t = ibis.pandas.connect({'df': offsets_df}).table('df')
+    expr = t.ints.to_interval(unit='Q')
+    result = ibis.pandas.execute(expr)
+    expected = pd.Series(
+        [pd.DateOffset(months=3 * n) for n in offsets_df.ints], name='ints'
+    )
+    tm.assert_series_equal(result, expected)
+
+    shifted = ibis.pandas.execute(t.timestamps + expr)
+    expected = pd.Series([
+        value + offset
+        for value, offset in zip(offsets_df.timestamps, expected)
+    ])
+    tm.assert_series_equal(shifted, expected, check_names=False)
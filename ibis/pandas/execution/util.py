@@ -1,9 +1,19 @@
 import operator
 
+import six
+
+import numpy as np
+import pandas as pd
+
 import ibis
 import ibis.common as com
+import ibis.expr.lineage as lin
+import ibis.expr.operations as ops
+import ibis.expr.types as ir
 
+from ibis.compat import get_group_index_sorter
 from ibis.pandas.core import execute
+from ibis.pandas.frame import reset_default_index  # noqa: F401
 
 
 def compute_sort_key(key, data, **kwargs):
@@ -19,22 +29,342 @@ def compute_sort_key(key, data, **kwargs):
 
 
 def compute_sorted_frame(sort_keys, df, **kwargs):
-    computed_sort_keys = []
-    ascending = [key.op().ascending for key in sort_keys]
-    new_columns = {}
+    return df.take(compute_sort_indexer(sort_keys, df, **kwargs))
+
+
+def compute_sort_indexer(sort_keys, df, **kwargs):
+    """Compute the positions that stably sort `df` by `sort_keys`.
+
+    Each key is factorized into integer codes that sort like its values, with
+    missing values last. The codes are combined into a single integer key that
+    is sorted with a counting sort where possible, so that only a permutation
+    is computed and no temporary columns are added to `df`.
+
+    Parameters
+    ----------
+    sort_keys : List[ir.SortExpr]
+    df : pd.DataFrame
+
+    Returns
+    -------
+    indexer : np.ndarray[int64]
+    """
+    nrows = len(df.index)
+    columns = []
+    for key in map(operator.methodcaller('op'), sort_keys):
+        name, column = compute_sort_key(key, df, **kwargs)
+        if column is None:
+            column = df[name]
+        columns.append((column, key.ascending))
+
+    # floating point and nearly unique keys are cheaper to sort directly than
+    # through their codes
+    if len(columns) == 1:
+        (column, ascending), = columns
+        if pd.api.types.is_float_dtype(column.dtype):
+            return _argsort(column, ascending)
+
+    codes = []
+    for column, ascending in columns:
+        key_codes, nvalues = _sort_codes(column, ascending)
+        if len(columns) == 1 and nvalues > nrows // 2 and not is_categorical(
+            column
+        ):
+            return _argsort(column, ascending)
+        codes.append((key_codes, nvalues + 1))
+
+    # combine the codes of every key into a single integer key when they fit
+    # in 64 bits, otherwise fall back to a lexicographic sort
+    combined = np.zeros(nrows, dtype=np.int64)
+    size = 1
+    for key_codes, ncodes in codes:
+        size *= ncodes
+        if size > np.iinfo(np.int64).max:
+            return np.lexsort([key_codes for key_codes, _ in codes[::-1]])
+        combined *= ncodes
+        combined += key_codes
+    return get_group_index_sorter(combined, size)
+
+
+def _sort_codes(column, ascending):
+    """Factorize `column` into codes that sort like its values.
+
+    Returns
+    -------
+    codes : Tuple[np.ndarray[int64], int]
+        The codes, where missing values are coded as the number of distinct
+        values so that they sort last, and the number of distinct values.
+    """
+    if is_categorical(column):
+        codes = column.cat.codes.values.astype(np.int64)
+        nvalues = len(column.cat.categories)
+    else:
+        codes, uniques = pd.factorize(column)
+        nvalues = len(uniques)
+
+        # rank the distinct values instead of sorting every row
+        ranks = np.empty(nvalues, dtype=np.int64)
+        ranks[uniques.argsort(kind='mergesort')] = np.arange(nvalues)
+        codes = np.where(codes == -1, -1, ranks[codes])
+
+    missing = codes == -1
+    if not ascending:
+        codes = nvalues - 1 - codes
+    codes[missing] = nvalues
+    return codes, nvalues
+
+
+def _argsort(column, ascending):
+    """Stably argsort `column`, with missing values last."""
+    missing = column.isnull().values
+    present = np.flatnonzero(~missing)
+    values = column.values[present]
+
+    if ascending:
+        order = np.argsort(values, kind='mergesort')
+    else:
+        # sort the reversed values so that equal values stay in input order
+        # once the order is reversed back
+        order = len(values) - 1 - np.argsort(
+            values[::-1], kind='mergesort'
+        )[::-1]
+    return np.concatenate([present[order], np.flatnonzero(missing)])
+
+
+# Operations whose result for a row depends on other rows of the table
+NON_ROW_WISE_OPS = ops.Reduction, ops.AnalyticOp, ops.WindowOp, ops.TopK
+
+
+def is_row_wise(expr):
+    """Return whether each row of `expr` depends only on the same row of its
+    input.
+    """
+    def visit(expr):
+        if isinstance(expr, ir.TableExpr):
+            return lin.halt, None
+        if isinstance(expr.op(), NON_ROW_WISE_OPS):
+            return lin.halt, True
+        return lin.proceed, None
+
+    return not any(lin.traverse(visit, expr))
+
+
+def compute_sorted_frame_head(sort_keys, df, n, **kwargs):
+    """Compute the first `n` rows of `df` sorted by `sort_keys`.
+
+    The result is identical to ``compute_sorted_frame(sort_keys, df).head(n)``
+    but only rows that can be among the first `n` are sorted: rows whose first
+    sort key is worse than the `n`-th best value of that key are discarded
+    with a partial sort before the stable sort of the remaining rows.
+
+    Parameters
+    ----------
+    sort_keys : List[ir.SortExpr]
+    df : pd.DataFrame
+    n : int
+
+    Returns
+    -------
+    result : pd.DataFrame
+    """
+    if n <= 0:
+        df = df.iloc[:0]
+    elif n < len(df.index):
+        key = sort_keys[0].op()
+        name, column = compute_sort_key(key, df, **kwargs)
+        if column is None:
+            column = df[name]
+        if is_categorical(column):
+            column = sortable_codes(column)
+
+        candidates = _top_k_candidates(column, n, key.ascending)
+        if candidates is not None:
+            df = df.loc[candidates]
+    return df.take(compute_sort_indexer(sort_keys, df, **kwargs)[:n])
+
+
+def _top_k_candidates(column, n, ascending):
+    """Compute a mask of the rows of `column` that can be among the first `n`
+    rows when sorting by `column`, or ``None`` if `column` cannot be
+    partitioned.
+    """
+    dtype = column.dtype
+    if not (
+        pd.api.types.is_numeric_dtype(dtype) or
+        pd.api.types.is_datetime64_dtype(dtype) or
+        pd.api.types.is_timedelta64_dtype(dtype)
+    ):
+        return None
+
+    notnull = column.notnull().values
+    values = column.values[notnull]
+
+    # missing values sort last, so they are candidates only if there are fewer
+    # than n non-missing values
+    if len(values) <= n:
+        return None
 
-    for i, key in enumerate(map(operator.methodcaller('op'), sort_keys)):
-        computed_sort_key, temporary_column = compute_sort_key(
-            key, df, **kwargs
+    if ascending:
+        threshold = np.partition(values, n - 1)[n - 1]
+        candidates = column.values <= threshold
+    else:
+        threshold = np.partition(values, len(values) - n)[len(values) - n]
+        candidates = column.values >= threshold
+    return candidates & notnull
+
+
+def broadcast_scalar(scalar, index, name=None):
+    """Repeat `scalar` for every row of `index`.
+
+    The values are allocated once, instead of also materializing the
+    intermediate index created by :meth:`pandas.Series.repeat`.
+    """
+    result = pd.Series([scalar], name=name)
+    if isinstance(result.dtype, np.dtype):
+        return pd.Series(
+            np.repeat(result.values, len(index)), index=index, name=name
         )
-        computed_sort_keys.append(computed_sort_key)
+    result = result.repeat(len(index))
+    result.index = index
+    return result
+
+
+def distinct_rows(df):
+    """Compute a mask of the first occurrence of each distinct row of `df`.
+
+    Every column is factorized once into integer codes, treating missing
+    values as equal to each other. The codes are combined into a single
+    integer key per row, which is much cheaper to hash than the rows
+    themselves.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
 
-        if temporary_column is not None:
-            new_columns[computed_sort_key] = temporary_column
+    Returns
+    -------
+    mask : np.ndarray[bool]
+    """
+    nrows = len(df.index)
+    combined = np.zeros(nrows, dtype=np.int64)
+    size = 1
+    for _, column in df.iteritems():
+        if is_categorical(column):
+            codes = column.cat.codes.values
+            nvalues = len(column.cat.categories)
+        else:
+            codes, uniques = pd.factorize(column.values)
+            nvalues = len(uniques)
 
-    result = df.assign(**new_columns)
-    result = result.sort_values(
-        computed_sort_keys, ascending=ascending, kind='mergesort'
+        # code missing values as 0
+        codes = codes.astype(np.int64) + 1
+        ncodes = nvalues + 1
+
+        if size * ncodes > np.iinfo(np.int64).max:
+            # renumber the keys computed so far, of which there are at most
+            # as many as there are rows
+            combined, uniques = pd.factorize(combined)
+            combined = combined.astype(np.int64)
+            size = len(uniques)
+
+        combined *= ncodes
+        combined += codes
+        size *= ncodes
+    return ~pd.Series(combined).duplicated().values
+
+
+def is_categorical(data):
+    """Is `data` a dictionary encoded (categorical) pandas Series?"""
+    return isinstance(data, pd.Series) and pd.api.types.is_categorical_dtype(
+        data.dtype
     )
-    result = result.drop(new_columns.keys(), axis=1)
-    return result
+
+
+def compute_on_categories(func, data):
+    """Evaluate `func` once per category of the categorical Series `data`
+    and broadcast the result back to the rows of `data` using its codes.
+
+    Parameters
+    ----------
+    func : Callable[[pd.Series], Union[pd.Series, np.ndarray]]
+        An elementwise function
+    data : pd.Series
+        A Series with a categorical dtype
+
+    Returns
+    -------
+    result : pd.Series
+    """
+    categorical = data.values
+    codes = categorical.codes
+    categories = categorical.categories.values
+
+    if (codes == -1).any():
+        # missing values have a code of -1, so append a null category that
+        # take will pick up as the last element
+        categories = np.append(categories.astype(object), np.nan)
+
+    result = np.asarray(func(pd.Series(categories)))
+    return pd.Series(result.take(codes), index=data.index, name=data.name)
+
+
+def sortable_codes(data):
+    """Return the codes of the categorical Series `data` with missing values
+    as NaN, so that sorting them sorts `data` by value with nulls last.
+    """
+    codes = data.cat.codes.astype(np.float64)
+    codes[codes == -1] = np.nan
+    return codes.rename(data.name)
+
+
+def group_by(data, keys, **kwargs):
+    """Group `data` by `keys`, grouping dictionary encoded keys by their
+    integer codes.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+    keys : List[Union[str, pd.Series]]
+    kwargs : dict
+        Passed to :meth:`pandas.DataFrame.groupby`
+
+    Returns
+    -------
+    grouped : pandas.core.groupby.DataFrameGroupBy
+    categories : Dict[str, pd.Index]
+        The categories of each dictionary encoded key by name, used to decode
+        group keys with :func:`decode_group_keys`.
+    """
+    grouping_keys = []
+    categories = {}
+
+    for key in keys:
+        column = data[key] if isinstance(key, six.string_types) else key
+        if is_categorical(column):
+            categories[column.name] = column.cat.categories
+            key = sortable_codes(column)
+        grouping_keys.append(key)
+
+    return data.groupby(grouping_keys, **kwargs), categories
+
+
+def decode_group_keys(df, categories):
+    """Decode the integer codes of dictionary encoded group keys in `df`.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+    categories : Dict[str, pd.Index]
+
+    Returns
+    -------
+    df : pd.DataFrame
+
+    Notes
+    -----
+    Mutates `df`
+    """
+    for name, key_categories in categories.items():
+        codes = df[name].values.astype(np.int64)
+        df[name] = pd.Categorical.from_codes(codes, key_categories)
+    return df
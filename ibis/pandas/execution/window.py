@@ -21,12 +21,11 @@ from ibis.pandas.core import integer_types
 from ibis.pandas.dispatch import execute_node
 from ibis.pandas.core import execute
 from ibis.pandas.execution import util
+from ibis.pandas.frame import LazyFrame
 
 
 def _post_process_empty(scalar, index):
-    result = pd.Series([scalar]).repeat(len(index))
-    result.index = index
-    return result
+    return util.broadcast_scalar(scalar, index)
 
 
 def _post_process_group_by(series, index):
@@ -52,6 +51,9 @@ def execute_window_op(op, data, window, scope=None, context=None, **kwargs):
         data = scope[root]
     except KeyError:
         data = execute(root.to_expr(), scope=scope, context=context, **kwargs)
+    else:
+        if isinstance(data, LazyFrame):
+            data = data.to_frame()
 
     following = window.following
     order_by = window._order_by
@@ -78,7 +80,9 @@ def execute_window_op(op, data, window, scope=None, context=None, **kwargs):
     order_by = window._order_by
 
     if grouping_keys:
-        source = data.groupby(grouping_keys, sort=False, as_index=not order_by)
+        source, _ = util.group_by(
+            data, grouping_keys, sort=False, as_index=not order_by
+        )
 
         if order_by:
             sorted_df = source.apply(
@@ -86,7 +90,9 @@ def execute_window_op(op, data, window, scope=None, context=None, **kwargs):
                     util.compute_sorted_frame(order_by, df, **kwargs)
                 )
             )
-            source = sorted_df.groupby(grouping_keys, sort=False)
+            source, _ = util.group_by(
+                sorted_df, grouping_keys, sort=False
+            )
             post_process = _post_process_group_by_order_by
         else:
             post_process = _post_process_group_by
@@ -0,0 +1,198 @@
+"""Lightweight table representations passed between pandas execution rules.
+
+Building a :class:`pandas.DataFrame` for every intermediate table is often
+wasted work: a projection of a projection only takes columns back out of it,
+and a union of unions copies the rows of its inputs once per level.
+:class:`LazyFrame` subclasses hold the pieces of such an intermediate and are
+converted to a DataFrame only when a rule that needs one receives them, or
+when they are returned to the user.
+
+* :class:`ColumnFrame` holds the columns of a table as an ordered mapping of
+  names to :class:`pandas.Series` with a default ``RangeIndex``.
+* :class:`ConcatFrame` holds tables whose rows are concatenated.
+"""
+
+from __future__ import absolute_import
+
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def reset_default_index(obj):
+    """Give the DataFrame or Series `obj` a default ``RangeIndex`` without
+    copying its data.
+
+    Unlike ``obj.reset_index(drop=True)``, `obj` is returned as is when it
+    already has a default index, and only a shallow copy is made otherwise.
+    """
+    index = obj.index
+    default_index = pd.RangeIndex(len(index))
+    if isinstance(index, pd.RangeIndex) and index.equals(default_index):
+        return obj
+    result = obj.copy(deep=False)
+    result.index = default_index
+    return result
+
+
+class LazyFrame(object):
+    """A table that is converted to a DataFrame only when needed."""
+
+    __slots__ = '_frame',
+
+    def __init__(self):
+        self._frame = None
+
+    def to_frame(self):
+        """Convert to a DataFrame, at most once.
+
+        Returns
+        -------
+        frame : pd.DataFrame
+        """
+        if self._frame is None:
+            self._frame = self._build_frame()
+        return self._frame
+
+    def _build_frame(self):
+        raise NotImplementedError(
+            '{} must implement _build_frame'.format(type(self).__name__)
+        )
+
+    @property
+    def nbytes(self):
+        """The memory used by the values of the table"""
+        raise NotImplementedError(
+            '{} must implement nbytes'.format(type(self).__name__)
+        )
+
+
+class ColumnFrame(LazyFrame):
+    """An ordered mapping of column names to Series sharing a default index.
+
+    Parameters
+    ----------
+    columns : Mapping[str, pd.Series]
+        The columns of the table, all with the same default ``RangeIndex``
+    nrows : int
+    """
+
+    __slots__ = '_columns', 'index'
+
+    def __init__(self, columns, nrows):
+        super(ColumnFrame, self).__init__()
+        self._columns = OrderedDict(columns)
+        self.index = pd.RangeIndex(nrows)
+
+    @classmethod
+    def from_pieces(cls, pieces):
+        """Build a ColumnFrame from Series, DataFrames and ColumnFrames that
+        share the same rows.
+
+        Parameters
+        ----------
+        pieces : List[Union[pd.Series, pd.DataFrame, ColumnFrame]]
+
+        Returns
+        -------
+        frame : ColumnFrame
+        """
+        columns = OrderedDict()
+        for piece in pieces:
+            if isinstance(piece, pd.Series):
+                columns[piece.name] = reset_default_index(piece)
+            else:
+                columns.update(
+                    (name, reset_default_index(column))
+                    for name, column in piece.iteritems()
+                )
+        nrows = len(pieces[0].index) if pieces else 0
+        return cls(columns, nrows)
+
+    @property
+    def columns(self):
+        return pd.Index(list(self._columns.keys()))
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def iteritems(self):
+        return iter(self._columns.items())
+
+    @property
+    def nbytes(self):
+        return sum(
+            int(column.memory_usage(index=False))
+            for column in self._columns.values()
+        )
+
+    def _build_frame(self):
+        if self._columns:
+            return pd.DataFrame(self._columns)
+        return pd.DataFrame(index=self.index)
+
+    def __repr__(self):
+        return '{}(columns={!r}, nrows={:d})'.format(
+            type(self).__name__, list(self._columns.keys()), len(self)
+        )
+
+
+class ConcatFrame(LazyFrame):
+    """The concatenation of the rows of DataFrames with the same columns.
+
+    Parameters
+    ----------
+    pieces : List[pd.DataFrame]
+    """
+
+    __slots__ = 'pieces',
+
+    def __init__(self, pieces):
+        super(ConcatFrame, self).__init__()
+        self.pieces = list(pieces)
+
+    @classmethod
+    def from_tables(cls, tables):
+        """Concatenate DataFrames and ConcatFrames without copying rows.
+
+        Parameters
+        ----------
+        tables : List[Union[pd.DataFrame, ConcatFrame]]
+
+        Returns
+        -------
+        frame : ConcatFrame
+        """
+        pieces = []
+        for table in tables:
+            if isinstance(table, ConcatFrame):
+                pieces.extend(table.pieces)
+            else:
+                pieces.append(table)
+        return cls(pieces)
+
+    def __len__(self):
+        return sum(len(piece.index) for piece in self.pieces)
+
+    @property
+    def nbytes(self):
+        return sum(
+            int(piece.memory_usage(index=False).sum())
+            for piece in self.pieces
+        )
+
+    def _build_frame(self):
+        if len(self.pieces) == 1:
+            return reset_default_index(self.pieces[0])
+        return pd.concat(self.pieces, axis=0, ignore_index=True)
+
+    def __repr__(self):
+        return '{}(npieces={:d}, nrows={:d})'.format(
+            type(self).__name__, len(self.pieces), len(self)
+        )
@@ -0,0 +1,217 @@
+"""Per-node execution statistics for the pandas backend.
+
+Usage
+-----
+>>> import ibis
+>>> t = ibis.pandas.from_dataframe(df)  # doctest: +SKIP
+>>> with ibis.pandas.profile() as profile:  # doctest: +SKIP
+...     result = t.mutate(value=t.value * 2).execute()
+>>> profile.to_frame()  # doctest: +SKIP
+
+Every call to a ``pre_execute``, ``execute_node`` or ``post_execute`` rule
+made on the thread of an active profile is recorded, except for the
+default no-op ``pre_execute`` and ``post_execute`` rules. Times are
+inclusive: the time of a rule that executes sub-expressions, such as a
+projection computing its columns, includes the time of the nodes it
+executes.
+"""
+
+from __future__ import absolute_import
+
+import contextlib
+import threading
+
+from collections import OrderedDict
+from timeit import default_timer
+
+import pandas as pd
+
+from ibis.pandas.dispatch import (
+    pre_execute_default, post_execute_default
+)
+from ibis.pandas.frame import LazyFrame
+
+
+# The profiles that are currently recording on each thread, innermost last
+_local = threading.local()
+
+
+def _active_profiles():
+    try:
+        return _local.profiles
+    except AttributeError:
+        profiles = _local.profiles = []
+        return profiles
+
+
+@contextlib.contextmanager
+def profile():
+    """Record the execution statistics of the pandas backend in a
+    :class:`Profile` for the duration of a ``with`` block. Only expressions
+    executed on the thread that entered the block are recorded.
+
+    Yields
+    ------
+    profile : Profile
+    """
+    result = Profile()
+    active_profiles = _active_profiles()
+    active_profiles.append(result)
+    try:
+        yield result
+    finally:
+        active_profiles.remove(result)
+
+
+class Profile(object):
+    """Execution statistics of every node executed while recording."""
+
+    columns = (
+        'stage', 'op', 'rule', 'signature', 'time', 'input_rows',
+        'output_rows', 'output_bytes', 'node',
+    )
+
+    def __init__(self):
+        self.records = []
+
+    def __len__(self):
+        return len(self.records)
+
+    def to_frame(self):
+        """Return the statistics as a DataFrame with one row per rule call.
+
+        Returns
+        -------
+        statistics : pd.DataFrame
+            With columns
+
+            * ``stage``: one of ``'pre_execute'``, ``'execute_node'`` or
+              ``'post_execute'``
+            * ``op``: the name of the operation type
+            * ``rule``: the name of the function the operation dispatched to
+            * ``signature``: the type names the rule was dispatched on
+            * ``time``: the wall time of the call in seconds
+            * ``input_rows``: the total number of rows of the DataFrame and
+              Series arguments
+            * ``output_rows``: the number of rows of the result, if it is a
+              DataFrame or Series
+            * ``output_bytes``: the memory used by the values of the result,
+              if it is a DataFrame or Series
+            * ``node``: the :class:`~ibis.expr.operations.Node` itself
+        """
+        return pd.DataFrame.from_records(self.records, columns=self.columns)
+
+    def summary(self):
+        """Return the total time and calls of each node.
+
+        Returns
+        -------
+        summary : pd.DataFrame
+            Indexed by node, ordered by decreasing time
+        """
+        frame = self.to_frame()
+        frame['calls'] = 1
+        grouped = frame.groupby(
+            frame.node.map(id).rename('node_id'), sort=False
+        )
+        summary = grouped.agg(OrderedDict([
+            ('node', 'first'),
+            ('op', 'first'),
+            ('calls', 'sum'),
+            ('time', 'sum'),
+            ('output_rows', 'last'),
+            ('output_bytes', 'last'),
+        ]))
+        return summary.set_index('node').sort_values('time', ascending=False)
+
+    def to_graph(self, expr, **kwargs):
+        """Draw `expr` with the time and output rows of each of its nodes.
+
+        Parameters
+        ----------
+        expr : ibis.expr.types.Expr
+        kwargs : dict
+            Passed to :func:`ibis.expr.visualize.to_graph`
+
+        Returns
+        -------
+        graph : graphviz.Digraph
+        """
+        import ibis.expr.visualize as viz
+
+        annotations = {}
+        for node, row in self.summary().iterrows():
+            annotation = '{:.3f} ms in {:d} call(s)'.format(
+                row.time * 1e3, row.calls
+            )
+            if pd.notnull(row.output_rows):
+                annotation += ', {:d} rows'.format(int(row.output_rows))
+            annotations[node] = annotation
+        return viz.to_graph(expr, annotations=annotations, **kwargs)
+
+
+def call_rule(stage, dispatcher, function, op, *args, **kwargs):
+    """Call ``function(op, *args, **kwargs)`` and record its statistics in
+    every profile active on the current thread, if any.
+
+    Parameters
+    ----------
+    stage : str
+    dispatcher : multipledispatch.Dispatcher
+        The dispatcher that `function` calls, used to find the rule
+    function : callable
+    op : ibis.expr.operations.Node
+    args : tuple
+        The computed arguments dispatched on
+
+    Returns
+    -------
+    result : object
+        The result of the call
+    """
+    active_profiles = _active_profiles()
+    if not active_profiles:
+        return function(op, *args, **kwargs)
+
+    types = (type(op),) + tuple(map(type, args))
+    rule = dispatcher.dispatch(*types)
+    if rule is pre_execute_default or rule is post_execute_default:
+        return function(op, *args, **kwargs)
+
+    start = default_timer()
+    result = function(op, *args, **kwargs)
+    elapsed = default_timer() - start
+
+    input_rows = [_nrows(arg) for arg in args]
+    entry = (
+        stage,
+        type(op).__name__,
+        getattr(rule, '__name__', None),
+        ', '.join(typ.__name__ for typ in types),
+        elapsed,
+        sum(rows for rows in input_rows if rows is not None),
+        _nrows(result),
+        _nbytes(result),
+        op,
+    )
+    for active_profile in active_profiles:
+        active_profile.records.append(entry)
+    return result
+
+
+def _nrows(data):
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return len(data.index)
+    if isinstance(data, LazyFrame):
+        return len(data)
+    return None
+
+
+def _nbytes(data):
+    if isinstance(data, pd.Series):
+        return int(data.memory_usage(index=False))
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(index=False).sum())
+    if isinstance(data, LazyFrame):
+        return data.nbytes
+    return None
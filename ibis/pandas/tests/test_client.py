@@ -7,7 +7,9 @@ import ibis
 
 pytest.importorskip('multipledispatch')
 
-from ibis.pandas.client import PandasTable  # noqa: E402
+from ibis.pandas.client import (  # noqa: E402
+    PandasTable, encode_low_cardinality_strings
+)
 
 pytestmark = pytest.mark.pandas
 
@@ -53,3 +55,61 @@ def test_drop(table):
     result = expr.execute()
     expected = table[['b', 'c']].execute()
     tm.assert_frame_equal(result, expected)
+
+
+def test_encode_low_cardinality_strings():
+    df = pd.DataFrame({
+        'low': list('abab'),
+        'high': list('abcd'),
+        'ints': [1, 2, 3, 4],
+    })
+    result = encode_low_cardinality_strings(df, threshold=0.5)
+    assert pd.api.types.is_categorical_dtype(result.low)
+    assert list(result.low.cat.categories) == ['a', 'b']
+    assert result.high.dtype == object
+    assert result.ints.dtype == df.ints.dtype
+    tm.assert_series_equal(result.low.astype(object), df.low)
+
+
+def test_encode_low_cardinality_strings_disabled():
+    df = pd.DataFrame({'low': list('abab')})
+    assert encode_low_cardinality_strings(df) is df
+
+
+def test_load_table_caches_encoded_frame(client):
+    assert client.load_table('df') is client.dictionary['df']
+
+    with ibis.config.option_context('pandas.categorical_threshold', 1.0):
+        encoded = client.load_table('df')
+        assert pd.api.types.is_categorical_dtype(encoded.b)
+        assert client.load_table('df') is encoded
+
+        client.dictionary['df'] = client.dictionary['df'].copy()
+        assert client.load_table('df') is not encoded
+
+
+def test_execute_async(table):
+    expr = table.a.sum()
+    future = expr.execute_async()
+    assert future.result(timeout=10) == 6
+    assert future.done()
+
+
+def test_query_pipeline(table):
+    exprs = [table.a.sum(), table.b.count(), table[table.a > 1]]
+    with ibis.client.QueryPipeline(max_workers=2) as pipeline:
+        total, count, df = pipeline.execute(exprs)
+
+    assert total == 6
+    assert count == 3
+    tm.assert_frame_equal(
+        df, pd.DataFrame({'a': [2, 3], 'b': list('bc')})
+    )
+
+
+def test_query_pipeline_error(table):
+    exprs = [table.a.sum(), table.b.cast('double').sum()]
+    with ibis.client.QueryPipeline() as pipeline:
+        with pytest.raises(ValueError):
+            pipeline.execute(exprs)
+        assert pipeline.futures[0].result() == 6
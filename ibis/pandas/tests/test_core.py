@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 import pandas as pd
@@ -10,8 +12,11 @@ import ibis.expr.operations as ops
 pytest.importorskip('multipledispatch')
 
 from ibis.pandas.dispatch import (
-    execute_node, pre_execute, post_execute)  # noqa: E402
+    execute_node, pre_execute, post_execute,
+    CacheInfo, ExecutionDispatcher)  # noqa: E402
 from ibis.pandas.client import PandasClient  # noqa: E402
+from ibis.pandas.core import accepts_lazy_frames  # noqa: E402
+from ibis.pandas.frame import LazyFrame  # noqa: E402
 from multipledispatch.conflict import ambiguities  # noqa: E402
 
 pytestmark = pytest.mark.pandas
@@ -124,3 +129,118 @@ def test_post_execute_called_on_joins(dataframe, core_client, ibis_table):
     assert result is not None
     assert not result.empty
     assert count[0] == 1
+
+
+def test_profile(dataframe, ibis_table):
+    t = ibis_table
+    expr = t[t.plain_int64 > 1].mutate(double=t.plain_int64 * 2)
+    with ibis.pandas.profile() as profile:
+        result = expr.execute()
+    expected = dataframe[dataframe.plain_int64 > 1].assign(
+        double=dataframe.plain_int64 * 2
+    ).reset_index(drop=True)
+    tm.assert_frame_equal(result, expected)
+
+    stats = profile.to_frame()
+    assert list(stats.columns) == list(profile.columns)
+    assert set(stats.stage) == {'pre_execute', 'execute_node'}
+    assert (stats.time >= 0).all()
+
+    selection = stats.loc[
+        (stats.stage == 'execute_node') &
+        stats.node.map(lambda node: node is expr.op())
+    ]
+    assert len(selection) == 1
+    row = selection.iloc[0]
+    assert row.op == 'Selection'
+    assert row.rule == 'execute_selection_dataframe'
+    assert row.signature == 'Selection, DataFrame'
+    assert row.input_rows == len(dataframe)
+    assert row.output_rows == len(expected)
+    assert row.output_bytes > 0
+
+    summary = profile.summary()
+    assert expr.op() in summary.index
+    assert summary.time.is_monotonic_decreasing
+
+    # nothing is recorded outside of the block
+    expr.execute()
+    assert len(profile) == len(stats)
+
+
+def test_profile_records_current_thread(ibis_table):
+    t = ibis_table
+    expr = t[t.plain_int64 > 1]
+
+    with ibis.pandas.profile() as expected:
+        expr.execute()
+
+    with ibis.pandas.profile() as outer:
+        with ibis.pandas.profile() as inner:
+            thread = threading.Thread(target=expr.execute)
+            thread.start()
+            thread.join()
+        expr.execute()
+
+    # rules run on other threads are not recorded
+    assert not len(inner)
+    assert len(outer) == len(expected)
+
+
+def test_accepts_lazy_frames_reregistered_rule():
+    dispatcher = ExecutionDispatcher('dispatcher')
+
+    @dispatcher.register(ops.Node, LazyFrame)
+    def dispatch_lazy_frame(op, data):
+        pass
+
+    @dispatcher.register(ops.Node, pd.DataFrame)
+    def dispatch_frame(op, data):
+        pass
+
+    types = ops.Node, LazyFrame
+    assert not accepts_lazy_frames(dispatcher, types)
+
+    # replacing a rule keeps the number of rules the same
+    dispatcher.register(ops.Node, LazyFrame)(dispatch_frame)
+    assert accepts_lazy_frames(dispatcher, types)
+
+
+def test_execution_dispatcher_cache():
+    dispatcher = ExecutionDispatcher('dispatcher')
+
+    @dispatcher.register(object)
+    def dispatch_object(value):
+        return 'object'
+
+    assert dispatcher(1) == 'object'
+    assert dispatcher('a') == 'object'
+    assert dispatcher(2) == 'object'
+    assert dispatcher.cache_info() == CacheInfo(
+        hits=1, misses=2, currsize=2
+    )
+
+    # only the resolutions that the new rules change are forgotten
+    @dispatcher.register(int)
+    def dispatch_int(value):
+        return 'int'
+
+    assert dispatcher.cache_info().currsize == 1
+
+    @dispatcher.register(bool)
+    def dispatch_bool(value):
+        return 'bool'
+
+    assert dispatcher(1) == 'int'
+    assert dispatcher(True) == 'bool'
+    assert dispatcher('a') == 'object'
+    assert dispatcher(1.0) == 'object'
+    assert dispatcher.cache_info() == CacheInfo(
+        hits=2, misses=5, currsize=4
+    )
+
+    dispatcher.cache_clear()
+    assert dispatcher.cache_info() == CacheInfo(
+        hits=0, misses=0, currsize=0
+    )
+    assert dispatcher(True) == 'bool'
@@ -122,3 +122,52 @@ def test_call_multiple_udfs():
     result = expr.execute()
     expected = df.a.add(1.0).mul(2.0)
     tm.assert_series_equal(expected, result)
+
+
+def test_udf_computed_on_filtered_rows():
+    lengths = []
+
+    with pause_ordering():
+
+        @udf([dt.double], dt.double)
+        def record_length(x):
+            lengths.append(len(x))
+            return x + 1.0
+
+    df = pd.DataFrame({'a': [1.0, 2.0, 3.0, 4.0], 'b': list('abab')})
+    con = ibis.pandas.connect({'df': df})
+    t = con.table('df')
+    expr = t[t.b == 'a'].mutate(c=record_length(t.a))
+
+    result = expr.execute()
+    expected = df[df.b == 'a'].assign(c=lambda df: df.a + 1.0)
+    tm.assert_frame_equal(result, expected.reset_index(drop=True))
+    assert lengths == [2]
+
+
+def test_udf_in_case_computed_on_selected_rows():
+    lengths = []
+
+    with pause_ordering():
+
+        @udf([dt.double], dt.double)
+        def record_length_plus_one(x):
+            lengths.append(len(x))
+            return x + 1.0
+
+    df = pd.DataFrame({'a': [1.0, 2.0, 3.0, 4.0, 5.0]})
+    con = ibis.pandas.connect({'df': df})
+    t = con.table('df')
+    expr = ibis.case().when(
+        t.a > 4.0, record_length_plus_one(t.a)
+    ).when(
+        t.a > 10.0, record_length_plus_one(t.a * 2.0)
+    ).else_(t.a).end()
+
+    result = t.mutate(c=expr).execute().c
+    expected = df.a.where(df.a <= 4.0, df.a + 1.0).rename('c')
+    tm.assert_series_equal(result, expected)
+
+    # the first result is only computed on the row that selects it, and the
+    # second result is never computed
+    assert lengths == [1]
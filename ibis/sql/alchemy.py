@@ -930,7 +930,9 @@ class AlchemyClient(SQLClient):
     @property
     def async_query(self):
         raise NotImplementedError(
-            'async_query not implemented in {}'.format(type(self).__name__)
+            'async_query not implemented in {}, use execute_async'.format(
+                type(self).__name__
+            )
         )
 
     @property
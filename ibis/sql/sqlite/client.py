@@ -3,14 +3,20 @@ import regex as re
 import math
 import inspect
 
+from collections import OrderedDict
+
 import sqlalchemy as sa
 
 from ibis.client import Database
 from ibis.compat import maketrans, functools
+from ibis.config import options
 from ibis.sql.sqlite.compiler import SQLiteDialect
 
 import ibis.sql.alchemy as alch
 import ibis.common as com
+import ibis.expr.types as ir
+import ibis.expr.lineage as lin
+import ibis.expr.operations as ops
 
 
 class SQLiteTable(alch.AlchemyTable):
@@ -65,6 +71,22 @@ def _ibis_sqlite_translate(string, from_string, to_string):
     return None
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_regex(pattern):
+    """Compile `pattern`, caching the most recently used patterns: the regex
+    UDFs are called once per row, mostly with the same pattern.
+
+    Parameters
+    ----------
+    pattern : str
+
+    Returns
+    -------
+    compiled : regex.Pattern
+    """
+    return re.compile(pattern)
+
+
 @udf
 def _ibis_sqlite_regex_search(string, regex):
     """Return whether `regex` exists in `string`.
@@ -80,7 +102,7 @@ def _ibis_sqlite_regex_search(string, regex):
     """
     if string is None or regex is None:
         return None
-    return re.search(regex, string) is not None
+    return _compile_regex(regex).search(string) is not None
 
 
 @udf
@@ -99,7 +121,7 @@ def _ibis_sqlite_regex_replace(string, pattern, replacement):
     """
     if string is None or pattern is None or replacement is None:
         return None
-    return re.sub(pattern, replacement, string)
+    return _compile_regex(pattern).sub(replacement, string)
 
 
 @udf
@@ -119,7 +141,7 @@ def _ibis_sqlite_regex_extract(string, pattern, index):
     if string is None or pattern is None or index is None:
         return None
 
-    result = re.search(pattern, string)
+    result = _compile_regex(pattern).search(string)
     if result is not None and 0 <= index <= (result.lastindex or -1):
         return result.group(index)
     return None
@@ -305,10 +327,10 @@ def _register_function(func, con):
     Parameters
     ----------
     func : callable
-    con : sqlalchemy.Connection
+    con : sqlite3.Connection
     """
     nargs = number_of_arguments(func)
-    con.connection.connection.create_function(func.__name__, nargs, func)
+    con.create_function(func.__name__, nargs, func)
 
 
 def _register_aggregate(agg, con):
@@ -317,10 +339,108 @@ def _register_aggregate(agg, con):
     Parameters
     ----------
     agg : type
-    con : sqlalchemy.Connection
+    con : sqlite3.Connection
     """
     nargs = number_of_arguments(agg.step) - 1  # because self
-    con.connection.connection.create_aggregate(agg.__name__, nargs, agg)
+    con.create_aggregate(agg.__name__, nargs, agg)
+
+
+# The operations that SQLite computes by calling a Python UDF for every row
+_PYTHON_UDF_OPS = (
+    ops.RegexSearch, ops.RegexReplace, ops.RegexExtract, ops.Reverse,
+    ops.StringAscii, ops.Capitalize, ops.Translate, ops.Sqrt, ops.Power,
+    ops.Exp, ops.Ln, ops.Log, ops.Log10, ops.Log2, ops.Floor, ops.Ceil,
+    ops.Sign, ops.FloorDivide, ops.Modulus,
+)
+
+
+def _python_udf_table(expr):
+    """Return the SQLite table of `expr` if `expr` only selects, filters
+    and computes values over that table, calling at least one Python UDF,
+    otherwise None.
+
+    Parameters
+    ----------
+    expr : ibis.expr.types.Expr
+
+    Returns
+    -------
+    table : Optional[SQLiteTable]
+    """
+    nodes = list(lin.traverse(lambda expr: (lin.proceed, expr.op()), expr))
+    tables = [node for node in nodes if isinstance(node, ops.TableNode)]
+    sqlite_tables = [node for node in tables if isinstance(node, SQLiteTable)]
+    if (len(sqlite_tables) != 1 or
+            not all(isinstance(node, (SQLiteTable, ops.Selection))
+                    for node in tables) or
+            not any(isinstance(node, _PYTHON_UDF_OPS) for node in nodes)):
+        return None
+    return sqlite_tables[0]
+
+
+def _pushdown_predicates(expr, table):
+    """Return the predicates filtering the rows of `table` in `expr` that
+    SQLite can evaluate without calling a Python UDF, while reading the
+    table.
+
+    Predicates are only pushed down if `table` is used by a single selection
+    whose values don't depend on the other rows of the table, such as
+    reductions or window functions do.
+
+    Parameters
+    ----------
+    expr : ibis.expr.types.Expr
+    table : SQLiteTable
+
+    Returns
+    -------
+    predicates : List[ibis.expr.types.BooleanValue]
+    """
+    nodes = list(lin.traverse(lambda expr: (lin.proceed, expr.op()), expr))
+    selections = [
+        node for node in nodes
+        if isinstance(node, ops.Selection) and node.table.op().equals(table)
+    ]
+    if len(selections) != 1:
+        return []
+    selection, = selections
+
+    def outside_selection(expr):
+        op = expr.op()
+        return lin.halt if op is selection else lin.proceed, op
+
+    if any(
+        isinstance(node, ops.TableColumn) and node.table.op().equals(table)
+        for node in lin.traverse(outside_selection, expr)
+    ):
+        return []
+
+    arguments = selection.selections + selection.predicates
+    if any(
+        isinstance(node, (ops.Reduction, ops.AnalyticOp, ops.WindowOp,
+                          ops.TableNode))
+        for node in lin.traverse(
+            lambda expr: (lin.proceed, expr.op()), arguments
+        ) if node is not table
+    ):
+        return []
+
+    return [
+        predicate for predicate in selection.predicates
+        if not any(
+            isinstance(node, _PYTHON_UDF_OPS)
+            for node in lin.traverse(
+                lambda expr: (lin.proceed, expr.op()), predicate
+            )
+        )
+    ]
+
+
+def _selects_tables(node):
+    return isinstance(node, ops.Selection) and (
+        not node.selections or
+        any(isinstance(sel, ir.TableExpr) for sel in node.selections)
+    )
 
 
 class SQLiteClient(alch.AlchemyClient):
@@ -338,14 +458,102 @@ class SQLiteClient(alch.AlchemyClient):
         self.name = path
         self.database_name = 'default'
 
+        # The engine's pool opens one connection to the in-memory database per
+        # thread, so the UDFs are registered, and the attached databases
+        # attached, in every new connection
+        self._attached = OrderedDict()
+        sa.event.listen(self.con, 'connect', self._setup_connection)
+
+        # the connection of this thread was opened by the inspector before
+        # the listener was registered
+        self.con.run_callable(
+            lambda con: self._setup_connection(con.connection.connection)
+        )
+
         if path is not None:
             self.attach(self.database_name, path, create=create)
 
+    def _setup_connection(self, dbapi_connection, connection_record=None):
         for func in _SQLITE_UDF_REGISTRY:
-            self.con.run_callable(functools.partial(_register_function, func))
+            _register_function(func, dbapi_connection)
 
         for agg in _SQLITE_UDAF_REGISTRY:
-            self.con.run_callable(functools.partial(_register_aggregate, agg))
+            _register_aggregate(agg, dbapi_connection)
+
+        for name, path in self._attached.items():
+            dbapi_connection.execute(self._attach_statement(name, path))
+
+    def execute(self, expr, params=None, limit='default', **kwargs):
+        """
+        Compile and execute an Ibis expression, see
+        :meth:`ibis.client.SQLClient.execute`.
+
+        If ``ibis.options.sqlite.pandas_udfs`` is set, expressions selecting,
+        filtering and computing values over a single table that call
+        functions SQLite computes with a Python UDF per row, such as regex
+        searches, are evaluated in bulk by the pandas backend over the
+        columns they use instead. Filters that need no Python UDF are still
+        applied by SQLite while reading the table.
+        """
+        table = self._pandas_udf_table(expr)
+        if table is not None:
+            try:
+                return self._execute_pandas(
+                    expr, table, params=params, limit=limit
+                )
+            except NotImplementedError:
+                # the pandas backend has no rule for some of the arguments,
+                # such as a regex search with a column of patterns
+                pass
+        return super(SQLiteClient, self).execute(
+            expr, params=params, limit=limit, **kwargs
+        )
+
+    def execute_async(self, expr, params=None, limit='default', **kwargs):
+        if self._pandas_udf_table(expr) is not None:
+            return self._submit(
+                self.execute, expr, params=params, limit=limit, **kwargs
+            )
+        return super(SQLiteClient, self).execute_async(
+            expr, params=params, limit=limit, **kwargs
+        )
+
+    def _pandas_udf_table(self, expr):
+        if not options.sqlite.pandas_udfs:
+            return None
+        return _python_udf_table(expr)
+
+    def _execute_pandas(self, expr, table, params=None, limit='default'):
+        from ibis.pandas.api import execute as execute_pandas
+
+        # filter the rows in SQLite where no Python UDF is needed
+        table_expr = table.to_expr()
+        predicates = _pushdown_predicates(expr, table)
+        if predicates:
+            table_expr = table_expr.filter(predicates)
+
+        # read only the columns the expression uses, unless it selects whole
+        # tables or uses columns of its projections
+        nodes = list(
+            lin.traverse(lambda expr: (lin.proceed, expr.op()), expr)
+        )
+        references = [
+            node for node in nodes if isinstance(node, ops.TableColumn)
+        ]
+        if (all(node.table.op().equals(table) for node in references) and
+                not any(_selects_tables(node) for node in nodes)):
+            names = {node.name for node in references}
+            table_expr = table_expr[
+                [name for name in table.schema.names if name in names]
+            ]
+        data = super(SQLiteClient, self).execute(table_expr, limit=None)
+        result = execute_pandas(expr, params=params, scope={table: data})
+
+        if limit == 'default':
+            limit = options.sql.default_limit
+        if limit is not None and not isinstance(expr, ir.ScalarExpr):
+            result = result.head(limit)
+        return result
 
     @property
     def current_database(self):
@@ -375,11 +583,13 @@ class SQLiteClient(alch.AlchemyClient):
         if not os.path.exists(path) and not create:
             raise com.IbisError('File {!r} does not exist'.format(path))
 
-        self.raw_sql(
-            "ATTACH DATABASE {path!r} AS {name}".format(
-                path=path,
-                name=self.con.dialect.identifier_preparer.quote(name),
-            )
+        self.raw_sql(self._attach_statement(name, path))
+        self._attached[name] = path
+
+    def _attach_statement(self, name, path):
+        return "ATTACH DATABASE {path!r} AS {name}".format(
+            path=path,
+            name=self.con.dialect.identifier_preparer.quote(name),
         )
 
     @property
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os
+import sqlite3
 import uuid
 
 import pytest
@@ -119,3 +120,109 @@ def test_create_and_drop_table(con):
     tm.assert_frame_equal(new_table.execute(), t.limit(5).execute())
     con.drop_table(name)
     assert name not in con.list_tables()
+
+
+@pytest.fixture
+def async_dbpath(tmpdir):
+    path = str(tmpdir.join('async.db'))
+    con = sqlite3.connect(path)
+    con.execute('CREATE TABLE t (key TEXT, value INTEGER)')
+    con.executemany(
+        'INSERT INTO t VALUES (?, ?)',
+        [('a', 1), ('b', 2), ('a', 3)]
+    )
+    con.commit()
+    con.close()
+    return path
+
+
+def test_execute_async(async_dbpath):
+    client = ibis.sqlite.connect(async_dbpath)
+    t = client.table('t')
+
+    # UDFs are registered in the connection of the executor's thread too
+    expr = t.key.re_search('a').sum()
+    future = expr.execute_async()
+    assert future.result(timeout=10) == 2
+
+
+def test_query_pipeline(async_dbpath):
+    client = ibis.sqlite.connect(async_dbpath)
+    t = client.table('t')
+    exprs = [
+        t.value.sum(),
+        t.group_by('key').aggregate(total=t.value.sum()).sort_by('key'),
+    ]
+    with ibis.client.QueryPipeline(max_workers=2) as pipeline:
+        total, by_key = pipeline.execute(exprs)
+
+    assert total == 6
+    assert by_key.total.tolist() == [4, 2]
+
+
+def test_regex_udfs_compile_once():
+    from ibis.sql.sqlite.client import (
+        _compile_regex, _ibis_sqlite_regex_search, _ibis_sqlite_regex_replace
+    )
+    pattern = 'a+b{}'.format(guid())
+    misses = _compile_regex.cache_info().misses
+
+    assert not _ibis_sqlite_regex_search('aab', pattern)
+    assert _ibis_sqlite_regex_replace('aab', pattern, 'c') == 'aab'
+    assert _compile_regex.cache_info().misses == misses + 1
+
+
+def test_python_udf_table(async_dbpath):
+    from ibis.sql.sqlite.client import _python_udf_table
+
+    client = ibis.sqlite.connect(async_dbpath)
+    t = client.table('t')
+    filtered = t[t.key.re_search('a')]
+
+    assert _python_udf_table(filtered) is t.op()
+    assert _python_udf_table(filtered.value.sum()) is t.op()
+    assert _python_udf_table(t[t.value > 1]) is None
+    assert _python_udf_table(
+        filtered.group_by('key').aggregate(total=filtered.value.sum())
+    ) is None
+
+
+def test_pandas_udfs(async_dbpath):
+    client = ibis.sqlite.connect(async_dbpath)
+    t = client.table('t')
+    expr = t[t.key.re_search('a')].mutate(
+        reversed_key=t.key.reverse(), root=t.value.sqrt()
+    )
+    expected = expr.execute()
+
+    with ibis.config.option_context('sqlite.pandas_udfs', True):
+        result = expr.execute()
+        total = t[t.key.re_search('a')].value.sum().execute()
+
+    tm.assert_frame_equal(result, expected)
+    assert total == 4
+
+
+def test_pushdown_predicates(async_dbpath):
+    from ibis.sql.sqlite.client import _pushdown_predicates
+
+    client = ibis.sqlite.connect(async_dbpath)
+    t = client.table('t')
+    row_wise = t.value > 1
+    filtered = t.filter([row_wise, t.key.re_search('a')])
+
+    (predicate,) = _pushdown_predicates(filtered, t.op())
+    assert predicate.equals(row_wise)
+    assert _pushdown_predicates(filtered.value.sum(), t.op()) == [predicate]
+    assert not _pushdown_predicates(
+        filtered.mutate(total=t.value.sum()), t.op()
+    )
+    not_row_wise = t.value < t.value.mean()
+    assert not _pushdown_predicates(
+        t.filter([row_wise, t.key.re_search('a'), not_row_wise]), t.op()
+    )
+
+    expected = filtered.execute()
+    with ibis.config.option_context('sqlite.pandas_udfs', True):
+        result = filtered.execute()
+    tm.assert_frame_equal(result, expected)
@@ -0,0 +1,60 @@
+import threading
+import time
+
+from concurrent.futures import CancelledError
+
+import pandas as pd
+import pytest
+
+import ibis
+
+
+@pytest.fixture
+def client():
+    df = pd.DataFrame({'key': list('aba'), 'value': [1, 2, 3]})
+    return ibis.pandas.connect({'t': df})
+
+
+def test_await_execute_async(client):
+    asyncio = pytest.importorskip('asyncio')
+
+    t = client.table('t')
+    loop = asyncio.new_event_loop()
+    try:
+        total, count = loop.run_until_complete(
+            asyncio.gather(
+                client.execute_async(t.value.sum()),
+                t.count().aexecute(),
+                loop=loop,
+            )
+        )
+    finally:
+        loop.close()
+
+    assert total == 6
+    assert count == 3
+
+
+def test_current_future(client):
+    assert ibis.client.current_future() is None
+
+    future = client._submit(ibis.client.current_future)
+    assert future.result(timeout=10) is future
+
+
+def test_cancel_running_future(client):
+    started = threading.Event()
+
+    def wait_for_cancel():
+        # what backends supporting cancellation do while polling a query
+        future = ibis.client.current_future()
+        started.set()
+        while not future.cancel_requested():
+            time.sleep(0.01)
+        raise CancelledError('Query cancelled')
+
+    future = client._submit(wait_for_cancel)
+    assert started.wait(timeout=10)
+    assert not future.cancel()
+    with pytest.raises(CancelledError):
+        future.result(timeout=10)
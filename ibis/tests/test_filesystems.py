@@ -18,12 +18,14 @@ from posixpath import join as pjoin
 from os import path as osp
 import os
 import shutil
+import tarfile
+import tempfile
 
 from six import BytesIO
 
 import pytest
 
-from ibis.filesystems import HDFS
+from ibis.filesystems import HDFS, HDFSError, TransferProgress, WebHDFS
 from ibis.impala.tests.common import IbisTestEnv
 import ibis.compat as compat
 import ibis.util as util
@@ -73,6 +75,199 @@ class TestHDFSRandom(unittest.TestCase):
         assert result == '0.parq'
 
 
+class FakeWebHDFSClient(object):
+
+    """In-memory stand-in for the HdfsCLI client used by WebHDFS. Writes and
+    downloads of the paths in `failures` raise that many times first.
+    """
+
+    def __init__(self, failures=None):
+        self.files = {}
+        self.failures = dict(failures or {})
+        self.n_threads = []
+
+    def _maybe_fail(self, path):
+        if self.failures.get(path, 0) > 0:
+            self.failures[path] -= 1
+            raise IOError('Connection reset writing {0}'.format(path))
+
+    def resolve(self, path):
+        return path
+
+    def makedirs(self, path):
+        pass
+
+    def status(self, path, strict=True):
+        if path in self.files:
+            return {'type': 'FILE'}
+        return None
+
+    def list(self, path, status=False):
+        prefix = path.rstrip('/') + '/'
+        return [name[len(prefix):] for name in self.files
+                if name.startswith(prefix)]
+
+    def write(self, hdfs_path, data=None, overwrite=False):
+        if hdfs_path in self.files and not overwrite:
+            raise IOError('Remote path {0!r} exists'.format(hdfs_path))
+        if hasattr(data, 'read'):
+            data = data.read()
+        elif not isinstance(data, bytes):
+            data = b''.join(data)
+        self.files[hdfs_path] = data
+        self._maybe_fail(hdfs_path)
+
+    def upload(self, hdfs_path, local_path, overwrite=False, n_threads=1,
+               progress=None):
+        self.n_threads.append(n_threads)
+        with open(local_path, 'rb') as f:
+            data = f.read()
+        if progress is not None:
+            progress(local_path, len(data))
+            progress(local_path, -1)
+        try:
+            self.write(hdfs_path, data, overwrite=overwrite)
+        except IOError:
+            # HdfsCLI deletes what a failed upload wrote
+            self.files.pop(hdfs_path, None)
+            raise
+        return hdfs_path
+
+    def download(self, hdfs_path, local_path, overwrite=False, n_threads=1,
+                 progress=None):
+        self.n_threads.append(n_threads)
+        data = self.files[hdfs_path]
+        if progress is not None:
+            # A failed attempt has reported a partial transfer
+            progress(hdfs_path, len(data) // 2)
+        self._maybe_fail(hdfs_path)
+        if progress is not None:
+            progress(hdfs_path, len(data))
+            progress(hdfs_path, -1)
+        with open(local_path, 'wb') as f:
+            f.write(data)
+        return local_path
+
+
+class TestWebHDFSTransfers(unittest.TestCase):
+
+    def setUp(self):
+        self.local_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.local_dir)
+
+    def test_put_parts(self):
+        data = b''.join(
+            'line {0:d}\n'.format(i).encode('utf8') for i in range(100)
+        )
+        client = FakeWebHDFSClient({'/parts/part-00003': 1})
+        hdfs = WebHDFS(client)
+        progress = TransferProgress()
+
+        paths = hdfs.put_parts('/parts', BytesIO(data), part_size=64,
+                               n_threads=3, progress=progress)
+
+        assert paths == sorted(client.files)
+        assert len(paths) > 3
+        assert all(client.files[path].endswith(b'\n') for path in paths)
+        assert b''.join(client.files[path] for path in paths) == data
+        assert progress.nbytes == len(data)
+
+    def test_put_parts_without_delimiter(self):
+        client = FakeWebHDFSClient()
+        hdfs = WebHDFS(client)
+        paths = hdfs.put_parts('/parts', BytesIO(b'abcdefg'), part_size=3,
+                               delimiter=None)
+        assert [client.files[path] for path in paths] == [
+            b'abc', b'def', b'g'
+        ]
+
+    def test_put_parts_existing_part(self):
+        client = FakeWebHDFSClient()
+        client.files['/parts/part-00000'] = b'old'
+        hdfs = WebHDFS(client)
+
+        with pytest.raises(HDFSError):
+            hdfs.put_parts('/parts', BytesIO(b'new\n'))
+        assert client.files['/parts/part-00000'] == b'old'
+
+        hdfs.put_parts('/parts', BytesIO(b'new\n'), overwrite=True)
+        assert client.files['/parts/part-00000'] == b'new\n'
+
+    def test_put_buffer_retries(self):
+        client = FakeWebHDFSClient({'/data': 2})
+        hdfs = WebHDFS(client)
+        buf = BytesIO(b'peekaboo')
+
+        assert hdfs.put('/data', buf, retries=2) == '/data'
+        assert client.files['/data'] == b'peekaboo'
+
+    def test_put_buffer_no_retries_by_default(self):
+        client = FakeWebHDFSClient({'/data': 1})
+        client.status = None  # no existence check either
+        hdfs = WebHDFS(client)
+
+        with pytest.raises(IOError):
+            hdfs.put('/data', BytesIO(b'peekaboo'))
+        assert client.failures['/data'] == 0
+
+    def test_put_buffer_retries_exhausted(self):
+        client = FakeWebHDFSClient({'/data': 2})
+        hdfs = WebHDFS(client)
+
+        with pytest.raises(IOError):
+            hdfs.put('/data', BytesIO(b'peekaboo'), retries=1)
+
+    def test_put_local_file_threads(self):
+        local_path = osp.join(self.local_dir, 'data')
+        with open(local_path, 'wb') as f:
+            f.write(b'peekaboo')
+
+        client = FakeWebHDFSClient({'/data': 1})
+        hdfs = WebHDFS(client)
+        hdfs.put('/data', local_path, n_threads=8)
+        assert client.files['/data'] == b'peekaboo'
+        assert client.n_threads == [8, 8]
+
+    def test_get_retries_with_progress(self):
+        client = FakeWebHDFSClient({'/data': 1})
+        client.files['/data'] = b'peekaboo'
+        hdfs = WebHDFS(client)
+
+        chunks = []
+        progress = TransferProgress(
+            callback=lambda path, nbytes: chunks.append(nbytes)
+        )
+        local_path = osp.join(self.local_dir, 'data')
+        hdfs.get('/data', local_path, progress=progress)
+
+        with open(local_path, 'rb') as f:
+            assert f.read() == b'peekaboo'
+        # the failed attempt reported half of the file
+        assert chunks == [4, 4, 4]
+        assert progress.nbytes == 12
+
+    def test_put_tarfile(self):
+        names = ['a', 'b', 'c', 'd', 'e']
+        for name in names:
+            with open(osp.join(self.local_dir, name), 'wb') as f:
+                f.write(name.encode('utf8') * 3)
+
+        tar_path = osp.join(self.local_dir, 'archive.tar.gz')
+        with tarfile.open(tar_path, 'w:gz') as tf:
+            for name in names:
+                tf.add(osp.join(self.local_dir, name), arcname=name)
+
+        client = FakeWebHDFSClient()
+        hdfs = WebHDFS(client)
+        hdfs.put_tarfile('/archive', tar_path, n_threads=2)
+        assert client.files == {
+            pjoin('/archive', name): name.encode('utf8') * 3
+            for name in names
+        }
+
+
 @pytest.mark.hdfs
 class TestHDFSE2E(unittest.TestCase):
 
@@ -7,6 +7,7 @@ import types
 
 import six
 
+import numpy as np
 import toolz
 
 import ibis.compat as compat
@@ -267,3 +268,71 @@ def convert_unit(value, unit, to):
 
     assert i > j
     return value // factor
+
+
+def numpy_dtype(ibis_type):
+    """Return the NumPy dtype of the arrays holding the values of a column of
+    type `ibis_type`. Types whose pandas dtype is not a NumPy dtype, such as
+    timestamps with a time zone, are held as timezone naive datetime64 or
+    object arrays.
+
+    Parameters
+    ----------
+    ibis_type : ibis.expr.datatypes.DataType
+
+    Returns
+    -------
+    dtype : numpy.dtype
+
+    Examples
+    --------
+    >>> import ibis.expr.datatypes as dt
+    >>> numpy_dtype(dt.int32)
+    dtype('int32')
+    >>> numpy_dtype(dt.Timestamp(timezone='UTC'))
+    dtype('<M8[ns]')
+    >>> numpy_dtype(dt.Array(dt.int8))
+    dtype('O')
+    """
+    import ibis.expr.datatypes as dt
+
+    dtype = ibis_type.to_pandas()
+    if isinstance(dtype, np.dtype):
+        return dtype
+    if isinstance(ibis_type, dt.Timestamp):
+        return np.dtype('datetime64[ns]')
+    return np.dtype(object)
+
+
+def values_to_array(values, dtype, nullable=True):
+    """Convert the sequence `values` to an array of dtype `dtype`. If
+    `nullable`, nulls are held as NaN in integer arrays and as None in boolean
+    arrays. Values that cannot be converted to `dtype` are kept as objects.
+
+    Parameters
+    ----------
+    values : Sequence
+    dtype : numpy.dtype
+    nullable : bool
+
+    Returns
+    -------
+    array : numpy.ndarray
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> values_to_array((1, 2), np.dtype('int64'))
+    array([1, 2])
+    >>> values_to_array((1, None), np.dtype('int64'))
+    array([ 1., nan])
+    >>> values_to_array((True, None), np.dtype('bool'))
+    array([True, None], dtype=object)
+    """
+    if nullable and dtype.kind in 'biu' and None in values:
+        dtype = np.dtype(np.float64 if dtype.kind != 'b' else object)
+    try:
+        return np.array(values, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        # e.g. UInt64 values beyond the range of the requested integer type
+        return np.array(values, dtype=object)
@@ -24,7 +24,7 @@ postgres_requires = sqlite_requires + ['psycopg2']
 mysql_requires = sqlite_requires + ['pymysql']
 kerberos_requires = ['requests-kerberos']
 visualization_requires = ['graphviz']
-clickhouse_requires = ['clickhouse-driver>=0.0.8']
+clickhouse_requires = ['clickhouse-driver>=0.0.14']
 bigquery_requires = ['google-cloud-bigquery>=1.0.0']
 hdf5_requires = ['tables>=3.0.0']
 parquet_requires = ['pyarrow>=0.6.0']